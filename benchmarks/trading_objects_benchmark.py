@@ -0,0 +1,77 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Measures the memory size and the construction time of orders, trades and positions.
+Run from the repository root: python benchmarks/trading_objects_benchmark.py
+Results depend on whether octobot_trading is compiled, run it on two revisions to compare them.
+"""
+import gc
+import timeit
+import tracemalloc
+
+from octobot_trading.data.position import Position
+from octobot_trading.data.trade import Trade
+from octobot_trading.orders.types.buy_limit_order import BuyLimitOrder
+
+OBJECTS_COUNT = 20000
+CONSTRUCTION_RUNS = 5
+
+
+class BenchmarkTrader:
+    """
+    Provides the trader attributes used by orders, trades and positions constructors
+    """
+    exchange_manager = None
+    simulate = True
+
+    @staticmethod
+    def parse_order_id(order_id):
+        return order_id
+
+
+def get_object_size(object_class, trader):
+    """
+    :return: the average allocated bytes of an object_class instance
+    """
+    gc.collect()
+    tracemalloc.start()
+    start_size = tracemalloc.get_traced_memory()[0]
+    objects = [object_class(trader) for _ in range(OBJECTS_COUNT)]
+    size = tracemalloc.get_traced_memory()[0] - start_size
+    tracemalloc.stop()
+    # remove the size of the list itself
+    return (size - objects.__sizeof__()) / OBJECTS_COUNT
+
+
+def get_construction_time(object_class, trader):
+    """
+    :return: the best average construction time of an object_class instance in seconds
+    """
+    return min(timeit.repeat(lambda: object_class(trader), number=OBJECTS_COUNT, repeat=CONSTRUCTION_RUNS)) \
+        / OBJECTS_COUNT
+
+
+def main():
+    trader = BenchmarkTrader()
+    print(f"{OBJECTS_COUNT} objects, best of {CONSTRUCTION_RUNS} construction runs")
+    for object_class in (BuyLimitOrder, Trade, Position):
+        print(f"{object_class.__name__:<15}"
+              f"{get_object_size(object_class, trader):>8.0f} B"
+              f"{get_construction_time(object_class, trader) * 1e6:>8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
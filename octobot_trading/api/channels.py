@@ -0,0 +1,42 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+from octobot_trading.channels.consumer_queue import ConsumerQueue
+from octobot_trading.channels.exchange_channel import get_exchange_channels
+
+
+def get_consumers_queues_metrics(exchange_manager) -> dict:
+    """
+    :return: channel name -> the queue metrics of each of its consumers
+    """
+    return {
+        channel_name: [get_consumer_queue_metrics(consumer) for consumer in channel.get_consumers()]
+        for channel_name, channel in get_exchange_channels(exchange_manager.id).items()
+    }
+
+
+def get_consumer_queue_metrics(consumer) -> dict:
+    if isinstance(consumer.queue, ConsumerQueue):
+        return consumer.queue.get_metrics()
+    return {
+        "size": consumer.queue.qsize(),
+        "max_size": consumer.queue.maxsize
+    }
+
+
+def get_dropped_messages_count(exchange_manager) -> int:
+    return sum(metrics.get("dropped_messages_count", 0)
+               for channel_metrics in get_consumers_queues_metrics(exchange_manager).values()
+               for metrics in channel_metrics)
@@ -16,8 +16,9 @@
 
 
 def get_portfolio(exchange_manager) -> dict:
-    return exchange_manager.exchange_personal_data.portfolio_manager.portfolio.portfolio
+    return exchange_manager.exchange_personal_data.portfolio_manager.portfolio.portfolio.to_dict()
 
 
 def get_origin_portfolio(exchange_manager) -> dict:
-    return exchange_manager.exchange_personal_data.portfolio_manager.portfolio_profitability.origin_portfolio.portfolio
+    return exchange_manager.exchange_personal_data.portfolio_manager.portfolio_profitability.origin_portfolio \
+        .portfolio.to_dict()
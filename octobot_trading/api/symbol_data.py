@@ -13,6 +13,8 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import numpy as np
+
 from octobot_trading.data_manager.candles_manager import CandlesManager
 from octobot_trading.exchanges.data.exchange_symbol_data import ExchangeSymbolData
 from octobot_trading.data_adapters.candles_adapter import \
@@ -33,44 +35,44 @@ def get_symbol_candles_manager(symbol_data, time_frame) -> CandlesManager:
     return symbol_data.symbol_candles[TimeFrames(time_frame)]
 
 
-def get_symbol_historical_candles(symbol_data, time_frame, limit=-1) -> dict:
-    return get_symbol_candles_manager(symbol_data, time_frame).get_symbol_prices(limit)
+def get_symbol_historical_candles(symbol_data, time_frame, limit=-1, copy=False) -> dict:
+    return get_symbol_candles_manager(symbol_data, time_frame).get_symbol_prices(limit, copy)
 
 
 def has_symbol_klines(symbol_data, time_frame) -> bool:
     return TimeFrames(time_frame) in symbol_data.symbol_klines
 
 
-def get_symbol_klines(symbol_data, time_frame) -> list:
+def get_symbol_klines(symbol_data, time_frame) -> np.ndarray:
     return symbol_data.symbol_klines[TimeFrames(time_frame)].kline
 
 
-def get_symbol_close_candles(symbol_data, time_frame, limit=-1, include_in_construction=False):
-    return adapter_get_symbol_close_candles(symbol_data, time_frame, limit, include_in_construction)
+def get_symbol_close_candles(symbol_data, time_frame, limit=-1, include_in_construction=False, copy=False):
+    return adapter_get_symbol_close_candles(symbol_data, time_frame, limit, include_in_construction, copy)
 
 
-def get_symbol_open_candles(symbol_data, time_frame, limit=-1, include_in_construction=False):
-    return adapter_get_symbol_open_candles(symbol_data, time_frame, limit, include_in_construction)
+def get_symbol_open_candles(symbol_data, time_frame, limit=-1, include_in_construction=False, copy=False):
+    return adapter_get_symbol_open_candles(symbol_data, time_frame, limit, include_in_construction, copy)
 
 
-def get_symbol_high_candles(symbol_data, time_frame, limit=-1, include_in_construction=False):
-    return adapter_get_symbol_high_candles(symbol_data, time_frame, limit, include_in_construction)
+def get_symbol_high_candles(symbol_data, time_frame, limit=-1, include_in_construction=False, copy=False):
+    return adapter_get_symbol_high_candles(symbol_data, time_frame, limit, include_in_construction, copy)
 
 
-def get_symbol_low_candles(symbol_data, time_frame, limit=-1, include_in_construction=False):
-    return adapter_get_symbol_low_candles(symbol_data, time_frame, limit, include_in_construction)
+def get_symbol_low_candles(symbol_data, time_frame, limit=-1, include_in_construction=False, copy=False):
+    return adapter_get_symbol_low_candles(symbol_data, time_frame, limit, include_in_construction, copy)
 
 
-def get_symbol_volume_candles(symbol_data, time_frame, limit=-1, include_in_construction=False):
-    return adapter_get_symbol_volume_candles(symbol_data, time_frame, limit, include_in_construction)
+def get_symbol_volume_candles(symbol_data, time_frame, limit=-1, include_in_construction=False, copy=False):
+    return adapter_get_symbol_volume_candles(symbol_data, time_frame, limit, include_in_construction, copy)
 
 
-def get_symbol_time_candles(symbol_data, time_frame, limit=-1, include_in_construction=False):
-    return adapter_get_symbol_time_candles(symbol_data, time_frame, limit, include_in_construction)
+def get_symbol_time_candles(symbol_data, time_frame, limit=-1, include_in_construction=False, copy=False):
+    return adapter_get_symbol_time_candles(symbol_data, time_frame, limit, include_in_construction, copy)
 
 
-def create_new_candles_manager(candles=None) -> CandlesManager:
-    manager = CandlesManager()
+def create_new_candles_manager(candles=None, max_candles_count=None) -> CandlesManager:
+    manager = CandlesManager(max_candles_count=max_candles_count)
     if candles is not None:
         manager.replace_all_candles(candles)
     return manager
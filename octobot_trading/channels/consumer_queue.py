@@ -0,0 +1,88 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+from asyncio import Queue
+from collections import OrderedDict, deque
+
+from octobot_trading.enums import ConsumerQueuePolicies
+
+
+class ConsumerQueue(Queue):
+    """
+    Consumer queue which policy is applied when it is full:
+    - BLOCK: put waits for a free slot (asyncio.Queue behavior)
+    - DROP_OLDEST: the oldest pending message is dropped
+    - DROP_NEWEST: the new message is dropped
+    - CONFLATE: only the latest pending message of each symbol and time frame is kept, a newer message replaces the
+    pending one in place. When full, the oldest pending message is dropped.
+    A maxsize of 0 means an unbounded queue.
+    Dropped messages and the maximum number of pending messages are counted.
+    """
+    SYMBOL_KEY = "symbol"
+    TIME_FRAME_KEY = "time_frame"
+
+    def __init__(self, maxsize=0, policy=ConsumerQueuePolicies.BLOCK):
+        self.policy = policy
+        self.dropped_messages_count = 0
+        self.high_water_mark = 0
+        super().__init__(maxsize)
+
+    def full(self):
+        # only BLOCK policy makes put wait, other policies drop messages instead
+        return self.policy is ConsumerQueuePolicies.BLOCK and super().full()
+
+    def get_metrics(self):
+        return {
+            "policy": self.policy.value,
+            "size": self.qsize(),
+            "max_size": self.maxsize,
+            "dropped_messages_count": self.dropped_messages_count,
+            "high_water_mark": self.high_water_mark
+        }
+
+    def _init(self, maxsize):
+        self._queue = OrderedDict() if self.policy is ConsumerQueuePolicies.CONFLATE else deque()
+
+    def _put(self, item):
+        if self.policy is ConsumerQueuePolicies.CONFLATE:
+            conflation_key = (item.get(self.SYMBOL_KEY), item.get(self.TIME_FRAME_KEY))
+            if conflation_key in self._queue:
+                self._drop_message()
+                self._queue[conflation_key] = item
+                return
+        if 0 < self._maxsize <= len(self._queue):
+            self._drop_message()
+            if self.policy is ConsumerQueuePolicies.DROP_NEWEST:
+                return
+            self._get()
+        if self.policy is ConsumerQueuePolicies.CONFLATE:
+            self._queue[conflation_key] = item
+        else:
+            self._queue.append(item)
+        if len(self._queue) > self.high_water_mark:
+            self.high_water_mark = len(self._queue)
+
+    def _get(self):
+        if self.policy is ConsumerQueuePolicies.CONFLATE:
+            return self._queue.popitem(last=False)[1]
+        return self._queue.popleft()
+
+    def _drop_message(self):
+        self.dropped_messages_count += 1
+        # the dropped message will never be consumed: do not count the put message as an additional task.
+        # asyncio.Queue.put_nowait increments _unfinished_tasks right after calling _put, this decrement
+        # compensates it. A drop only happens when messages are pending: _unfinished_tasks is then at least 1
+        # and join() keeps waiting for the pending messages only.
+        self._unfinished_tasks -= 1
@@ -25,7 +25,13 @@ cdef class ExchangeChannel(Channel):
     cdef int filter_send_counter
     cdef bint should_send_filter
 
+    cdef dict _consumers_routing_table
+
     cpdef object get_filtered_consumers(self, str cryptocurrency=*, str symbol=*)
+    cpdef void add_new_consumer(self, object consumer, dict consumer_filters)
+    cpdef void flush(self)
+
+    cdef list _add_consumers_route(self, tuple route_key, dict consumer_filters)
 
 cdef class TimeFrameExchangeChannel(ExchangeChannel):
     cpdef object get_filtered_consumers(self, str cryptocurrency=*, str symbol=*, str time_frame=*)
@@ -24,6 +24,9 @@ from octobot_channels.channels.channel import Channel
 from octobot_channels.constants import CHANNEL_WILDCARD
 from octobot_channels.channels.channel_instances import ChannelInstances
 
+from octobot_trading.channels.consumer_queue import ConsumerQueue
+from octobot_trading.enums import ConsumerQueuePolicies
+
 
 class ExchangeChannelConsumer(Consumer):
     pass
@@ -62,6 +65,9 @@ class ExchangeChannel(Channel):
     CRYPTOCURRENCY_KEY = "cryptocurrency"
     SYMBOL_KEY = "symbol"
 
+    # policy applied when a consumer queue is full, CONFLATE keeps the latest message of each symbol and time frame
+    CONSUMERS_QUEUE_POLICY = ConsumerQueuePolicies.BLOCK
+
     def __init__(self, exchange_manager):
         super().__init__()
         self.logger = get_logger(f"{self.__class__.__name__}[{exchange_manager.exchange_name}]")
@@ -71,14 +77,24 @@ class ExchangeChannel(Channel):
         self.filter_send_counter = 0
         self.should_send_filter = False
 
+        # filters values tuple -> filtered consumers, cleared when consumers are added or removed
+        self._consumers_routing_table = {}
+
     async def new_consumer(self,
                            callback: object = None,
                            consumer_instance: object = None,
                            size=0,
                            symbol=CHANNEL_WILDCARD,
                            cryptocurrency=CHANNEL_WILDCARD,
+                           queue_policy=None,
                            **kwargs):
+        """
+        :param size: the consumer queue max size, 0 for an unbounded queue
+        :param queue_policy: the ConsumerQueuePolicies applied when the consumer queue is full,
+        defaults to CONSUMERS_QUEUE_POLICY
+        """
         consumer = consumer_instance if consumer_instance else self.CONSUMER_CLASS(callback, size=size)
+        consumer.queue = ConsumerQueue(consumer.queue.maxsize, queue_policy or self.CONSUMERS_QUEUE_POLICY)
         await self._add_new_consumer_and_run(consumer,
                                              cryptocurrency=cryptocurrency,
                                              symbol=symbol,
@@ -99,10 +115,36 @@ class ExchangeChannel(Channel):
     def get_filtered_consumers(self,
                                cryptocurrency=CHANNEL_WILDCARD,
                                symbol=CHANNEL_WILDCARD):
-        return self.get_consumer_from_filters({
-            self.CRYPTOCURRENCY_KEY: cryptocurrency,
-            self.SYMBOL_KEY: symbol
-        })
+        try:
+            return self._consumers_routing_table[(cryptocurrency, symbol)]
+        except KeyError:
+            return self._add_consumers_route((cryptocurrency, symbol), {
+                self.CRYPTOCURRENCY_KEY: cryptocurrency,
+                self.SYMBOL_KEY: symbol
+            })
+
+    def _add_consumers_route(self, route_key, consumer_filters):
+        """
+        Filters consumers once per filters values (including wildcards) until consumers are added or removed
+        :return: the filtered consumers that should not be modified
+        """
+        consumers = self.get_consumer_from_filters(consumer_filters)
+        self._consumers_routing_table[route_key] = consumers
+        return consumers
+
+    def add_new_consumer(self, consumer, consumer_filters) -> None:
+        super().add_new_consumer(consumer, consumer_filters)
+        self._consumers_routing_table.clear()
+
+    async def remove_consumer(self, consumer) -> None:
+        # cleared before removal: routes are then built from the remaining consumers when checking producers state
+        self._consumers_routing_table.clear()
+        await super().remove_consumer(consumer)
+        self._consumers_routing_table.clear()
+
+    def flush(self) -> None:
+        super().flush()
+        self._consumers_routing_table.clear()
 
     async def _add_new_consumer_and_run(self, consumer,
                                         cryptocurrency=CHANNEL_WILDCARD,
@@ -128,11 +170,14 @@ class TimeFrameExchangeChannel(ExchangeChannel):
                                cryptocurrency=CHANNEL_WILDCARD,
                                symbol=CHANNEL_WILDCARD,
                                time_frame=CHANNEL_WILDCARD):
-        return self.get_consumer_from_filters({
-            self.CRYPTOCURRENCY_KEY: cryptocurrency,
-            self.SYMBOL_KEY: symbol,
-            self.TIME_FRAME_KEY: time_frame
-        })
+        try:
+            return self._consumers_routing_table[(cryptocurrency, symbol, time_frame)]
+        except KeyError:
+            return self._add_consumers_route((cryptocurrency, symbol, time_frame), {
+                self.CRYPTOCURRENCY_KEY: cryptocurrency,
+                self.SYMBOL_KEY: symbol,
+                self.TIME_FRAME_KEY: time_frame
+            })
 
     async def _add_new_consumer_and_run(self, consumer,
                                         cryptocurrency=CHANNEL_WILDCARD,
@@ -16,6 +16,7 @@
 from octobot_channels.channels.channel import CHANNEL_WILDCARD
 from octobot_commons.constants import INIT_EVAL_NOTE
 
+from octobot_trading.channels.consumer_queue import ConsumerQueue
 from octobot_trading.channels.exchange_channel import ExchangeChannel, ExchangeChannelProducer, \
     ExchangeChannelInternalConsumer
 from octobot_trading.enums import EvaluatorStates
@@ -68,7 +69,10 @@ class ModeChannel(ExchangeChannel):
                            state=CHANNEL_WILDCARD,
                            cryptocurrency=CHANNEL_WILDCARD,
                            symbol=CHANNEL_WILDCARD,
-                           time_frame=None):
+                           time_frame=None,
+                           queue_policy=None):
+        consumer_instance.queue = ConsumerQueue(consumer_instance.queue.maxsize,
+                                                queue_policy or self.CONSUMERS_QUEUE_POLICY)
         await self._add_new_consumer_and_run(consumer_instance,
                                              trading_mode_name=trading_mode_name,
                                              state=state,
@@ -82,13 +86,17 @@ class ModeChannel(ExchangeChannel):
                                cryptocurrency=CHANNEL_WILDCARD,
                                symbol=CHANNEL_WILDCARD,
                                time_frame=CHANNEL_WILDCARD):
-        return self.get_consumer_from_filters({
-            self.TRADING_MODE_NAME_KEY: trading_mode_name,
-            self.STATE_KEY: state,
-            self.CRYPTOCURRENCY_KEY: cryptocurrency,
-            self.SYMBOL_KEY: symbol,
-            self.TIME_FRAME_KEY: time_frame
-        })
+        route_key = (trading_mode_name, state, cryptocurrency, symbol, time_frame)
+        try:
+            return self._consumers_routing_table[route_key]
+        except KeyError:
+            return self._add_consumers_route(route_key, {
+                self.TRADING_MODE_NAME_KEY: trading_mode_name,
+                self.STATE_KEY: state,
+                self.CRYPTOCURRENCY_KEY: cryptocurrency,
+                self.SYMBOL_KEY: symbol,
+                self.TIME_FRAME_KEY: time_frame
+            })
 
     async def _add_new_consumer_and_run(self, consumer,
                                         trading_mode_name=CHANNEL_WILDCARD,
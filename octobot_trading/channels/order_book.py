@@ -18,17 +18,26 @@ from asyncio import CancelledError
 from octobot_channels.constants import CHANNEL_WILDCARD
 
 from octobot_trading.channels.exchange_channel import ExchangeChannel, ExchangeChannelProducer, ExchangeChannelConsumer
+from octobot_trading.enums import ConsumerQueuePolicies
 
 
 class OrderBookProducer(ExchangeChannelProducer):
-    async def push(self, symbol, asks, bids):
-        await self.perform(symbol, asks, bids)
+    async def push(self, symbol, asks, bids, update_only=False):
+        await self.perform(symbol, asks, bids, update_only=update_only)
 
-    async def perform(self, symbol, asks, bids):
+    async def perform(self, symbol, asks, bids, update_only=False):
+        """
+        :param update_only: when True, asks and bids are price level updates (a 0 quantity removes the level),
+        consumers are then given the updated order book
+        """
         try:
             if self.channel.get_filtered_consumers(symbol=CHANNEL_WILDCARD) or self.channel.get_filtered_consumers(
                     symbol=symbol):  # and symbol_data.order_book_is_initialized()
-                self.channel.exchange_manager.get_symbol_data(symbol).handle_order_book_update(asks, bids)
+                if update_only:
+                    asks, bids = self.channel.exchange_manager.get_symbol_data(symbol) \
+                        .handle_order_book_delta_update(asks, bids)
+                else:
+                    self.channel.exchange_manager.get_symbol_data(symbol).handle_order_book_update(asks, bids)
                 await self.send(cryptocurrency=self.channel.exchange_manager.exchange.
                                 get_pair_cryptocurrency(symbol),
                                 symbol=symbol,
@@ -54,6 +63,7 @@ class OrderBookProducer(ExchangeChannelProducer):
 class OrderBookChannel(ExchangeChannel):
     PRODUCER_CLASS = OrderBookProducer
     CONSUMER_CLASS = ExchangeChannelConsumer
+    CONSUMERS_QUEUE_POLICY = ConsumerQueuePolicies.CONFLATE
 
 
 class OrderBookTickerProducer(ExchangeChannelProducer):
@@ -95,3 +105,4 @@ class OrderBookTickerProducer(ExchangeChannelProducer):
 class OrderBookTickerChannel(ExchangeChannel):
     PRODUCER_CLASS = OrderBookTickerProducer
     CONSUMER_CLASS = ExchangeChannelConsumer
+    CONSUMERS_QUEUE_POLICY = ConsumerQueuePolicies.CONFLATE
@@ -14,6 +14,7 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 from asyncio import CancelledError
+from types import MappingProxyType
 
 from octobot_channels.constants import CHANNEL_WILDCARD
 from octobot_channels.producer import Producer
@@ -62,17 +63,19 @@ class OrdersProducer(ExchangeChannelProducer):
             self.logger.exception(e, True, f"Exception when triggering update: {e}")
 
     async def send(self, cryptocurrency, symbol, order, is_from_bot=True, is_closed=False, is_updated=False):
+        # one read-only snapshot is shared by every consumer
+        order_update = {
+            "exchange": self.channel.exchange_manager.exchange_name,
+            "exchange_id": self.channel.exchange_manager.id,
+            "cryptocurrency": cryptocurrency,
+            "symbol": symbol,
+            "order": MappingProxyType(order),
+            "is_closed": is_closed,
+            "is_updated": is_updated,
+            "is_from_bot": is_from_bot
+        }
         for consumer in self.channel.get_filtered_consumers(symbol=symbol):
-            await consumer.queue.put({
-                "exchange": self.channel.exchange_manager.exchange_name,
-                "exchange_id": self.channel.exchange_manager.id,
-                "cryptocurrency": cryptocurrency,
-                "symbol": symbol,
-                "order": order,
-                "is_closed": is_closed,
-                "is_updated": is_updated,
-                "is_from_bot": is_from_bot
-            })
+            await consumer.queue.put(order_update)
 
 
 class OrdersChannel(ExchangeChannel):
@@ -18,6 +18,7 @@ from asyncio import CancelledError
 from octobot_channels.constants import CHANNEL_WILDCARD
 
 from octobot_trading.channels.exchange_channel import ExchangeChannel, ExchangeChannelProducer, ExchangeChannelConsumer
+from octobot_trading.enums import ConsumerQueuePolicies
 
 
 class MarkPriceProducer(ExchangeChannelProducer):
@@ -54,3 +55,4 @@ class MarkPriceProducer(ExchangeChannelProducer):
 class MarkPriceChannel(ExchangeChannel):
     PRODUCER_CLASS = MarkPriceProducer
     CONSUMER_CLASS = ExchangeChannelConsumer
+    CONSUMERS_QUEUE_POLICY = ConsumerQueuePolicies.CONFLATE
@@ -18,6 +18,7 @@ from asyncio import CancelledError
 from octobot_channels.constants import CHANNEL_WILDCARD
 
 from octobot_trading.channels.exchange_channel import ExchangeChannel, ExchangeChannelProducer, ExchangeChannelConsumer
+from octobot_trading.enums import ConsumerQueuePolicies
 
 
 class TickerProducer(ExchangeChannelProducer):
@@ -53,6 +54,7 @@ class TickerProducer(ExchangeChannelProducer):
 class TickerChannel(ExchangeChannel):
     PRODUCER_CLASS = TickerProducer
     CONSUMER_CLASS = ExchangeChannelConsumer
+    CONSUMERS_QUEUE_POLICY = ConsumerQueuePolicies.CONFLATE
 
 
 class MiniTickerProducer(ExchangeChannelProducer):
@@ -88,3 +90,4 @@ class MiniTickerProducer(ExchangeChannelProducer):
 class MiniTickerChannel(ExchangeChannel):
     PRODUCER_CLASS = MiniTickerProducer
     CONSUMER_CLASS = ExchangeChannelConsumer
+    CONSUMERS_QUEUE_POLICY = ConsumerQueuePolicies.CONFLATE
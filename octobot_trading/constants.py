@@ -57,6 +57,10 @@ CONFIG_EXCHANGE_PASSWORD = "api-password"
 CONFIG_EXCHANGE_SANDBOXED = "sandboxed"
 CONFIG_EXCHANGE_ENCRYPTED_VALUES = [CONFIG_EXCHANGE_KEY, CONFIG_EXCHANGE_SECRET, CONFIG_EXCHANGE_PASSWORD]
 
+CONFIG_CANDLES_HISTORY_SIZE = "candles-history-size"
+CONFIG_CANDLES_MEMORY_BUDGET = "candles-memory-budget"  # in megabytes
+BYTES_PER_MEGABYTE = 1024 * 1024
+
 TESTED_EXCHANGES = ["binance", "coinbasepro", "kucoin2"]
 SIMULATOR_TESTED_EXCHANGES = ["bitfinex", "bittrex", "coinbasepro", "kraken", "kucoin2", "poloniex", "cryptopia",
                               "bitmex"]
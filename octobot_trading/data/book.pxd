@@ -16,9 +16,11 @@
 #  License along with this library.
 
 cdef class Book:
-    cdef public timestamp
+    cdef public double timestamp
 
-    cdef public object orders
+    cdef public dict orders
+
+    cdef dict _side_indexes
 
     cpdef void reset(self)
     cpdef void handle_book_update(self, list orders, str id_key=*)
@@ -26,4 +28,14 @@ cdef class Book:
     cpdef void handle_book_delta_update(self, list orders, str id_key=*)
     cpdef void handle_book_delta_insert(self, list orders, str id_key=*)
     cpdef list get_asks(self, str side=*)
-    cpdef list get_bids(self, str side=*)
\ No newline at end of file
+    cpdef list get_bids(self, str side=*)
+
+    cdef void _insert_order(self, object order_id, dict order)
+    cdef void _remove_order(self, object order_id)
+
+    @staticmethod
+    cdef bint _is_index_update(dict order_update, dict order)
+    @staticmethod
+    cdef str _get_side(dict order)
+    @staticmethod
+    cdef tuple _get_index_key(object order_id, dict order)
@@ -13,42 +13,94 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
-import pandas as pd
+from bisect import bisect_left, insort
 from time import time
 
-from octobot_trading.enums import TradeOrderSide
+from octobot_trading.enums import TradeOrderSide, ExchangeConstantsOrderColumns
 
 
 class Book:
+    """
+    Orders (level 3) order book: orders are stored by id and indexed by side in (price, id) sorted lists.
+    Deltas are applied order by order using binary searches on the side index.
+    """
     def __init__(self):
-        self.orders = pd.DataFrame()
+        self.orders = {}
         self.timestamp = 0
+        self._side_indexes = {}
 
     def reset(self):
-        self.orders = pd.DataFrame()
+        self.orders = {}
         self.timestamp = 0
+        self._side_indexes = {}
 
     def handle_book_update(self, orders, id_key="id"):
-        self.orders = pd.json_normalize(orders).set_index(id_key).sort_index(ascending=False)
+        self.reset()
+        for order in orders:
+            self._insert_order(order[id_key], order)
         self.timestamp = time()
 
     def handle_book_delta_delete(self, orders, id_key="id"):
-        ids = [order[id_key] for order in orders]
-        self.orders.drop(index=ids, errors='ignore')
+        for order in orders:
+            self._remove_order(order[id_key])
+        self.timestamp = time()
 
     def handle_book_delta_update(self, orders, id_key="id"):
-        update_list = pd.json_normalize(orders).set_index(id_key)
-        self.orders.update(update_list)
-        self.orders = self.orders.sort_index(ascending=False)
+        """
+        Updates the given values of already known orders
+        """
+        for order in orders:
+            try:
+                book_order = self.orders[order[id_key]]
+            except KeyError:
+                continue
+            if Book._is_index_update(order, book_order):
+                self._remove_order(order[id_key])
+                book_order.update(order)
+                self._insert_order(order[id_key], book_order)
+            else:
+                book_order.update(order)
         self.timestamp = time()
 
     def handle_book_delta_insert(self, orders, id_key="id"):
-        insert_list = pd.json_normalize(orders).set_index(id_key)
-        self.orders.update(insert_list)
-        self.orders = self.orders.sort_index(ascending=False)
+        for order in orders:
+            self._remove_order(order[id_key])
+            self._insert_order(order[id_key], order)
+        self.timestamp = time()
 
     def get_asks(self, side=TradeOrderSide.SELL.value):
-        return self.orders.query(f"side.str.contains('{side}')", engine='python').values.tolist()
+        """
+        :return: the given side orders sorted by ascending price
+        """
+        return [self.orders[order_id] for _, order_id in self._side_indexes.get(side.lower(), [])]
 
     def get_bids(self, side=TradeOrderSide.BUY.value):
-        return self.orders.query(f"side.str.contains('{side}')", engine='python').values.tolist()
+        """
+        :return: the given side orders sorted by descending price
+        """
+        return [self.orders[order_id] for _, order_id in reversed(self._side_indexes.get(side.lower(), []))]
+
+    def _insert_order(self, order_id, order):
+        self.orders[order_id] = order
+        insort(self._side_indexes.setdefault(Book._get_side(order), []), Book._get_index_key(order_id, order))
+
+    def _remove_order(self, order_id):
+        order = self.orders.pop(order_id, None)
+        if order is not None:
+            side_index = self._side_indexes[Book._get_side(order)]
+            del side_index[bisect_left(side_index, Book._get_index_key(order_id, order))]
+
+    @staticmethod
+    def _is_index_update(order_update, order):
+        for key in (ExchangeConstantsOrderColumns.PRICE.value, ExchangeConstantsOrderColumns.SIDE.value):
+            if key in order_update and order_update[key] != order.get(key):
+                return True
+        return False
+
+    @staticmethod
+    def _get_side(order):
+        return order.get(ExchangeConstantsOrderColumns.SIDE.value, "").lower()
+
+    @staticmethod
+    def _get_index_key(order_id, order):
+        return order.get(ExchangeConstantsOrderColumns.PRICE.value, 0), order_id
@@ -0,0 +1,32 @@
+# cython: language_level=3
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+
+cdef class CurrencyConversionGraph:
+    cdef public str reference_market
+    cdef public dict prices
+
+    cdef dict _conversion_paths
+    cdef dict _rates
+    cdef dict _currencies_by_symbol
+
+    cpdef tuple get_conversion_path(self, str currency)
+    cpdef double get_rate(self, str currency) except? -1
+    cpdef list get_missing_symbols(self, str currency)
+    cpdef list update_rates(self, str symbol)
+
+    cdef double _compute_rate(self, tuple conversion_path) except? -1
+    cdef void _init_conversion_paths(self, object symbols)
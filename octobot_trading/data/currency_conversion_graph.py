@@ -0,0 +1,116 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+from octobot_commons.symbol_util import split_symbol
+
+
+class CurrencyConversionGraph:
+    """
+    Maps each currency of the exchange markets to its cheapest conversion path to the reference market:
+    a direct pair or a two-hop path through one of the INTERMEDIATE_CURRENCIES.
+    Paths are computed once from the exchange symbols, conversion rates are cached and updated when a price
+    used in their path changes.
+    """
+    INTERMEDIATE_CURRENCIES = ("BTC", "USDT")
+
+    def __init__(self, reference_market, symbols, prices):
+        self.reference_market = reference_market
+        # symbol -> last price, shared with the prices owner
+        self.prices = prices
+
+        # currency -> tuple of (symbol, is_inverted_symbol) conversion steps
+        self._conversion_paths = {}
+        # cached conversion rates and symbol -> currencies which rate depends on this symbol price
+        self._rates = {}
+        self._currencies_by_symbol = {}
+
+        self._init_conversion_paths(symbols)
+
+    def get_conversion_path(self, currency):
+        """
+        :return: the conversion steps of currency to the reference market, None when there is no conversion path
+        """
+        return self._conversion_paths.get(currency)
+
+    def get_rate(self, currency):
+        """
+        :return: the value of 1 currency in the reference market
+        raises KeyError when there is no conversion path or when a price of the path is missing
+        """
+        try:
+            return self._rates[currency]
+        except KeyError:
+            conversion_path = self._conversion_paths[currency]
+            rate = self._compute_rate(conversion_path)
+            self._rates[currency] = rate
+            for symbol, _ in conversion_path:
+                self._currencies_by_symbol.setdefault(symbol, set()).add(currency)
+            return rate
+
+    def get_missing_symbols(self, currency):
+        """
+        :return: the symbols of the conversion path of currency which price is missing
+        """
+        return [symbol
+                for symbol, _ in self._conversion_paths.get(currency, ())
+                if symbol not in self.prices]
+
+    def update_rates(self, symbol):
+        """
+        Updates the cached rates depending on symbol price
+        :return: the currencies which rate has been updated
+        """
+        updated_currencies = []
+        for currency in self._currencies_by_symbol.get(symbol, ()):
+            try:
+                self._rates[currency] = self._compute_rate(self._conversion_paths[currency])
+                updated_currencies.append(currency)
+            except KeyError:
+                self._rates.pop(currency, None)
+        return updated_currencies
+
+    def _compute_rate(self, conversion_path):
+        rate = 1
+        for symbol, is_inverted_symbol in conversion_path:
+            price = self.prices[symbol]
+            if is_inverted_symbol:
+                if not price:
+                    return 0
+                rate /= price
+            else:
+                rate *= price
+        return rate
+
+    def _init_conversion_paths(self, symbols):
+        # currency -> {other currency: (symbol, is_inverted_symbol)}, direct symbols are preferred over inverted ones
+        conversion_steps = {}
+        for symbol in symbols:
+            currency, market = split_symbol(symbol)
+            conversion_steps.setdefault(currency, {})[market] = (symbol, False)
+            conversion_steps.setdefault(market, {}).setdefault(currency, (symbol, True))
+
+        self._conversion_paths[self.reference_market] = ()
+        for currency, steps in conversion_steps.items():
+            if currency == self.reference_market:
+                continue
+            if self.reference_market in steps:
+                self._conversion_paths[currency] = (steps[self.reference_market],)
+                continue
+            for intermediate_currency in self.INTERMEDIATE_CURRENCIES:
+                if intermediate_currency in steps and \
+                        self.reference_market in conversion_steps.get(intermediate_currency, {}):
+                    self._conversion_paths[currency] = (steps[intermediate_currency],
+                                                        conversion_steps[intermediate_currency][self.reference_market])
+                    break
@@ -0,0 +1,28 @@
+# cython: language_level=3
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+cimport numpy as np
+np.import_array()
+
+cdef class LastPrices:
+    cdef public np.ndarray prices
+    cdef public np.ndarray timestamps
+
+    cdef np.ndarray _min_prices_since
+    cdef np.ndarray _max_prices_since
+
+    cpdef double get_min_price(self, double since=*)
+    cpdef double get_max_price(self, double since=*)
@@ -0,0 +1,55 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+
+from octobot_trading.enums import ExchangeConstantsOrderColumns as ECOC
+
+
+class LastPrices:
+    """
+    Converts a batch of recent trades into prices and timestamps arrays sorted by timestamp.
+    The min and max prices since each timestamp are precomputed: the min or max price since a given time (like an
+    order creation time) is a binary search on timestamps.
+    Trades with a nan price or without timestamp are ignored.
+    """
+
+    def __init__(self, last_prices):
+        prices = np.array([last_price.get(ECOC.PRICE.value, np.nan) for last_price in last_prices],
+                          dtype=np.float64)
+        timestamps = np.array([last_price.get(ECOC.TIMESTAMP.value, np.nan) for last_price in last_prices],
+                              dtype=np.float64)
+        valid_indexes = ~(np.isnan(prices) | np.isnan(timestamps))
+        sorted_indexes = np.argsort(timestamps[valid_indexes], kind="stable")
+        self.prices = prices[valid_indexes][sorted_indexes]
+        self.timestamps = timestamps[valid_indexes][sorted_indexes]
+
+        # min and max of self.prices[i:]
+        self._min_prices_since = np.minimum.accumulate(self.prices[::-1])[::-1]
+        self._max_prices_since = np.maximum.accumulate(self.prices[::-1])[::-1]
+
+    def get_min_price(self, since=-np.inf):
+        """
+        :return: the min price of the trades which timestamp is greater or equal to since, nan if there is none
+        """
+        since_index = np.searchsorted(self.timestamps, since, side="left")
+        return self._min_prices_since[since_index] if since_index < self.timestamps.size else np.nan
+
+    def get_max_price(self, since=-np.inf):
+        """
+        :return: the max price of the trades which timestamp is greater or equal to since, nan if there is none
+        """
+        since_index = np.searchsorted(self.timestamps, since, side="left")
+        return self._max_prices_since[since_index] if since_index < self.timestamps.size else np.nan
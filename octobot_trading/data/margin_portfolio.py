@@ -19,6 +19,8 @@ from octobot_trading.data.portfolio import Portfolio
 
 
 class MarginPortfolio(Portfolio):
+    HOLDING_TYPES = (PORTFOLIO_AVAILABLE, MARGIN_PORTFOLIO, PORTFOLIO_TOTAL)
+
     async def update_portfolio_from_position(self, position):
         pass  # TODO
 
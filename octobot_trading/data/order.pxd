@@ -25,10 +25,10 @@ cdef class Order:
     cdef public object trader
     cdef public object exchange_manager
 
-    cdef public object side # TradeOrderSide
-    cdef public object status # OrderStatus
+    cdef object _side # TradeOrderSide
+    cdef object _status # OrderStatus
     cdef public object order_type # TraderOrderType
-    cdef public object lock # Lock
+    cdef object _lock # Lock, created on first use
 
     cdef public Order linked_to
     cdef public Portfolio linked_portfolio
@@ -36,34 +36,36 @@ cdef class Order:
     cdef public bint is_simulated
     cdef public bint is_from_this_octobot
 
-    cdef public str symbol
+    cdef str _symbol
     cdef public str currency
     cdef public str market
     cdef public str taker_or_maker
-    cdef public str order_id
+    cdef str _order_id
     cdef public bint simulated
 
-    cdef public double origin_price
+    cdef double _origin_price
     cdef public double origin_stop_price
-    cdef public double origin_quantity
+    cdef double _origin_quantity
     cdef public double market_total_fees
-    cdef public double filled_quantity
-    cdef public double filled_price
-    cdef public double total_cost
+    cdef double _filled_quantity
+    cdef double _filled_price
+    cdef double _total_cost
     cdef public double created_last_price
     cdef public double order_profitability
 
-    cdef public double timestamp
+    cdef double _timestamp
     cdef public double creation_time
     cdef public double canceled_time
     cdef public double executed_time
 
-    cdef public dict fee # Dict[str, Union[str, double]]
+    cdef dict _fee # Dict[str, Union[str, double]]
 
     cdef list last_prices
     cdef public list linked_orders
 
-    cdef public object exchange_order_type # raw exchange order type, used to create order dict
+    cdef object _exchange_order_type # raw exchange order type, used to create order dict
+
+    cdef dict _dict_snapshot # cached to_dict result
 
     cpdef bint update(self,
             str symbol,
@@ -86,7 +88,7 @@ cdef class Order:
     cdef void __update_taker_maker_from_raw(self)
 
     cpdef str to_string(self)
-    cpdef bint check_last_prices(self, list last_prices, double price_to_check, bint inferior)
+    cpdef bint check_last_prices(self, object last_prices, double price_to_check, bint inferior)
     cpdef add_linked_order(self, Order order)
     cpdef tuple get_currency_and_market(self)
     cpdef double get_total_fees(self, str currency)
@@ -99,6 +101,7 @@ cdef class Order:
     cpdef bint update_from_raw(self, dict raw_order)
     cpdef void consider_as_filled(self)
     cpdef dict to_dict(self)
+    cdef dict _create_dict(self)
     cpdef void clear(self)
 
 cpdef object parse_order_status(dict raw_order)
@@ -15,12 +15,12 @@
 #  License along with this library.
 import time
 from asyncio import Lock
-import math
 
 from octobot_commons.logging.logging_util import get_logger
 from octobot_trading.enums import TradeOrderSide, OrderStatus, TraderOrderType, \
     FeePropertyColumns, ExchangeConstantsMarketPropertyColumns, \
-    ExchangeConstantsOrderColumns as ECOC, ExchangeConstantsOrderColumns, TradeOrderType
+    ExchangeConstantsOrderColumns, TradeOrderType
+from octobot_trading.data.last_prices import LastPrices
 from octobot_trading.orders.order_util import get_fees_for_currency
 
 
@@ -29,42 +29,167 @@ class Order:
     Order class will represent an open order in the specified exchange
     In simulation it will also define rules to be filled / canceled
     It is also use to store creation & fill values of the order
+    Attributes are stored in slots and the order lock is only created when used
     """
+    __slots__ = ("trader", "exchange_manager", "_status", "creation_time", "executed_time", "_lock", "linked_orders",
+                 "_order_id", "simulated", "_symbol", "currency", "market", "taker_or_maker", "_timestamp",
+                 "_origin_price", "created_last_price", "_origin_quantity", "origin_stop_price", "order_type", "_side",
+                 "_filled_quantity", "linked_portfolio", "linked_to", "canceled_time", "_fee", "_filled_price",
+                 "order_profitability", "_total_cost", "_exchange_order_type", "is_from_this_octobot",
+                 "_dict_snapshot")
 
     def __init__(self, trader):
         self.trader = trader
         self.exchange_manager = trader.exchange_manager
-        self.status = OrderStatus.OPEN
+        self._status = OrderStatus.OPEN
         self.creation_time = time.time()
         self.executed_time = 0
-        self.lock = Lock()
+        self._lock = None
         self.linked_orders = []
 
-        self.order_id = trader.parse_order_id(None)
+        self._order_id = trader.parse_order_id(None)
         self.simulated = trader.simulate
 
-        self.symbol = None
+        self._symbol = None
         self.currency = None
         self.market = None
         self.taker_or_maker = None
-        self.timestamp = 0
-        self.origin_price = 0
+        self._timestamp = 0
+        self._origin_price = 0
         self.created_last_price = 0
-        self.origin_quantity = 0
+        self._origin_quantity = 0
         self.origin_stop_price = 0
         self.order_type = None
-        self.side = None
-        self.filled_quantity = 0
+        self._side = None
+        self._filled_quantity = 0
         self.linked_portfolio = None
         self.linked_to = None
         self.canceled_time = 0
-        self.fee = None
-        self.filled_price = 0
+        self._fee = None
+        self._filled_price = 0
         self.order_profitability = 0
-        self.total_cost = 0
+        self._total_cost = 0
 
         # raw exchange order type, used to create order dict
-        self.exchange_order_type = None
+        self._exchange_order_type = None
+
+        # cached to_dict result, cleared when one of the order dict values is set
+        self._dict_snapshot = None
+
+    @property
+    def lock(self):
+        if self._lock is None:
+            self._lock = Lock()
+        return self._lock
+
+    # order dict values: setting them clears the cached to_dict result
+    @property
+    def order_id(self):
+        return self._order_id
+
+    @order_id.setter
+    def order_id(self, order_id):
+        self._order_id = order_id
+        self._dict_snapshot = None
+
+    @property
+    def symbol(self):
+        return self._symbol
+
+    @symbol.setter
+    def symbol(self, symbol):
+        self._symbol = symbol
+        self._dict_snapshot = None
+
+    @property
+    def status(self):
+        return self._status
+
+    @status.setter
+    def status(self, status):
+        self._status = status
+        self._dict_snapshot = None
+
+    @property
+    def timestamp(self):
+        return self._timestamp
+
+    @timestamp.setter
+    def timestamp(self, timestamp):
+        self._timestamp = timestamp
+        self._dict_snapshot = None
+
+    @property
+    def side(self):
+        return self._side
+
+    @side.setter
+    def side(self, side):
+        self._side = side
+        self._dict_snapshot = None
+
+    @property
+    def exchange_order_type(self):
+        return self._exchange_order_type
+
+    @exchange_order_type.setter
+    def exchange_order_type(self, exchange_order_type):
+        self._exchange_order_type = exchange_order_type
+        self._dict_snapshot = None
+
+    @property
+    def origin_price(self):
+        return self._origin_price
+
+    @origin_price.setter
+    def origin_price(self, origin_price):
+        self._origin_price = origin_price
+        self._dict_snapshot = None
+
+    @property
+    def origin_quantity(self):
+        return self._origin_quantity
+
+    @origin_quantity.setter
+    def origin_quantity(self, origin_quantity):
+        self._origin_quantity = origin_quantity
+        self._dict_snapshot = None
+
+    @property
+    def filled_price(self):
+        return self._filled_price
+
+    @filled_price.setter
+    def filled_price(self, filled_price):
+        self._filled_price = filled_price
+        self._dict_snapshot = None
+
+    @property
+    def filled_quantity(self):
+        return self._filled_quantity
+
+    @filled_quantity.setter
+    def filled_quantity(self, filled_quantity):
+        self._filled_quantity = filled_quantity
+        self._dict_snapshot = None
+
+    @property
+    def total_cost(self):
+        return self._total_cost
+
+    @total_cost.setter
+    def total_cost(self, total_cost):
+        self._total_cost = total_cost
+        self._dict_snapshot = None
+
+    @property
+    def fee(self):
+        return self._fee
+
+    @fee.setter
+    def fee(self, fee):
+        self._fee = fee
+        self._dict_snapshot = None
 
     @classmethod
     def get_name(cls):
@@ -162,26 +287,23 @@ class Order:
 
     # check_last_prices is used to collect data to perform the order update_order_status process
     def check_last_prices(self, last_prices, price_to_check, inferior) -> bool:
-        if last_prices:
-            prices = [p[ECOC.PRICE.value]
-                      for p in last_prices
-                      if not math.isnan(p[ECOC.PRICE.value]) and (
-                              p[ECOC.TIMESTAMP.value] >= self.creation_time)]
-
-            if prices:
-                if inferior:
-                    if float(min(prices)) < price_to_check:
-                        get_logger(self.get_name()).debug(f"{self.symbol} last prices: {prices}, "
-                                                          f"ask for {'inferior' if inferior else 'superior'} "
-                                                          f"to {price_to_check}")
-                        return True
-                else:
-                    if float(max(prices)) > price_to_check:
-                        get_logger(self.get_name()).debug(f"{self.symbol} last prices: {prices}, "
-                                                          f"ask for {'inferior' if inferior else 'superior'} "
-                                                          f"to {price_to_check}")
-                        return True
-        return False
+        """
+        :param last_prices: a LastPrices instance or a list of recent trades
+        :return: True when a price since the order creation is inferior (or superior) to price_to_check
+        """
+        if not isinstance(last_prices, LastPrices):
+            last_prices = LastPrices(last_prices)
+        if inferior:
+            checked_price = last_prices.get_min_price(since=self.creation_time)
+            is_crossed = checked_price < price_to_check
+        else:
+            checked_price = last_prices.get_max_price(since=self.creation_time)
+            is_crossed = checked_price > price_to_check
+        if is_crossed:
+            get_logger(self.get_name()).debug(f"{self.symbol} last prices {'min' if inferior else 'max'}: "
+                                              f"{checked_price}, ask for {'inferior' if inferior else 'superior'} "
+                                              f"to {price_to_check}")
+        return is_crossed
 
     async def cancel_order(self):
         self.status = OrderStatus.CANCELED
@@ -326,6 +448,15 @@ class Order:
             self.taker_or_maker = ExchangeConstantsMarketPropertyColumns.MAKER.value
 
     def to_dict(self):
+        """
+        :return: the order dict representation. It is cached until one of its values is set: the returned dict is
+        shared and should not be modified
+        """
+        if self._dict_snapshot is None:
+            self._dict_snapshot = self._create_dict()
+        return self._dict_snapshot
+
+    def _create_dict(self):
         filled_price = self.filled_price if self.filled_price > 0 else self.origin_price
         return {
             ExchangeConstantsOrderColumns.ID.value: self.order_id,
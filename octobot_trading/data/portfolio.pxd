@@ -20,6 +20,7 @@
 In simulation it will also define rules to be filled / canceled
 It is also use to store creation & fill values of the order """
 from octobot_trading.data.order cimport Order
+from octobot_trading.data.portfolio_holdings cimport PortfolioHoldings
 from octobot_trading.util.initializable cimport Initializable
 
 cdef class Portfolio(Initializable):
@@ -30,7 +31,7 @@ cdef class Portfolio(Initializable):
 
     cdef public bint is_simulated
 
-    cdef public dict portfolio
+    cdef PortfolioHoldings _portfolio
 
     cpdef double get_currency_portfolio(self, str currency, str portfolio_type=*)
     cpdef void update_portfolio_available(self, Order order, bint is_new_order=*)
@@ -14,8 +14,8 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 from asyncio import Lock
-from copy import deepcopy
 
+from octobot_trading.data.portfolio_holdings import PortfolioHoldings
 from octobot_trading.orders.types import TraderOrderTypeClasses
 from octobot_trading.util.initializable import Initializable
 from octobot_trading.constants import CURRENT_PORTFOLIO_STRING, CONFIG_PORTFOLIO_FREE, CONFIG_PORTFOLIO_TOTAL
@@ -32,24 +32,36 @@ class Portfolio(Initializable):
     This class also manage the availability of each currency in the portfolio:
     - When an order is created it will subtract the quantity of the total
     - When an order is filled or canceled restore the availability with the real quantity
+    The portfolio is stored in array backed PortfolioHoldings: copies are O(1) copy-on-write snapshots
     """
+    HOLDING_TYPES = (PORTFOLIO_AVAILABLE, PORTFOLIO_TOTAL)
+
     def __init__(self, exchange_name, is_simulated=False):
         super().__init__()
         self.exchange_name = exchange_name
         self.is_simulated = is_simulated
 
-        self.portfolio = {}
+        self._portfolio = PortfolioHoldings(self.HOLDING_TYPES)
         self.logger = get_logger(
             f"{self.__class__.__name__}{'Simulator' if is_simulated else ''}[{exchange_name}]")
         self.lock = Lock()
 
+    @property
+    def portfolio(self):
+        return self._portfolio
+
+    @portfolio.setter
+    def portfolio(self, portfolio):
+        self._portfolio = portfolio if isinstance(portfolio, PortfolioHoldings) \
+            else PortfolioHoldings(self.HOLDING_TYPES, portfolio)
+
     async def initialize_impl(self):
         self.portfolio = {}
 
     async def copy(self):
         pf: Portfolio = Portfolio(self.exchange_name, self.is_simulated)
         await pf.initialize()
-        pf.portfolio = deepcopy(self.portfolio)
+        pf.portfolio = self.portfolio.snapshot()
         return pf
 
     async def update_portfolio_from_balance(self, balance) -> bool:
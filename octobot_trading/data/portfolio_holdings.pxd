@@ -0,0 +1,45 @@
+# cython: language_level=3
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+cimport numpy as np
+np.import_array()
+
+cdef class PortfolioHoldings:
+    cdef public tuple holding_types
+
+    cdef dict _holding_type_indexes
+    cdef dict _currency_indexes
+    cdef np.ndarray _quantities
+    cdef int _rows_count
+    cdef bint _is_shared
+    cdef dict _currencies_holdings
+
+    cpdef PortfolioHoldings snapshot(self)
+    cpdef tuple get_read_only_quantities(self)
+    cpdef double get_quantity(self, str currency, str holding_type) except? -1
+    cpdef void set_quantity(self, str currency, str holding_type, double quantity) except *
+    cpdef dict to_dict(self)
+    cpdef void update(self, object holdings) except *
+
+    cdef dict _get_currency_holdings_dict(self, int currency_index)
+    cdef int _get_or_create_currency_index(self, str currency)
+    cdef void _ensure_writable(self)
+
+cdef class CurrencyHoldings:
+    cdef public PortfolioHoldings holdings
+    cdef public str currency
+
+    cpdef dict to_dict(self)
@@ -0,0 +1,236 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+from collections.abc import Mapping, MutableMapping
+
+import numpy as np
+from octobot_commons.constants import PORTFOLIO_AVAILABLE, PORTFOLIO_TOTAL
+
+
+class PortfolioHoldings:
+    """
+    Array backed {currency: {holding type: quantity}} portfolio mapping.
+    Currencies are interned to the rows of a float64 quantities array which columns are the holding types
+    (available and total, plus margin for margin portfolios).
+    Snapshots share the quantities array and are copy-on-write: the first modification of a shared array copies it.
+    """
+    DEFAULT_CAPACITY = 16
+
+    def __init__(self, holding_types=(PORTFOLIO_AVAILABLE, PORTFOLIO_TOTAL), holdings=None,
+                 capacity=DEFAULT_CAPACITY):
+        self.holding_types = tuple(holding_types)
+        self._holding_type_indexes = {holding_type: index for index, holding_type in enumerate(self.holding_types)}
+
+        # currency -> row index in self._quantities, removed currencies rows are not reused
+        self._currency_indexes = {}
+        self._quantities = np.zeros((capacity, len(self.holding_types)), dtype=np.float64)
+        self._rows_count = 0
+
+        # True when self._currency_indexes and self._quantities might be referenced by a snapshot
+        self._is_shared = False
+        self._currencies_holdings = {}
+
+        if holdings:
+            self.update(holdings)
+
+    def snapshot(self):
+        """
+        :return: a copy-on-write copy of these holdings, in O(1)
+        """
+        snapshot = PortfolioHoldings(self.holding_types, capacity=0)
+        snapshot._currency_indexes = self._currency_indexes
+        snapshot._quantities = self._quantities
+        snapshot._rows_count = self._rows_count
+        snapshot._is_shared = self._is_shared = True
+        return snapshot
+
+    def get_read_only_quantities(self):
+        """
+        :return: the (currencies, quantities) tuple where quantities is a read-only currencies x holding types array
+        that is not affected by the next holdings modifications
+        """
+        self._is_shared = True
+        currencies = tuple(self._currency_indexes)
+        if len(currencies) == self._rows_count:
+            quantities = self._quantities[:self._rows_count]
+        else:
+            quantities = self._quantities[list(self._currency_indexes.values())]
+        quantities = quantities.view()
+        quantities.flags.writeable = False
+        return currencies, quantities
+
+    def get_quantity(self, currency, holding_type):
+        return float(self._quantities[self._currency_indexes[currency], self._holding_type_indexes[holding_type]])
+
+    def set_quantity(self, currency, holding_type, quantity):
+        holding_type_index = self._holding_type_indexes[holding_type]
+        currency_index = self._currency_indexes[currency]
+        self._ensure_writable()
+        self._quantities[currency_index, holding_type_index] = quantity
+
+    def to_dict(self):
+        return {currency: self._get_currency_holdings_dict(currency_index)
+                for currency, currency_index in self._currency_indexes.items()}
+
+    def update(self, holdings):
+        for currency, currency_holdings in holdings.items():
+            self[currency] = currency_holdings
+
+    def pop(self, currency, *default):
+        try:
+            currency_holdings = self._get_currency_holdings_dict(self._currency_indexes[currency])
+        except KeyError:
+            if default:
+                return default[0]
+            raise
+        self._ensure_writable()
+        self._currency_indexes.pop(currency)
+        self._currencies_holdings.pop(currency, None)
+        return currency_holdings
+
+    def get(self, currency, default=None):
+        return self[currency] if currency in self._currency_indexes else default
+
+    def keys(self):
+        return self._currency_indexes.keys()
+
+    def values(self):
+        return [self[currency] for currency in self._currency_indexes]
+
+    def items(self):
+        return [(currency, self[currency]) for currency in self._currency_indexes]
+
+    def __getitem__(self, currency):
+        try:
+            return self._currencies_holdings[currency]
+        except KeyError:
+            if currency not in self._currency_indexes:
+                raise
+            currency_holdings = CurrencyHoldings(self, currency)
+            self._currencies_holdings[currency] = currency_holdings
+            return currency_holdings
+
+    def __setitem__(self, currency, currency_holdings):
+        holdings_row = np.zeros(len(self.holding_types), dtype=np.float64)
+        for holding_type, quantity in currency_holdings.items():
+            holdings_row[self._holding_type_indexes[holding_type]] = quantity
+        self._ensure_writable()
+        currency_index = self._get_or_create_currency_index(currency)
+        self._quantities[currency_index] = holdings_row
+
+    def __delitem__(self, currency):
+        self.pop(currency)
+
+    def __contains__(self, currency):
+        return currency in self._currency_indexes
+
+    def __iter__(self):
+        return iter(self._currency_indexes)
+
+    def __len__(self):
+        return len(self._currency_indexes)
+
+    def __eq__(self, other):
+        if isinstance(other, PortfolioHoldings):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, Mapping):
+            return self.to_dict() == {currency: dict(currency_holdings.items())
+                                      for currency, currency_holdings in other.items()}
+        return NotImplemented
+
+    def __copy__(self):
+        return self.snapshot()
+
+    def __deepcopy__(self, memo):
+        return self.snapshot()
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+    def _get_currency_holdings_dict(self, currency_index):
+        return dict(zip(self.holding_types, self._quantities[currency_index].tolist()))
+
+    def _get_or_create_currency_index(self, currency):
+        try:
+            return self._currency_indexes[currency]
+        except KeyError:
+            if self._rows_count == self._quantities.shape[0]:
+                quantities = np.zeros((max(2 * self._rows_count, self.DEFAULT_CAPACITY), len(self.holding_types)),
+                                      dtype=np.float64)
+                quantities[:self._rows_count] = self._quantities[:self._rows_count]
+                self._quantities = quantities
+            currency_index = self._rows_count
+            self._currency_indexes[currency] = currency_index
+            self._rows_count += 1
+            return currency_index
+
+    def _ensure_writable(self):
+        if self._is_shared:
+            self._quantities = self._quantities.copy()
+            self._currency_indexes = dict(self._currency_indexes)
+            self._is_shared = False
+
+
+class CurrencyHoldings:
+    """
+    {holding type: quantity} view on a currency row of a PortfolioHoldings
+    """
+
+    def __init__(self, holdings, currency):
+        self.holdings = holdings
+        self.currency = currency
+
+    def to_dict(self):
+        return {holding_type: self.holdings.get_quantity(self.currency, holding_type)
+                for holding_type in self.holdings.holding_types}
+
+    def get(self, holding_type, default=None):
+        return self[holding_type] if holding_type in self else default
+
+    def keys(self):
+        return self.holdings.holding_types
+
+    def values(self):
+        return [self[holding_type] for holding_type in self.holdings.holding_types]
+
+    def items(self):
+        return [(holding_type, self[holding_type]) for holding_type in self.holdings.holding_types]
+
+    def __getitem__(self, holding_type):
+        return self.holdings.get_quantity(self.currency, holding_type)
+
+    def __setitem__(self, holding_type, quantity):
+        self.holdings.set_quantity(self.currency, holding_type, quantity)
+
+    def __contains__(self, holding_type):
+        return holding_type in self.holdings.holding_types
+
+    def __iter__(self):
+        return iter(self.holdings.holding_types)
+
+    def __len__(self):
+        return len(self.holdings.holding_types)
+
+    def __eq__(self, other):
+        if isinstance(other, (CurrencyHoldings, Mapping)):
+            return self.to_dict() == dict(other.items())
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+
+MutableMapping.register(PortfolioHoldings)
+MutableMapping.register(CurrencyHoldings)
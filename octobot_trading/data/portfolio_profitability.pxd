@@ -19,6 +19,7 @@
 """ Order class will represent an open order in the specified exchange
 In simulation it will also define rules to be filled / canceled
 It is also use to store creation & fill values of the order """
+from octobot_trading.data.currency_conversion_graph cimport CurrencyConversionGraph
 from octobot_trading.data.portfolio cimport Portfolio
 from octobot_trading.data_manager.portfolio_manager cimport PortfolioManager
 from octobot_trading.exchanges.exchange_manager cimport ExchangeManager
@@ -39,6 +40,7 @@ cdef class PortfolioProfitabilty:
     cdef public double portfolio_origin_value
     cdef public double portfolio_current_value
     cdef public double initial_portfolio_current_profitability
+    cdef public double origin_portfolio_current_value
     cdef public set initializing_symbol_prices
 
     cdef public dict currencies_last_prices
@@ -49,9 +51,28 @@ cdef class PortfolioProfitabilty:
 
     cdef set traded_currencies_without_market_specific
 
+    cdef dict _current_holdings_values
+    cdef dict _origin_holdings_values
+    cdef dict _market_profitability_ratios
+    cdef double _market_profitability_ratios_sum
+    cdef bint _holdings_values_initialized
+
     cdef public str reference_market
 
+    cdef public CurrencyConversionGraph conversion_graph
+    cdef object _conversion_graph_symbols
+
     cdef dict _only_symbol_currency_filter(self, dict currency_dict)
     cdef void _init_traded_currencies_without_market_specific(self)
     cdef void _inform_no_matching_symbol(self, str currency, bint force=*)
+    cdef bint _update_profitability_values(self, double previous_profitability_percent)
+    cdef bint _update_profitability_from_ticker(self, list updated_currencies)
+    cdef bint _update_profitability_from_balance(self)
+    cdef bint _has_currency_without_value(self)
+    cdef CurrencyConversionGraph _get_conversion_graph(self)
+    cdef void _update_currency_value(self, str currency, double value)
+    cdef void _update_market_profitability_ratio(self, str currency, double value)
+    cdef double _get_average_market_profitability(self)
 
+    @staticmethod
+    cdef double _update_holding_value(dict holdings_values, object portfolio, str currency, double value)
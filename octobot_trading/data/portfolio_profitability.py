@@ -15,11 +15,12 @@
 #  License along with this library.
 from octobot_commons.constants import PORTFOLIO_TOTAL, CONFIG_CRYPTO_CURRENCIES
 from octobot_commons.logging.logging_util import get_logger
-from octobot_commons.symbol_util import split_symbol, merge_currencies
+from octobot_commons.symbol_util import split_symbol
 
 from octobot_trading.constants import TICKER_CHANNEL
 from octobot_trading.channels.exchange_channel import get_chan
 from octobot_trading.constants import CONFIG_PORTFOLIO_TOTAL
+from octobot_trading.data.currency_conversion_graph import CurrencyConversionGraph
 from octobot_trading.enums import ExchangeConstantsTickersColumns
 from octobot_trading.exchanges.exchange_simulator import ExchangeSimulator
 from octobot_trading.util import get_reference_market
@@ -54,12 +55,25 @@ class PortfolioProfitabilty:
         self.current_crypto_currencies_values = {}
         self.origin_portfolio = None
 
+        # incremental valuation: per currency holding values of the current and origin portfolios
+        # (at current prices) to update profitability only for the currency which price or balance changed
+        self.origin_portfolio_current_value = 0
+        self._current_holdings_values = {}
+        self._origin_holdings_values = {}
+        self._market_profitability_ratios = {}
+        self._market_profitability_ratios_sum = 0
+        self._holdings_values_initialized = False
+
         # buffer of currencies excluding market only used currencies ex: conf = btc/usd, eth/btc, ltc/btc, here usd
         # is market only => not used to compute market average profitability
         self.traded_currencies_without_market_specific = set()
 
         self.reference_market = get_reference_market(self.config)
 
+        # built from the exchange symbols when they are available
+        self.conversion_graph = None
+        self._conversion_graph_symbols = None
+
     async def handle_ticker_update(self, symbol, ticker):
         force_recompute_origin_portfolio = False
         try:
@@ -70,10 +84,15 @@ class PortfolioProfitabilty:
             force_recompute_origin_portfolio = True
             self.origin_crypto_currencies_values[symbol] = ticker[ExchangeConstantsTickersColumns.LAST.value]
         self.currencies_last_prices[symbol] = ticker[ExchangeConstantsTickersColumns.LAST.value]
-        return await self._update_profitability(force_recompute_origin_portfolio)
+        updated_currencies = self._get_conversion_graph().update_rates(symbol)
+        if force_recompute_origin_portfolio or not self._holdings_values_initialized:
+            return await self._update_profitability(force_recompute_origin_portfolio)
+        return self._update_profitability_from_ticker(updated_currencies)
 
     async def handle_balance_update(self, balance):
-        return await self._update_profitability()
+        if not self._holdings_values_initialized or self._has_currency_without_value():
+            return await self._update_profitability()
+        return self._update_profitability_from_balance()
 
     """ Get profitability calls get_currencies_prices to update required data
     Then calls get_portfolio_current_value to set the current value of portfolio_current_value attribute
@@ -86,6 +105,7 @@ class PortfolioProfitabilty:
         self.profitability_percent = 0
         self.market_profitability_percent = 0
         self.initial_portfolio_current_profitability = 0
+        self._holdings_values_initialized = False
 
         try:
             await self.update_portfolio_and_currencies_current_value()
@@ -95,41 +115,123 @@ class PortfolioProfitabilty:
             if force_recompute_origin_portfolio:
                 await self._recompute_origin_portfolio_initial_value()
 
-            initial_portfolio_current_value = await self._get_origin_portfolio_current_value()
-
-            self.profitability = self.portfolio_current_value - self.portfolio_origin_value
-
-            if self.portfolio_origin_value > 0:
-                self.profitability_percent = (100 * self.portfolio_current_value / self.portfolio_origin_value) - 100
-                self.initial_portfolio_current_profitability = \
-                    (100 * initial_portfolio_current_value / self.portfolio_origin_value) - 100
-            else:
-                self.profitability_percent = 0
-
-            # calculate difference with the last current portfolio
-            self.profitability_diff = self.profitability_percent - self.profitability_diff
-
-            self.market_profitability_percent = await self.get_average_market_profitability()
-
-            return self.profitability_diff != 0
+            await self._init_holdings_values()
+            return self._update_profitability_values(self.profitability_diff)
         except KeyError as e:
             self.logger.warning(f"Missing ticker data to calculate profitability")
             self.logger.warning(f"Missing {e} ticker data to calculate profitability")
         except Exception as e:
             self.logger.exception(e, True, str(e))
 
+    def _update_profitability_values(self, previous_profitability_percent):
+        self.profitability = self.portfolio_current_value - self.portfolio_origin_value
+
+        if self.portfolio_origin_value > 0:
+            self.profitability_percent = (100 * self.portfolio_current_value / self.portfolio_origin_value) - 100
+            self.initial_portfolio_current_profitability = \
+                (100 * self.origin_portfolio_current_value / self.portfolio_origin_value) - 100
+        else:
+            self.profitability_percent = 0
+            self.initial_portfolio_current_profitability = 0
+
+        # calculate difference with the last current portfolio
+        self.profitability_diff = self.profitability_percent - previous_profitability_percent
+
+        self.market_profitability_percent = self._get_average_market_profitability()
+
+        return self.profitability_diff != 0
+
+    def _update_profitability_from_ticker(self, updated_currencies):
+        """
+        Only the currencies which conversion rate depends on the updated price can change: update their holding values
+        """
+        previous_profitability_percent = self.profitability_percent
+        for currency in updated_currencies:
+            self._update_currency_value(currency, self.conversion_graph.get_rate(currency))
+        return self._update_profitability_values(previous_profitability_percent)
+
+    def _update_profitability_from_balance(self):
+        previous_profitability_percent = self.profitability_percent
+        portfolio = self.portfolio_manager.portfolio.portfolio
+        # balance updates are not telling which currency changed: re-multiply holdings by their known value
+        self._current_holdings_values = {
+            currency: self.current_crypto_currencies_values[currency] * portfolio[currency][CONFIG_PORTFOLIO_TOTAL]
+            for currency in portfolio
+            if portfolio[currency][CONFIG_PORTFOLIO_TOTAL] != 0
+        }
+        self.portfolio_current_value = sum(self._current_holdings_values.values())
+        return self._update_profitability_values(previous_profitability_percent)
+
+    def _has_currency_without_value(self):
+        portfolio = self.portfolio_manager.portfolio.portfolio
+        for currency in portfolio:
+            if portfolio[currency][CONFIG_PORTFOLIO_TOTAL] != 0 and \
+                    currency not in self.current_crypto_currencies_values:
+                return True
+        return False
+
+    def _get_conversion_graph(self):
+        if self.conversion_graph is None or self._conversion_graph_symbols is not self.exchange_manager.client_symbols:
+            self._conversion_graph_symbols = self.exchange_manager.client_symbols
+            # holding values are depending on the previous graph rates
+            self._holdings_values_initialized = False
+            self.conversion_graph = CurrencyConversionGraph(self.reference_market,
+                                                            self._conversion_graph_symbols or [],
+                                                            self.currencies_last_prices)
+        return self.conversion_graph
+
+    def _update_currency_value(self, currency, value):
+        self.current_crypto_currencies_values[currency] = value
+        self.portfolio_current_value += PortfolioProfitabilty._update_holding_value(
+            self._current_holdings_values, self.portfolio_manager.portfolio.portfolio, currency, value)
+        self.origin_portfolio_current_value += PortfolioProfitabilty._update_holding_value(
+            self._origin_holdings_values, self.origin_portfolio.portfolio, currency, value)
+        self._update_market_profitability_ratio(currency, value)
+
+    @staticmethod
+    def _update_holding_value(holdings_values, portfolio, currency, value):
+        """
+        :return: the difference between the new and the previous holding value
+        """
+        try:
+            holding_value = value * portfolio[currency][CONFIG_PORTFOLIO_TOTAL]
+        except KeyError:
+            return 0
+        previous_holding_value = holdings_values.get(currency, 0)
+        holdings_values[currency] = holding_value
+        return holding_value - previous_holding_value
+
+    async def _init_holdings_values(self):
+        self._current_holdings_values = await self._evaluate_portfolio_holdings_values(
+            self.portfolio_manager.portfolio.portfolio, self.current_crypto_currencies_values)
+        self._origin_holdings_values = await self._evaluate_portfolio_holdings_values(
+            self.origin_portfolio.portfolio, self.current_crypto_currencies_values)
+        self.portfolio_current_value = sum(self._current_holdings_values.values())
+        self.origin_portfolio_current_value = sum(self._origin_holdings_values.values())
+        self._market_profitability_ratios = {}
+        self._market_profitability_ratios_sum = 0
+        for currency, value in self._only_symbol_currency_filter(self.current_crypto_currencies_values).items():
+            self._update_market_profitability_ratio(currency, value)
+        self._holdings_values_initialized = True
+
+    def _update_market_profitability_ratio(self, currency, value):
+        if currency in self.traded_currencies_without_market_specific:
+            origin_value = self.origin_crypto_currencies_values.get(currency, 0)
+            if origin_value > 0:
+                ratio = value / origin_value
+                self._market_profitability_ratios_sum += ratio - self._market_profitability_ratios.get(currency, 0)
+                self._market_profitability_ratios[currency] = ratio
+
     """ Returns the % move average of all the watched cryptocurrencies between bot's start time and now
     """
 
     async def get_average_market_profitability(self):
-        await self.get_current_crypto_currencies_values()
-
-        origin_values = [value / self.origin_crypto_currencies_values[currency]
-                         for currency, value
-                         in self._only_symbol_currency_filter(self.current_crypto_currencies_values).items()
-                         if self.origin_crypto_currencies_values[currency] > 0]
+        return self._get_average_market_profitability()
 
-        return sum(origin_values) / len(origin_values) * 100 - 100 if origin_values else 0
+    def _get_average_market_profitability(self):
+        if self._market_profitability_ratios:
+            return self._market_profitability_ratios_sum / len(self._market_profitability_ratios) * 100 - 100
+        return 0
 
     async def get_current_crypto_currencies_values(self):
         if not self.current_crypto_currencies_values:
@@ -171,13 +273,6 @@ class PortfolioProfitabilty:
                                                       currencies_values=self.origin_crypto_currencies_values,
                                                       fill_currencies_values=True)
 
-    async def _get_origin_portfolio_current_value(self, refresh_values=False):
-        if refresh_values:
-            self.current_crypto_currencies_values = \
-                await self._evaluate_config_crypto_currencies_and_portfolio_values(self.origin_portfolio.portfolio)
-        return await self.update_portfolio_current_value(self.origin_portfolio.portfolio,
-                                                         currencies_values=self.current_crypto_currencies_values)
-
     async def update_portfolio_current_value(self, portfolio, currencies_values=None, fill_currencies_values=False):
         values = currencies_values
         if values is None or fill_currencies_values:
@@ -192,31 +287,19 @@ class PortfolioProfitabilty:
 
     """ try_get_value_of_currency will try to obtain the current value of the currency quantity
     in the reference currency.
-    It will try to create the symbol that fit with the exchange logic.
+    It will use the currency conversion path to the reference market: a direct pair or a two-hop path.
     Returns the value found of this currency quantity, if not found returns 0.
     """
 
     async def _try_get_value_of_currency(self, currency, quantity, raise_error):
-        symbol = merge_currencies(currency, self.reference_market)
-        symbol_inverted = merge_currencies(self.reference_market, currency)
-
-        try:
-            if self.exchange_manager.symbol_exists(symbol):
-                return self.currencies_last_prices[symbol] * quantity
-
-            elif self.exchange_manager.symbol_exists(symbol_inverted) and \
-                    self.currencies_last_prices[symbol_inverted] != 0:
-                return quantity / self.currencies_last_prices[symbol_inverted]
-
+        conversion_graph = self._get_conversion_graph()
+        if conversion_graph.get_conversion_path(currency) is None:
             self._inform_no_matching_symbol(currency)
             return 0
+        try:
+            return conversion_graph.get_rate(currency) * quantity
         except KeyError as e:
-            symbols_to_add = []
-            if self.exchange_manager.symbol_exists(symbol):
-                symbols_to_add = [symbol]
-            elif self.exchange_manager.symbol_exists(symbol_inverted):
-                symbols_to_add = [symbol_inverted]
-
+            symbols_to_add = conversion_graph.get_missing_symbols(currency)
             if symbols_to_add:
                 await get_chan(TICKER_CHANNEL, self.exchange_manager.id).modify(added_pairs=symbols_to_add)
                 self.initializing_symbol_prices.add(currency)
@@ -268,10 +351,13 @@ class PortfolioProfitabilty:
     """
 
     async def _evaluate_portfolio_value(self, portfolio, currencies_values=None):
-        return sum([
-            await self._get_currency_value(portfolio, currency, currencies_values)
+        return sum((await self._evaluate_portfolio_holdings_values(portfolio, currencies_values)).values())
+
+    async def _evaluate_portfolio_holdings_values(self, portfolio, currencies_values=None):
+        return {
+            currency: await self._get_currency_value(portfolio, currency, currencies_values)
             for currency in portfolio
-        ])
+        }
 
     async def _get_currency_value(self, portfolio, currency, currencies_values=None, raise_error=False):
         if currency in portfolio and portfolio[currency][CONFIG_PORTFOLIO_TOTAL] != 0:
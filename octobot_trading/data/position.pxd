@@ -27,6 +27,8 @@ cdef class Position(Initializable):
     cdef Trader trader
     cdef ExchangeManager exchange_manager
 
+    cdef object _lock # Lock, created on first use
+
     cdef public str symbol
     cdef public str currency
     cdef public str market
@@ -42,6 +44,7 @@ cdef class Position(Initializable):
     cdef public double liquidation_price
     cdef public double quantity
     cdef public double value
+    cdef public double margin
     cdef public double unrealised_pnl
     cdef public double realised_pnl
 
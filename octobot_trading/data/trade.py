@@ -20,6 +20,11 @@ from octobot_trading.enums import OrderStatus, ExchangeConstantsOrderColumns
 
 
 class Trade:
+    __slots__ = ("trader", "exchange_manager", "status", "creation_time", "trade_id", "simulated", "symbol", "currency",
+                 "market", "taker_or_maker", "timestamp", "origin_price", "origin_quantity", "trade_type", "side",
+                 "executed_quantity", "canceled_time", "executed_time", "fee", "executed_price",
+                 "trade_profitability", "total_cost", "exchange_trade_type")
+
     def __init__(self, trader):
         self.trader = trader
         self.exchange_manager = trader.exchange_manager
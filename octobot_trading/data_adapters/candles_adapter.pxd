@@ -21,17 +21,17 @@ from octobot_trading.exchanges.data.exchange_symbol_data cimport ExchangeSymbolD
 
 
 cpdef np.ndarray get_symbol_close_candles(ExchangeSymbolData symbol_data, str time_frame,
-                                          int limit, bint include_in_construction)
+                                          int limit, bint include_in_construction, bint copy=*)
 cpdef np.ndarray get_symbol_open_candles(ExchangeSymbolData symbol_data, str time_frame,
-                                         int limit, bint include_in_construction)
+                                         int limit, bint include_in_construction, bint copy=*)
 cpdef np.ndarray get_symbol_high_candles(ExchangeSymbolData symbol_data, str time_frame,
-                                         int limit, bint include_in_construction)
+                                         int limit, bint include_in_construction, bint copy=*)
 cpdef np.ndarray get_symbol_low_candles(ExchangeSymbolData symbol_data, str time_frame,
-                                        int limit, bint include_in_construction)
+                                        int limit, bint include_in_construction, bint copy=*)
 cpdef np.ndarray get_symbol_volume_candles(ExchangeSymbolData symbol_data, str time_frame,
-                                           int limit, bint include_in_construction)
+                                           int limit, bint include_in_construction, bint copy=*)
 cpdef np.ndarray get_symbol_time_candles(ExchangeSymbolData symbol_data, str time_frame,
-                                         int limit, bint include_in_construction)
+                                         int limit, bint include_in_construction, bint copy=*)
 
-cdef np.ndarray _add_in_construction_data(np.ndarray candles, ExchangeSymbolData symbol_data,
-                                          object time_frame, int data_type)
\ No newline at end of file
+cdef np.ndarray _get_candles_with_in_construction_data(ExchangeSymbolData symbol_data, object time_frame,
+                                                      int limit, int data_type, bint copy)
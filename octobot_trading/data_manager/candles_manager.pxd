@@ -24,39 +24,40 @@ cdef class CandlesManager(Initializable):
 
     cdef public bint candles_initialized
 
-    cdef public np.float64_t[::1] close_candles
-    cdef public np.float64_t[::1] open_candles
-    cdef public np.float64_t[::1] high_candles
-    cdef public np.float64_t[::1] low_candles
-    cdef public np.float64_t[::1] time_candles
-    cdef public np.float64_t[::1] volume_candles
-
-    cdef public int close_candles_index
-    cdef public int open_candles_index
-    cdef public int high_candles_index
-    cdef public int low_candles_index
-    cdef public int time_candles_index
-    cdef public int volume_candles_index
+    cdef public int max_candles_count
+
+    cdef public np.ndarray candles
+
+    cdef public int candles_index
 
     cdef public bint reached_max
 
-    cpdef np.ndarray get_symbol_close_candles(self, int limit=*)
-    cpdef np.ndarray get_symbol_open_candles(self, int limit=*)
-    cpdef np.ndarray get_symbol_high_candles(self, int limit=*)
-    cpdef np.ndarray get_symbol_low_candles(self, int limit=*)
-    cpdef np.ndarray get_symbol_time_candles(self, int limit=*)
-    cpdef np.ndarray get_symbol_volume_candles(self, int limit=*)
+    cdef int _ring_start
+    cdef set _candles_times
+
+    cpdef np.ndarray get_symbol_close_candles(self, int limit=*, bint copy=*)
+    cpdef np.ndarray get_symbol_open_candles(self, int limit=*, bint copy=*)
+    cpdef np.ndarray get_symbol_high_candles(self, int limit=*, bint copy=*)
+    cpdef np.ndarray get_symbol_low_candles(self, int limit=*, bint copy=*)
+    cpdef np.ndarray get_symbol_time_candles(self, int limit=*, bint copy=*)
+    cpdef np.ndarray get_symbol_volume_candles(self, int limit=*, bint copy=*)
 
-    cpdef dict get_symbol_prices(self, object limit=*)
+    cpdef dict get_symbol_prices(self, object limit=*, bint copy=*)
+    cpdef np.ndarray get_symbol_candles_with_in_construction(self, int data_index, object in_construction_candle,
+                                                             int limit=*, bint copy=*)
     cpdef void add_old_and_new_candles(self, list candles_data)
     cpdef void add_new_candle(self, list new_candle_data)
     cpdef void replace_all_candles(self, list all_candles_data)
 
     # private
     cdef void _set_all_candles(self, object new_candles_data)
-    cdef void _change_current_candle(self)
+    cdef void _load_candles(self, np.ndarray candles)
+    cdef int _get_write_index(self)
+    cdef double _get_last_candle_time(self)
+    cdef void _insert_old_candle(self, list old_candle_data)
+    cdef void _sync_mirror(self, int from_index, int to_index)
     cdef bint _should_add_new_candle(self, new_open_time)
-    cdef void _check_max_candles(self)
     cdef object _inc_candle_index(self)
     cdef void _reset_candles(self)
-    cdef np.ndarray _extract_limited_data(self, np.float64_t[::1] data, int limit=*, int max_limit=*)
+    cdef np.ndarray _extract_limited_data(self, int data_index, int limit=*, bint copy=*,
+                                          bint include_in_construction=*)
@@ -15,7 +15,6 @@
 #  License along with this library.
 import numpy as np
 
-from octobot_commons.data_util import shift_value_array
 from octobot_commons.enums import PriceIndexes
 from octobot_commons.logging.logging_util import get_logger
 
@@ -23,29 +22,32 @@ from octobot_trading.util.initializable import Initializable
 
 
 class CandlesManager(Initializable):
+    """
+    Stores the last max_candles_count (default MAX_CANDLES_COUNT) candles of a symbol time frame.
+    Candles are stored in a single (2 * max_candles_count, len(PriceIndexes)) array used as a mirrored ring buffer:
+    each candle is a row indexed by PriceIndexes written at its ring position and at the same
+    position + max_candles_count. Adding a candle when the buffer is full is O(1) (the oldest candle is overwritten)
+    and the stored candles are always available as a contiguous slice starting at the ring start.
+    The array is column-major so that each candle data (close, open, etc) is a contiguous column.
+    The row following the last candle is never read by views on stored candles: it is used as an "in construction"
+    candle slot to provide views including the current candle without copying stored candles.
+    Stored candles open times are indexed in a set to check for already known candles in O(1).
+    """
     MAX_CANDLES_COUNT = 1000
 
-    def __init__(self):
+    def __init__(self, max_candles_count=None):
         super().__init__()
         self.logger = get_logger(self.__class__.__name__)
+        self.max_candles_count = max_candles_count or CandlesManager.MAX_CANDLES_COUNT
 
         self.candles_initialized = False
 
-        self.close_candles_index = 0
-        self.open_candles_index = 0
-        self.high_candles_index = 0
-        self.low_candles_index = 0
-        self.time_candles_index = 0
-        self.volume_candles_index = 0
-
-        self.close_candles = None
-        self.open_candles = None
-        self.high_candles = None
-        self.low_candles = None
-        self.time_candles = None
-        self.volume_candles = None
+        self.candles_index = 0
+        self.candles = None
 
         self.reached_max = False
+        self._ring_start = 0
+        self._candles_times = set()
         self._reset_candles()
 
     async def initialize_impl(self):
@@ -54,50 +56,57 @@ class CandlesManager(Initializable):
     def _reset_candles(self):
         self.candles_initialized = False
         self.reached_max = False
+        self._ring_start = 0
+        self._candles_times = set()
 
-        self.close_candles_index = 0
-        self.open_candles_index = 0
-        self.high_candles_index = 0
-        self.low_candles_index = 0
-        self.time_candles_index = 0
-        self.volume_candles_index = 0
+        self.candles_index = 0
+        self.candles = np.full((2 * self.max_candles_count, len(PriceIndexes)),
+                               fill_value=np.nan, dtype=np.float64, order="F")
 
-        self.close_candles = np.full(CandlesManager.MAX_CANDLES_COUNT, fill_value=np.nan, dtype=np.float64)
-        self.open_candles = np.full(CandlesManager.MAX_CANDLES_COUNT, fill_value=np.nan, dtype=np.float64)
-        self.high_candles = np.full(CandlesManager.MAX_CANDLES_COUNT, fill_value=np.nan, dtype=np.float64)
-        self.low_candles = np.full(CandlesManager.MAX_CANDLES_COUNT, fill_value=np.nan, dtype=np.float64)
-        self.time_candles = np.full(CandlesManager.MAX_CANDLES_COUNT, fill_value=np.nan, dtype=np.float64)
-        self.volume_candles = np.full(CandlesManager.MAX_CANDLES_COUNT, fill_value=np.nan, dtype=np.float64)
+    @staticmethod
+    def get_buffers_memory_size(max_candles_count):
+        """
+        :return: the memory size in bytes of the candles buffers of a CandlesManager storing max_candles_count candles
+        """
+        return 2 * max_candles_count * len(PriceIndexes) * np.dtype(np.float64).itemsize
 
     # getters
-    def get_symbol_close_candles(self, limit=-1):
-        return self._extract_limited_data(self.close_candles, limit, max_limit=self.close_candles_index)
+    def get_symbol_close_candles(self, limit=-1, copy=False):
+        return self._extract_limited_data(PriceIndexes.IND_PRICE_CLOSE.value, limit, copy)
 
-    def get_symbol_open_candles(self, limit=-1):
-        return self._extract_limited_data(self.open_candles, limit, max_limit=self.open_candles_index)
+    def get_symbol_open_candles(self, limit=-1, copy=False):
+        return self._extract_limited_data(PriceIndexes.IND_PRICE_OPEN.value, limit, copy)
 
-    def get_symbol_high_candles(self, limit=-1):
-        return self._extract_limited_data(self.high_candles, limit, max_limit=self.high_candles_index)
+    def get_symbol_high_candles(self, limit=-1, copy=False):
+        return self._extract_limited_data(PriceIndexes.IND_PRICE_HIGH.value, limit, copy)
 
-    def get_symbol_low_candles(self, limit=-1):
-        return self._extract_limited_data(self.low_candles, limit, max_limit=self.low_candles_index)
+    def get_symbol_low_candles(self, limit=-1, copy=False):
+        return self._extract_limited_data(PriceIndexes.IND_PRICE_LOW.value, limit, copy)
 
-    def get_symbol_time_candles(self, limit=-1):
-        return self._extract_limited_data(self.time_candles, limit, max_limit=self.time_candles_index)
+    def get_symbol_time_candles(self, limit=-1, copy=False):
+        return self._extract_limited_data(PriceIndexes.IND_PRICE_TIME.value, limit, copy)
 
-    def get_symbol_volume_candles(self, limit=-1):
-        return self._extract_limited_data(self.volume_candles, limit, max_limit=self.volume_candles_index)
+    def get_symbol_volume_candles(self, limit=-1, copy=False):
+        return self._extract_limited_data(PriceIndexes.IND_PRICE_VOL.value, limit, copy)
 
-    def get_symbol_prices(self, limit=-1):
+    def get_symbol_prices(self, limit=-1, copy=False):
         return {
-            PriceIndexes.IND_PRICE_CLOSE.value: self.get_symbol_close_candles(limit),
-            PriceIndexes.IND_PRICE_OPEN.value: self.get_symbol_open_candles(limit),
-            PriceIndexes.IND_PRICE_HIGH.value: self.get_symbol_high_candles(limit),
-            PriceIndexes.IND_PRICE_LOW.value: self.get_symbol_low_candles(limit),
-            PriceIndexes.IND_PRICE_VOL.value: self.get_symbol_volume_candles(limit),
-            PriceIndexes.IND_PRICE_TIME.value: self.get_symbol_time_candles(limit)
+            price_index.value: self._extract_limited_data(price_index.value, limit, copy)
+            for price_index in PriceIndexes
         }
 
+    def get_symbol_candles_with_in_construction(self, data_index, in_construction_candle, limit=-1, copy=False):
+        """
+        :param data_index: the PriceIndexes value of the candles data to get
+        :param in_construction_candle: the current candle data, indexed by PriceIndexes
+        :param limit: the number of candles to get including the in construction candle, -1 for every stored candle
+        :param copy: when True, returns a copy instead of a read-only view
+        :return: the last limit candles data where the oldest candle is replaced by the in construction candle
+        (added as the most recent one)
+        """
+        self.candles[self._ring_start + self.candles_index] = in_construction_candle
+        return self._extract_limited_data(data_index, limit, copy, include_in_construction=True)
+
     def replace_all_candles(self, all_candles_data):
         self._reset_candles()
         self._set_all_candles(all_candles_data)
@@ -111,7 +120,7 @@ class CandlesManager(Initializable):
         """
         # check old candles
         for old_candle in candles_data[:-1]:
-            if old_candle[PriceIndexes.IND_PRICE_TIME.value] not in self.time_candles:
+            if self._should_add_new_candle(old_candle[PriceIndexes.IND_PRICE_TIME.value]):
                 self.add_new_candle(old_candle)
 
         try:
@@ -121,64 +130,117 @@ class CandlesManager(Initializable):
 
     def add_new_candle(self, new_candle_data):
         """
+        Adds the given candle if its open time is not already stored.
+        Candles older than the last stored one are inserted at their position.
         :param new_candle_data: new candles data
         :return:
         """
-        if self._should_add_new_candle(new_candle_data[PriceIndexes.IND_PRICE_TIME.value]):
+        new_open_time = new_candle_data[PriceIndexes.IND_PRICE_TIME.value]
+        if self._should_add_new_candle(new_open_time):
             try:
-                self._check_max_candles()
-                self.close_candles[self.close_candles_index] = new_candle_data[PriceIndexes.IND_PRICE_CLOSE.value]
-                self.open_candles[self.open_candles_index] = new_candle_data[PriceIndexes.IND_PRICE_OPEN.value]
-                self.high_candles[self.high_candles_index] = new_candle_data[PriceIndexes.IND_PRICE_HIGH.value]
-                self.low_candles[self.low_candles_index] = new_candle_data[PriceIndexes.IND_PRICE_LOW.value]
-                self.time_candles[self.time_candles_index] = new_candle_data[PriceIndexes.IND_PRICE_TIME.value]
-                self.volume_candles[self.volume_candles_index] = new_candle_data[PriceIndexes.IND_PRICE_VOL.value]
+                if self.candles_index > 0 and new_open_time < self._get_last_candle_time():
+                    self._insert_old_candle(new_candle_data)
+                    return
+                write_index = self._get_write_index()
+                if self.reached_max:
+                    self._candles_times.discard(self.candles[write_index, PriceIndexes.IND_PRICE_TIME.value])
+                self.candles[write_index] = self.candles[write_index + self.max_candles_count] = new_candle_data
+                self._candles_times.add(new_open_time)
                 self._inc_candle_index()
-            except IndexError as e:
+            except (IndexError, ValueError) as e:
                 self.logger.error(f"Fail to add new candle {new_candle_data} : {e}")
 
     # private
     def _set_all_candles(self, new_candles_data):
         if isinstance(new_candles_data[-1], list):
-            for candle_data in new_candles_data:
-                self.add_new_candle(candle_data)
+            try:
+                self._load_candles(np.asarray(new_candles_data, dtype=np.float64))
+            except ValueError as e:
+                self.logger.error(f"Fail to load candles {new_candles_data} : {e}")
         else:
             self.add_new_candle(new_candles_data)
 
-    def _change_current_candle(self):
-        self.close_candles = shift_value_array(self.close_candles, -1, np.nan, np.float64)
-        self.open_candles = shift_value_array(self.open_candles, -1, np.nan, np.float64)
-        self.high_candles = shift_value_array(self.high_candles, -1, np.nan, np.float64)
-        self.low_candles = shift_value_array(self.low_candles, -1, np.nan, np.float64)
-        self.volume_candles = shift_value_array(self.volume_candles, -1, np.nan, np.float64)
-        self.time_candles = shift_value_array(self.time_candles, -1, np.nan, np.float64)
+    def _load_candles(self, candles):
+        """
+        Writes the given candles in one go into the empty candles buffer: candles are de-duplicated and sorted
+        by open time and only the most recent max_candles_count candles are kept
+        """
+        _, unique_candles_indexes = np.unique(candles[:, PriceIndexes.IND_PRICE_TIME.value], return_index=True)
+        candles = candles[unique_candles_indexes][-self.max_candles_count:]
+        candles_count = len(candles)
+        self.candles[:candles_count] = candles
+        self.candles[self.max_candles_count:self.max_candles_count + candles_count] = candles
+        self.candles_index = candles_count
+        self.reached_max = candles_count == self.max_candles_count
+        self._candles_times = set(candles[:, PriceIndexes.IND_PRICE_TIME.value].tolist())
+
+    def _get_write_index(self):
+        # when full, the oldest candle (at ring start) is overwritten
+        return self._ring_start if self.reached_max else self.candles_index
+
+    def _get_last_candle_time(self):
+        return self.candles[self._ring_start + self.candles_index - 1, PriceIndexes.IND_PRICE_TIME.value]
+
+    def _insert_old_candle(self, old_candle_data):
+        """
+        Inserts a candle older than the last stored one at its position, shifting more recent candles
+        when the buffer is not full and older candles otherwise (the oldest candle is then dropped).
+        """
+        end_index = self._ring_start + self.candles_index
+        insert_index = self._ring_start + int(np.searchsorted(
+            self.candles[self._ring_start:end_index, PriceIndexes.IND_PRICE_TIME.value],
+            old_candle_data[PriceIndexes.IND_PRICE_TIME.value]))
+        if self.reached_max:
+            if insert_index == self._ring_start:
+                # older than every stored candle: would be dropped right away
+                return
+            self._candles_times.discard(self.candles[self._ring_start, PriceIndexes.IND_PRICE_TIME.value])
+            self.candles[self._ring_start:insert_index - 1] = self.candles[self._ring_start + 1:insert_index]
+            self.candles[insert_index - 1] = old_candle_data
+            self._sync_mirror(self._ring_start, insert_index)
+        else:
+            self.candles[insert_index + 1:end_index + 1] = self.candles[insert_index:end_index]
+            self.candles[insert_index] = old_candle_data
+            self._sync_mirror(insert_index, end_index + 1)
+            self._inc_candle_index()
+        self._candles_times.add(old_candle_data[PriceIndexes.IND_PRICE_TIME.value])
+
+    def _sync_mirror(self, from_index, to_index):
+        # copy the [from_index, to_index[ ring slice into its mirrored counterpart
+        primary_end = min(to_index, self.max_candles_count)
+        mirror_start = max(from_index, self.max_candles_count)
+        if from_index < primary_end:
+            self.candles[from_index + self.max_candles_count:primary_end + self.max_candles_count] = \
+                self.candles[from_index:primary_end]
+        if mirror_start < to_index:
+            self.candles[mirror_start - self.max_candles_count:to_index - self.max_candles_count] = \
+                self.candles[mirror_start:to_index]
 
     def _should_add_new_candle(self, new_open_time):
-        return new_open_time not in self.time_candles
-
-    def _check_max_candles(self):
-        if self.reached_max:
-            self._change_current_candle()
+        return new_open_time not in self._candles_times
 
     def _inc_candle_index(self):
-        if self.close_candles_index < CandlesManager.MAX_CANDLES_COUNT - 1:
-            self.close_candles_index += 1
-            self.open_candles_index += 1
-            self.high_candles_index += 1
-            self.low_candles_index += 1
-            self.time_candles_index += 1
-            self.volume_candles_index += 1
+        if self.reached_max:
+            self._ring_start = (self._ring_start + 1) % self.max_candles_count
         else:
-            self.reached_max = True
-
-    def _extract_limited_data(self, data, limit=-1, max_limit=-1):
-        max_handled_limit: int = self.MAX_CANDLES_COUNT if self.reached_max else max_limit
-        if limit == -1:
-            if max_limit == -1:
-                return np.array(data)
-            return np.array(data[:max_handled_limit])
+            self.candles_index += 1
+            self.reached_max = self.candles_index == self.max_candles_count
 
-        if max_limit == -1:
-            return np.array(data[-min(limit, len(data)):])
-        else:
-            return np.array(data[max(0, max_handled_limit - limit): max_handled_limit])
+    def _extract_limited_data(self, data_index, limit=-1, copy=False, include_in_construction=False):
+        """
+        :return: a read-only view on the last limit candles data (or every candle if limit is -1) that is only valid
+        until the next candles update or a copy of this data when copy is True
+        """
+        start_index: int = self._ring_start
+        end_index: int = self._ring_start + self.candles_index
+        if include_in_construction:
+            # in construction candle slot is after the last candle and replaces the oldest one
+            start_index += 1
+            end_index += 1
+        if limit != -1:
+            start_index = max(start_index, end_index - limit)
+        if copy:
+            return np.array(self.candles[start_index:end_index, data_index])
+        candles_view = self.candles[start_index:end_index, data_index]
+        candles_view.flags.writeable = False
+        return candles_view
@@ -14,14 +14,15 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
-
 from octobot_trading.util.initializable cimport Initializable
 
+cimport numpy as np
+np.import_array()
 
 cdef class KlineManager(Initializable):
     cdef object logger
 
-    cdef public list kline
+    cdef public np.ndarray kline
 
     cdef void _reset_kline(self)
 
@@ -13,7 +13,8 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
-from math import nan
+import numpy as np
+
 from octobot_commons.enums import PriceIndexes
 from octobot_commons.logging.logging_util import get_logger
 
@@ -21,40 +22,41 @@ from octobot_trading.util.initializable import Initializable
 
 
 class KlineManager(Initializable):
+    """
+    Stores the current (in construction) candle of a symbol time frame in a preallocated float64 buffer indexed by
+    PriceIndexes. This buffer is updated in place and can be directly given to CandlesManager to get candles views
+    including the in construction candle.
+    """
     def __init__(self):  # Required for python development
         super().__init__()
         self.logger = get_logger(self.__class__.__name__)
-        self.kline = []
+        self.kline = np.full(len(PriceIndexes), fill_value=np.nan, dtype=np.float64)
 
     async def initialize_impl(self):
         self._reset_kline()
 
     def _reset_kline(self):
-        self.kline = [nan] * len(PriceIndexes)
+        self.kline.fill(np.nan)
 
     def kline_update(self, kline):
         try:
             # test for new candle
             if self.kline[PriceIndexes.IND_PRICE_TIME.value] != kline[PriceIndexes.IND_PRICE_TIME.value]:
-                self._reset_kline()
-
-            if self.kline[PriceIndexes.IND_PRICE_TIME.value] is nan:
-                self.kline[PriceIndexes.IND_PRICE_TIME.value] = kline[PriceIndexes.IND_PRICE_TIME.value]
+                self.kline[:] = kline
+                return
 
-            if self.kline[PriceIndexes.IND_PRICE_OPEN.value] is nan:
+            if np.isnan(self.kline[PriceIndexes.IND_PRICE_OPEN.value]):
                 self.kline[PriceIndexes.IND_PRICE_OPEN.value] = kline[PriceIndexes.IND_PRICE_OPEN.value]
 
-            if self.kline[PriceIndexes.IND_PRICE_VOL.value] is nan:
+            if np.isnan(self.kline[PriceIndexes.IND_PRICE_VOL.value]):
                 self.kline[PriceIndexes.IND_PRICE_VOL.value] = kline[PriceIndexes.IND_PRICE_VOL.value]
 
             self.kline[PriceIndexes.IND_PRICE_CLOSE.value] = kline[PriceIndexes.IND_PRICE_CLOSE.value]
 
-            if self.kline[PriceIndexes.IND_PRICE_HIGH.value] is nan or \
-                    self.kline[PriceIndexes.IND_PRICE_HIGH.value] < kline[PriceIndexes.IND_PRICE_HIGH.value]:
-                self.kline[PriceIndexes.IND_PRICE_HIGH.value] = kline[PriceIndexes.IND_PRICE_HIGH.value]
-
-            if self.kline[PriceIndexes.IND_PRICE_LOW.value] is nan or \
-                    self.kline[PriceIndexes.IND_PRICE_LOW.value] > kline[PriceIndexes.IND_PRICE_LOW.value]:
-                self.kline[PriceIndexes.IND_PRICE_LOW.value] = kline[PriceIndexes.IND_PRICE_LOW.value]
-        except TypeError as e:
+            # fmax and fmin ignore nan values
+            self.kline[PriceIndexes.IND_PRICE_HIGH.value] = np.fmax(self.kline[PriceIndexes.IND_PRICE_HIGH.value],
+                                                                    kline[PriceIndexes.IND_PRICE_HIGH.value])
+            self.kline[PriceIndexes.IND_PRICE_LOW.value] = np.fmin(self.kline[PriceIndexes.IND_PRICE_LOW.value],
+                                                                   kline[PriceIndexes.IND_PRICE_LOW.value])
+        except (TypeError, ValueError) as e:
             self.logger.error(f"Fail to update kline with {kline} : {e}")
@@ -28,10 +28,31 @@ cdef class OrderBookManager(Initializable):
     cdef public double bid_quantity
     cdef public double bid_price
 
-    cdef public list bids
-    cdef public list asks
+    cdef dict _asks
+    cdef dict _bids
+    cdef list _ask_prices
+    cdef list _bid_prices
+    cdef list _ask_cumulative_quantities
+    cdef list _bid_cumulative_quantities
 
     cpdef void reset_order_book(self)
     cpdef void order_book_update(self, list asks, list bids)
+    cpdef void order_book_delta_update(self, list asks, list bids)
     cpdef void order_book_ticker_update(self, double ask_quantity, double ask_price,
                                         double bid_quantity, double bid_price)
+    cpdef list get_asks(self, int limit=*)
+    cpdef list get_bids(self, int limit=*)
+    cpdef list get_best_ask(self)
+    cpdef list get_best_bid(self)
+    cpdef double get_ask_quantity(self, double price)
+    cpdef double get_bid_quantity(self, double price)
+    cpdef double get_asks_cumulative_quantity(self, double price)
+    cpdef double get_bids_cumulative_quantity(self, double price)
+
+    cdef void _set_asks(self, list asks)
+    cdef void _set_bids(self, list bids)
+
+    @staticmethod
+    cdef void _set_price_level(dict levels, list prices, double price, double quantity)
+    @staticmethod
+    cdef list _get_cumulative_quantities(dict levels, list prices)
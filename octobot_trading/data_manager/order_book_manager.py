@@ -13,36 +13,160 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+from bisect import bisect_left, bisect_right, insort
+
 from octobot_commons.logging.logging_util import get_logger
 
 from octobot_trading.util.initializable import Initializable
 
 
 class OrderBookManager(Initializable):
+    """
+    Stores each order book side by price level: a price -> quantity dict and an ascending sorted prices list.
+    Deltas are applied level by level: a quantity change is O(1) while adding or removing a price level is located
+    by binary search and then shifts the sorted prices list in O(n). Best ask and bid are read in O(1) and quantity
+    at a given price in O(1). Cumulative quantities are read in O(log n) from a prefix sum that is rebuilt once
+    after each side update.
+    """
     def __init__(self):
         super().__init__()
         self.logger = get_logger(self.__class__.__name__)
         self.order_book_initialized = False
-        self.bids = []
-        self.asks = []
         self.ask_quantity, self.ask_price, self.bid_quantity, self.bid_price = 0, 0, 0, 0
 
+        self._asks = {}
+        self._bids = {}
+        self._ask_prices = []
+        self._bid_prices = []
+        self._ask_cumulative_quantities = None
+        self._bid_cumulative_quantities = None
+
+    @property
+    def asks(self):
+        return self.get_asks()
+
+    @property
+    def bids(self):
+        return self.get_bids()
+
     async def initialize_impl(self):
         self.reset_order_book()
 
     def reset_order_book(self):
         self.order_book_initialized = False
-        self.bids = []
-        self.asks = []
         self.ask_quantity, self.ask_price, self.bid_quantity, self.bid_price = 0, 0, 0, 0
+        self._set_asks([])
+        self._set_bids([])
 
     def order_book_update(self, asks, bids):
+        """
+        Replaces the given order book sides
+        :param asks: the [price, quantity] asks snapshot
+        :param bids: the [price, quantity] bids snapshot
+        """
         self.order_book_initialized = True
         if asks:
-            self.asks = asks
+            self._set_asks(asks)
+        if bids:
+            self._set_bids(bids)
+
+    def order_book_delta_update(self, asks, bids):
+        """
+        Updates the given order book price levels, a 0 quantity removes the price level
+        :param asks: the [price, quantity] asks updates
+        :param bids: the [price, quantity] bids updates
+        """
+        if asks:
+            for price_level in asks:
+                OrderBookManager._set_price_level(self._asks, self._ask_prices, price_level[0], price_level[1])
+            self._ask_cumulative_quantities = None
         if bids:
-            self.bids = bids
+            for price_level in bids:
+                OrderBookManager._set_price_level(self._bids, self._bid_prices, price_level[0], price_level[1])
+            self._bid_cumulative_quantities = None
 
     def order_book_ticker_update(self, ask_quantity, ask_price, bid_quantity, bid_price):
         self.ask_quantity, self.ask_price = ask_quantity, ask_price
         self.bid_quantity, self.bid_price = bid_quantity, bid_price
+
+    def get_asks(self, limit=-1):
+        """
+        :return: the [price, quantity] asks from the best (lowest) one
+        """
+        prices = self._ask_prices if limit == -1 else self._ask_prices[:limit]
+        return [[price, self._asks[price]] for price in prices]
+
+    def get_bids(self, limit=-1):
+        """
+        :return: the [price, quantity] bids from the best (highest) one
+        """
+        prices = self._bid_prices[::-1] if limit == -1 else self._bid_prices[:-limit - 1:-1]
+        return [[price, self._bids[price]] for price in prices]
+
+    def get_best_ask(self):
+        """
+        :return: the [price, quantity] best ask or None when there is no ask
+        """
+        if self._ask_prices:
+            return [self._ask_prices[0], self._asks[self._ask_prices[0]]]
+        return None
+
+    def get_best_bid(self):
+        """
+        :return: the [price, quantity] best bid or None when there is no bid
+        """
+        if self._bid_prices:
+            return [self._bid_prices[-1], self._bids[self._bid_prices[-1]]]
+        return None
+
+    def get_ask_quantity(self, price):
+        return self._asks.get(price, 0)
+
+    def get_bid_quantity(self, price):
+        return self._bids.get(price, 0)
+
+    def get_asks_cumulative_quantity(self, price):
+        """
+        :return: the total quantity of asks at a price lower or equal to the given price
+        """
+        if self._ask_cumulative_quantities is None:
+            self._ask_cumulative_quantities = OrderBookManager._get_cumulative_quantities(self._asks, self._ask_prices)
+        return self._ask_cumulative_quantities[bisect_right(self._ask_prices, price)]
+
+    def get_bids_cumulative_quantity(self, price):
+        """
+        :return: the total quantity of bids at a price higher or equal to the given price
+        """
+        if self._bid_cumulative_quantities is None:
+            self._bid_cumulative_quantities = OrderBookManager._get_cumulative_quantities(self._bids, self._bid_prices)
+        return self._bid_cumulative_quantities[-1] - \
+            self._bid_cumulative_quantities[bisect_left(self._bid_prices, price)]
+
+    def _set_asks(self, asks):
+        self._asks = {price_level[0]: price_level[1] for price_level in asks if price_level[1]}
+        self._ask_prices = sorted(self._asks)
+        self._ask_cumulative_quantities = None
+
+    def _set_bids(self, bids):
+        self._bids = {price_level[0]: price_level[1] for price_level in bids if price_level[1]}
+        self._bid_prices = sorted(self._bids)
+        self._bid_cumulative_quantities = None
+
+    @staticmethod
+    def _set_price_level(levels, prices, price, quantity):
+        if quantity:
+            if price not in levels:
+                insort(prices, price)
+            levels[price] = quantity
+        elif levels.pop(price, None) is not None:
+            del prices[bisect_left(prices, price)]
+
+    @staticmethod
+    def _get_cumulative_quantities(levels, prices):
+        # cumulative_quantities[i] is the total quantity of the i first prices
+        cumulative_quantities = [0]
+        cumulative_quantity = 0
+        for price in prices:
+            cumulative_quantity += levels[price]
+            cumulative_quantities.append(cumulative_quantity)
+        return cumulative_quantities
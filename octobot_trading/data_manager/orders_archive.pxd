@@ -0,0 +1,36 @@
+# cython: language_level=3
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+cimport numpy as np
+np.import_array()
+
+cdef class OrdersArchive:
+    cdef public int orders_count
+
+    cdef np.ndarray _values
+    cdef np.ndarray _label_codes
+    cdef list _order_ids
+
+    cdef list _labels
+    cdef dict _codes_by_label
+
+    cpdef void add_order(self, dict order_dict)
+    cpdef list get_orders(self, str symbol=*, double since=*, int limit=*)
+    cpdef void clear(self)
+
+    cdef int _get_label_code(self, object label)
+    cdef object _get_label(self, int index, int column)
+    cdef dict _get_order_dict(self, int index)
@@ -0,0 +1,136 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+
+from octobot_trading.enums import ExchangeConstantsOrderColumns as ECOC, FeePropertyColumns
+
+
+class OrdersArchive:
+    """
+    Append only columnar storage of orders that are not open anymore:
+    - numeric values are stored in a float64 array which capacity is doubled when full
+    - text values (symbol, status, type, side and fee currency) are stored as int32 codes of a shared labels list
+    Archived orders are given back as order dicts. Their fee only keeps its cost and currency.
+    """
+    INITIAL_CAPACITY = 256
+    NO_LABEL = -1
+
+    # numeric columns
+    PRICE = 0
+    AMOUNT = 1
+    FILLED = 2
+    COST = 3
+    TIMESTAMP = 4
+    FEE_COST = 5
+
+    # label columns
+    SYMBOL = 0
+    STATUS = 1
+    TYPE = 2
+    SIDE = 3
+    FEE_CURRENCY = 4
+
+    def __init__(self):
+        self.orders_count = 0
+        self._values = np.empty((self.INITIAL_CAPACITY, 6), dtype=np.float64)
+        self._label_codes = np.empty((self.INITIAL_CAPACITY, 5), dtype=np.int32)
+        self._order_ids = []
+
+        self._labels = []
+        self._codes_by_label = {}
+
+    def add_order(self, order_dict):
+        """
+        Archives the given order dict
+        """
+        if self.orders_count == self._values.shape[0]:
+            self._values = np.concatenate((self._values, np.empty_like(self._values)))
+            self._label_codes = np.concatenate((self._label_codes, np.empty_like(self._label_codes)))
+        fee = order_dict.get(ECOC.FEE.value, None) or {}
+        self._values[self.orders_count] = (
+            order_dict.get(ECOC.PRICE.value, np.nan),
+            order_dict.get(ECOC.AMOUNT.value, np.nan),
+            order_dict.get(ECOC.FILLED.value, np.nan),
+            order_dict.get(ECOC.COST.value, np.nan),
+            order_dict.get(ECOC.TIMESTAMP.value, np.nan),
+            fee.get(FeePropertyColumns.COST.value, np.nan)
+        )
+        self._label_codes[self.orders_count] = (
+            self._get_label_code(order_dict.get(ECOC.SYMBOL.value, None)),
+            self._get_label_code(order_dict.get(ECOC.STATUS.value, None)),
+            self._get_label_code(order_dict.get(ECOC.TYPE.value, None)),
+            self._get_label_code(order_dict.get(ECOC.SIDE.value, None)),
+            self._get_label_code(fee.get(FeePropertyColumns.CURRENCY.value, None))
+        )
+        self._order_ids.append(order_dict.get(ECOC.ID.value, None))
+        self.orders_count += 1
+
+    def get_orders(self, symbol=None, since=-1, limit=-1):
+        """
+        :return: the archived order dicts of symbol (when given) which timestamp is lower than since (when given),
+        in archive order
+        """
+        selected = np.ones(self.orders_count, dtype=bool)
+        if symbol is not None:
+            if symbol not in self._codes_by_label:
+                return []
+            selected &= self._label_codes[:self.orders_count, self.SYMBOL] == self._codes_by_label[symbol]
+        if since != -1:
+            selected &= self._values[:self.orders_count, self.TIMESTAMP] < since
+        selected_indexes = np.flatnonzero(selected)
+        if limit != -1:
+            selected_indexes = selected_indexes[:limit]
+        return [self._get_order_dict(index) for index in selected_indexes]
+
+    def clear(self):
+        self.orders_count = 0
+        self._values = np.empty((self.INITIAL_CAPACITY, 6), dtype=np.float64)
+        self._label_codes = np.empty((self.INITIAL_CAPACITY, 5), dtype=np.int32)
+        self._order_ids = []
+        self._labels = []
+        self._codes_by_label = {}
+
+    def _get_label_code(self, label):
+        if label is None:
+            return self.NO_LABEL
+        if label not in self._codes_by_label:
+            self._codes_by_label[label] = len(self._labels)
+            self._labels.append(label)
+        return self._codes_by_label[label]
+
+    def _get_label(self, index, column):
+        code = self._label_codes[index, column]
+        return None if code == self.NO_LABEL else self._labels[code]
+
+    def _get_order_dict(self, index):
+        values = self._values[index]
+        fee_currency = self._get_label(index, self.FEE_CURRENCY)
+        return {
+            ECOC.ID.value: self._order_ids[index],
+            ECOC.SYMBOL.value: self._get_label(index, self.SYMBOL),
+            ECOC.PRICE.value: float(values[self.PRICE]),
+            ECOC.STATUS.value: self._get_label(index, self.STATUS),
+            ECOC.TIMESTAMP.value: float(values[self.TIMESTAMP]),
+            ECOC.TYPE.value: self._get_label(index, self.TYPE),
+            ECOC.SIDE.value: self._get_label(index, self.SIDE),
+            ECOC.AMOUNT.value: float(values[self.AMOUNT]),
+            ECOC.COST.value: float(values[self.COST]),
+            ECOC.FILLED.value: float(values[self.FILLED]),
+            ECOC.FEE.value: None if fee_currency is None else {
+                FeePropertyColumns.COST.value: float(values[self.FEE_COST]),
+                FeePropertyColumns.CURRENCY.value: fee_currency
+            }
+        }
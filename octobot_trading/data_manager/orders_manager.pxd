@@ -15,6 +15,8 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 from octobot_trading.data.order cimport Order
+from octobot_trading.data_manager.orders_archive cimport OrdersArchive
+from octobot_trading.data_manager.orders_trigger_index cimport OrdersTriggerIndex
 from octobot_trading.exchanges.exchange_manager cimport ExchangeManager
 from octobot_trading.traders.trader cimport Trader
 from octobot_trading.util.initializable cimport Initializable
@@ -31,20 +33,43 @@ cdef class OrdersManager(Initializable):
 
     cdef public object orders
 
+    cdef dict _orders_by_symbol
+    cdef dict _orders_by_status
+    cdef dict _orders_by_symbol_and_status
+    cdef dict _orders_index_keys
+    cdef dict _orders_trigger_indexes
+
+    cdef OrdersArchive _orders_archive
+
     cdef void _reset_orders(self)
     cdef void _check_orders_size(self)
     cpdef Order _create_order_from_raw(self, dict raw_order)
     cdef bint _update_order_from_raw(self, Order order, dict raw_order)
-    cdef void _remove_oldest_orders(self, int nb_to_remove)
+    cdef void _archive_oldest_closed_orders(self, int nb_to_archive)
+    cdef void _archive_order(self, Order order)
     cdef list _select_orders(self, object state=*, str symbol=*, int since=*, int limit=*)
+    cdef void _add_order(self, str order_id, Order order)
+    cdef Order _remove_order(self, str order_id)
+    cdef void _index_order(self, str order_id, Order order)
+    cdef void _unindex_order(self, str order_id)
+    cdef object _get_indexed_orders(self, object state, str symbol)
+    cdef void _refresh_indexed_orders(self, object state, str symbol)
+    cdef void _index_order_trigger(self, str order_id, Order order)
+    cdef void _unindex_order_trigger(self, str symbol, str order_id)
+
+    @staticmethod
+    cdef void _remove_from_index(dict index, object key, str order_id)
 
     cpdef void update_order_attribute(self, str order_id, str key, object value)
     cpdef Order get_order(self, str order_id)
     cpdef tuple upsert_order(self, str order_id, dict raw_order)
     cpdef bint upsert_order_close(self, str order_id, dict raw_order)
     cpdef bint upsert_order_instance(self, Order order)
+    cpdef void update_order_index(self, Order order)
     cpdef void remove_order_instance(self, Order order)
     cpdef list get_all_orders(self, str symbol=*, int since=*, int limit=*)
     cpdef list get_open_orders(self, str symbol=*, int since=*, int limit=*)
     cpdef list get_closed_orders(self, str symbol=*, int since=*, int limit=*)
+    cpdef list get_archived_orders(self, str symbol=*, int since=*, int limit=*)
+    cpdef list get_orders_to_update(self, str symbol, double min_price, double max_price)
     cpdef void clear(self)
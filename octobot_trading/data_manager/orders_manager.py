@@ -17,11 +17,23 @@ from collections import OrderedDict
 
 from octobot_commons.logging.logging_util import get_logger
 from octobot_trading.data.order import Order
+from octobot_trading.data_manager.orders_archive import OrdersArchive
+from octobot_trading.data_manager.orders_trigger_index import OrdersTriggerIndex
 from octobot_trading.enums import OrderStatus
 from octobot_trading.util.initializable import Initializable
 
 
 class OrdersManager(Initializable):
+    """
+    Stores orders by id and maintains secondary indexes by symbol, by status and by (symbol, status) to select
+    orders without scanning every stored order.
+    Status transitions made directly on an order instance are detected when this order is selected and its
+    indexes are then updated.
+    Orders are also indexed by symbol and trigger price in OrdersTriggerIndex to select the simulated orders that
+    can be filled by last prices.
+    When more than MAX_ORDERS_COUNT orders are stored, the oldest orders that are not open anymore are moved to an
+    OrdersArchive: open orders are never removed. Orders removed from this manager are also archived.
+    """
     MAX_ORDERS_COUNT = 2000
 
     def __init__(self, config, trader, exchange_manager):
@@ -31,6 +43,17 @@ class OrdersManager(Initializable):
         self.orders_initialized = False  # TODO
         self.orders = OrderedDict()
 
+        # secondary indexes: key -> {order_id: order}
+        self._orders_by_symbol = {}
+        self._orders_by_status = {}
+        self._orders_by_symbol_and_status = {}
+        # order_id -> (symbol, status) the order is indexed with
+        self._orders_index_keys = {}
+        # symbol -> OrdersTriggerIndex
+        self._orders_trigger_indexes = {}
+
+        self._orders_archive = OrdersArchive()
+
     async def initialize_impl(self):
         self._reset_orders()
 
@@ -46,35 +69,66 @@ class OrdersManager(Initializable):
     def get_closed_orders(self, symbol=None, since=-1, limit=-1):
         return self._select_orders(OrderStatus.CLOSED, symbol, since, limit)
 
+    def get_archived_orders(self, symbol=None, since=-1, limit=-1):
+        """
+        :return: the dict representation of the orders that have been removed from this manager
+        """
+        return self._orders_archive.get_orders(symbol=symbol, since=since, limit=limit)
+
+    def get_orders_to_update(self, symbol, min_price, max_price):
+        """
+        :return: the open orders of symbol that might be filled by last prices which min and max are min_price and
+        max_price: triggered limit and stop orders and orders that are not indexed by price
+        """
+        if symbol not in self._orders_trigger_indexes:
+            return []
+        return [
+            order
+            for order in self._orders_trigger_indexes[symbol].get_triggered_orders(min_price, max_price)
+            if order.status == OrderStatus.OPEN
+        ]
+
     def get_order(self, order_id):
         return self.orders[order_id]
 
     def upsert_order(self, order_id, raw_order) -> (bool, bool):
         if order_id not in self.orders:
-            self.orders[order_id] = self._create_order_from_raw(raw_order)
+            self._add_order(order_id, self._create_order_from_raw(raw_order))
             self._check_orders_size()
             return True, False
-        return self._update_order_from_raw(self.orders[order_id], raw_order), True
+        order = self.orders[order_id]
+        changed = self._update_order_from_raw(order, raw_order)
+        self._index_order(order_id, order)
+        self._index_order_trigger(order_id, order)
+        return changed, True
 
     def upsert_order_close(self, order_id, raw_order) -> bool:
         if order_id in self.orders:
             self._update_order_from_raw(self.orders[order_id], raw_order)
             # TODO order -> trade
-            self.orders.pop(order_id)
+            self._archive_order(self._remove_order(order_id))
             return True
         return False
 
     def upsert_order_instance(self, order) -> bool:
         if order.order_id not in self.orders:
-            self.orders[order.order_id] = order
+            self._add_order(order.order_id, order)
             self._check_orders_size()
             return True
         # TODO
         return False
 
+    def update_order_index(self, order):
+        """
+        Updates the order secondary indexes after a change of its symbol, status, type or price
+        """
+        if order.order_id in self.orders:
+            self._index_order(order.order_id, order)
+            self._index_order_trigger(order.order_id, order)
+
     def remove_order_instance(self, order):
         if order.order_id in self.orders:
-            self.orders.pop(order.order_id, None)
+            self._archive_order(self._remove_order(order.order_id))
             order.clear()
         else:
             self.logger.warning(f"Attempt to remove an order that is not in orders_manager: {order.order_type.name} "
@@ -85,10 +139,19 @@ class OrdersManager(Initializable):
     def _reset_orders(self):
         self.orders_initialized = False
         self.orders = OrderedDict()
+        self._orders_by_symbol = {}
+        self._orders_by_status = {}
+        self._orders_by_symbol_and_status = {}
+        self._orders_index_keys = {}
+        self._orders_trigger_indexes = {}
+        self._orders_archive = OrdersArchive()
 
     def _check_orders_size(self):
         if len(self.orders) > self.MAX_ORDERS_COUNT:
-            self._remove_oldest_orders(int(self.MAX_ORDERS_COUNT / 2))
+            self._archive_oldest_closed_orders(int(self.MAX_ORDERS_COUNT / 2))
+            if len(self.orders) > self.MAX_ORDERS_COUNT:
+                self.logger.warning(f"{len(self.orders)} orders are stored: more than the {self.MAX_ORDERS_COUNT} "
+                                    f"allowed orders are open")
 
     def _create_order_from_raw(self, raw_order):
         order = Order(self.trader)
@@ -98,21 +161,116 @@ class OrdersManager(Initializable):
     def _update_order_from_raw(self, order, raw_order):
         return order.update_from_raw(raw_order)
 
+    def _add_order(self, order_id, order):
+        self.orders[order_id] = order
+        self._index_order(order_id, order)
+        self._index_order_trigger(order_id, order)
+
+    def _remove_order(self, order_id):
+        self._unindex_order(order_id)
+        return self.orders.pop(order_id, None)
+
+    def _index_order(self, order_id, order):
+        index_key = (order.symbol, order.status)
+        previous_index_key = self._orders_index_keys.get(order_id, None)
+        if previous_index_key == index_key:
+            return
+        symbol, status = index_key
+        previous_symbol, previous_status = previous_index_key if previous_index_key is not None else (None, None)
+        if previous_index_key is not None:
+            # only move the order in the indexes that changed to keep its position in the other ones
+            if previous_symbol != symbol:
+                OrdersManager._remove_from_index(self._orders_by_symbol, previous_symbol, order_id)
+                self._unindex_order_trigger(previous_symbol, order_id)
+                self._index_order_trigger(order_id, order)
+            if previous_status != status:
+                OrdersManager._remove_from_index(self._orders_by_status, previous_status, order_id)
+            OrdersManager._remove_from_index(self._orders_by_symbol_and_status, previous_index_key, order_id)
+        if previous_index_key is None or previous_symbol != symbol:
+            self._orders_by_symbol.setdefault(symbol, {})[order_id] = order
+        if previous_index_key is None or previous_status != status:
+            self._orders_by_status.setdefault(status, {})[order_id] = order
+        self._orders_by_symbol_and_status.setdefault(index_key, {})[order_id] = order
+        self._orders_index_keys[order_id] = index_key
+
+    def _unindex_order(self, order_id):
+        index_key = self._orders_index_keys.pop(order_id, None)
+        if index_key is not None:
+            symbol, status = index_key
+            self._unindex_order_trigger(symbol, order_id)
+            OrdersManager._remove_from_index(self._orders_by_symbol, symbol, order_id)
+            OrdersManager._remove_from_index(self._orders_by_status, status, order_id)
+            OrdersManager._remove_from_index(self._orders_by_symbol_and_status, index_key, order_id)
+
+    def _index_order_trigger(self, order_id, order):
+        if order.symbol not in self._orders_trigger_indexes:
+            self._orders_trigger_indexes[order.symbol] = OrdersTriggerIndex()
+        self._orders_trigger_indexes[order.symbol].add_order(order_id, order)
+
+    def _unindex_order_trigger(self, symbol, order_id):
+        orders_trigger_index = self._orders_trigger_indexes.get(symbol, None)
+        if orders_trigger_index is not None:
+            orders_trigger_index.remove_order(order_id)
+
+    @staticmethod
+    def _remove_from_index(index, key, order_id):
+        indexed_orders = index.get(key, None)
+        if indexed_orders is not None:
+            indexed_orders.pop(order_id, None)
+            if not indexed_orders:
+                index.pop(key)
+
+    def _get_indexed_orders(self, state, symbol):
+        if state is None:
+            return self.orders if symbol is None else self._orders_by_symbol.get(symbol, {})
+        if symbol is None:
+            return self._orders_by_status.get(state, {})
+        return self._orders_by_symbol_and_status.get((symbol, state), {})
+
+    def _refresh_indexed_orders(self, state, symbol):
+        """
+        Re-indexes the selected orders which status has been directly changed on their instance
+        """
+        stale_orders = [
+            (order_id, order)
+            for order_id, order in self._get_indexed_orders(state, symbol).items()
+            if self._orders_index_keys[order_id] != (order.symbol, order.status)
+        ]
+        for order_id, order in stale_orders:
+            self._index_order(order_id, order)
+
     def _select_orders(self, state=None, symbol=None, since=-1, limit=-1):
+        if state == OrderStatus.OPEN:
+            # orders become open only through this manager: only open orders can be stale
+            self._refresh_indexed_orders(state, symbol)
+        elif state is not None:
+            self._refresh_indexed_orders(None, symbol)
         orders = [
             order
-            for order in self.orders.values()
-            if (
-                    (state is None or order.status == state) and
-                    (symbol is None or (symbol and order.symbol == symbol)) and
-                    (since == -1 or (since and order.timestamp < since))
-            )
+            for order in self._get_indexed_orders(state, symbol).values()
+            if since == -1 or (since and order.timestamp < since)
         ]
         return orders if limit == -1 else orders[0:limit]
 
-    def _remove_oldest_orders(self, nb_to_remove):
-        for _ in range(nb_to_remove):
-            self.orders.popitem(last=False)
+    def _archive_oldest_closed_orders(self, nb_to_archive):
+        self._refresh_indexed_orders(OrderStatus.OPEN, None)
+        if len(self._orders_by_status.get(OrderStatus.OPEN, {})) == len(self.orders):
+            # only open orders: nothing to archive
+            return
+        oldest_closed_order_ids = []
+        for order_id, order in self.orders.items():
+            if order.status != OrderStatus.OPEN:
+                oldest_closed_order_ids.append(order_id)
+                if len(oldest_closed_order_ids) == nb_to_archive:
+                    break
+        for order_id in oldest_closed_order_ids:
+            self._archive_order(self._remove_order(order_id))
+
+    def _archive_order(self, order):
+        try:
+            self._orders_archive.add_order(order.to_dict())
+        except AttributeError as e:
+            self.logger.error(f"Failed to archive order {order.order_id}: {e}")
 
     def clear(self):
         for order in self.orders.values():
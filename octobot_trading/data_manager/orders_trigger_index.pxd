@@ -0,0 +1,38 @@
+# cython: language_level=3
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+
+cdef class OrdersTriggerIndex:
+    cdef list _buy_limit_triggers
+    cdef list _sell_limit_triggers
+    cdef list _stop_loss_triggers
+    cdef int _stop_losses_count
+
+    cdef dict _order_triggers
+    cdef dict _orders
+    cdef dict _not_indexed_orders
+    cdef long _sequence
+
+    cpdef void add_order(self, str order_id, object order)
+    cpdef void remove_order(self, str order_id)
+    cpdef list get_triggered_orders(self, double min_price, double max_price)
+    cpdef void clear(self)
+
+    cdef bint _is_indexed_stop_loss_trigger(self, tuple trigger)
+    cdef void _compact_stop_loss_triggers(self)
+
+    @staticmethod
+    cdef void _remove_trigger(list triggers, tuple trigger)
@@ -0,0 +1,139 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+from bisect import bisect_left, bisect_right, insort
+from heapq import heapify, heappop, heappush
+from math import inf, isnan
+
+from octobot_trading.enums import TraderOrderType
+
+
+class OrdersTriggerIndex:
+    """
+    Indexes the open orders of a symbol by their trigger price to only select the simulated orders that can be filled
+    by a batch of last prices:
+    - buy limit orders are filled by a lower price: the ones which price is above the batch min price are selected
+    - sell limit orders are filled by a higher price: the ones which price is below the batch max price are selected
+    - stop loss orders are triggered by a lower price: they are stored in a max heap and popped while their price is
+    above the batch min price
+    Other orders (market orders, real exchange orders ...) can't be indexed by price and are always selected.
+    """
+
+    def __init__(self):
+        # ascending (price, sequence, order_id) triggers
+        self._buy_limit_triggers = []
+        self._sell_limit_triggers = []
+
+        # (-price, sequence, order_id) max heap, triggers of removed orders are lazily discarded
+        self._stop_loss_triggers = []
+        self._stop_losses_count = 0
+
+        # order_id -> (triggers list, trigger) of the indexed order
+        self._order_triggers = {}
+        self._orders = {}
+        self._not_indexed_orders = {}
+        self._sequence = 0
+
+    def add_order(self, order_id, order):
+        """
+        Adds the given order or updates its trigger when already added
+        """
+        self.remove_order(order_id)
+        self._sequence += 1
+        if order.order_type is TraderOrderType.BUY_LIMIT and order.simulated:
+            triggers, trigger = self._buy_limit_triggers, (order.origin_price, self._sequence, order_id)
+            insort(triggers, trigger)
+        elif order.order_type is TraderOrderType.SELL_LIMIT and order.simulated:
+            triggers, trigger = self._sell_limit_triggers, (order.origin_price, self._sequence, order_id)
+            insort(triggers, trigger)
+        elif order.order_type is TraderOrderType.STOP_LOSS:
+            triggers, trigger = self._stop_loss_triggers, (-order.origin_price, self._sequence, order_id)
+            heappush(triggers, trigger)
+            self._stop_losses_count += 1
+        else:
+            self._not_indexed_orders[order_id] = order
+            return
+        self._order_triggers[order_id] = (triggers, trigger)
+        self._orders[order_id] = order
+
+    def remove_order(self, order_id):
+        if self._not_indexed_orders.pop(order_id, None) is not None:
+            return
+        order_trigger = self._order_triggers.pop(order_id, None)
+        if order_trigger is not None:
+            self._orders.pop(order_id)
+            triggers, trigger = order_trigger
+            if triggers is self._stop_loss_triggers:
+                self._stop_losses_count -= 1
+                if len(self._stop_loss_triggers) > 2 * self._stop_losses_count:
+                    self._compact_stop_loss_triggers()
+            else:
+                OrdersTriggerIndex._remove_trigger(triggers, trigger)
+
+    def get_triggered_orders(self, min_price, max_price):
+        """
+        :return: the orders that might be filled by a batch of prices which min and max are min_price and max_price
+        """
+        orders = list(self._not_indexed_orders.values())
+        if isnan(min_price) or isnan(max_price):
+            return orders
+
+        # buy limit orders which price is strictly above min_price, highest price first
+        first_triggered_index = bisect_right(self._buy_limit_triggers, (min_price, inf))
+        orders += [self._orders[trigger[2]]
+                   for trigger in reversed(self._buy_limit_triggers[first_triggered_index:])]
+
+        # sell limit orders which price is strictly below max_price, lowest price first
+        last_triggered_index = bisect_left(self._sell_limit_triggers, (max_price,))
+        orders += [self._orders[trigger[2]]
+                   for trigger in self._sell_limit_triggers[:last_triggered_index]]
+
+        # stop loss orders which price is strictly above min_price, highest price first
+        triggered_stop_losses = []
+        while self._stop_loss_triggers and -self._stop_loss_triggers[0][0] > min_price:
+            trigger = heappop(self._stop_loss_triggers)
+            if self._is_indexed_stop_loss_trigger(trigger):
+                triggered_stop_losses.append(trigger)
+        for trigger in triggered_stop_losses:
+            # triggered orders stay indexed until they are removed
+            heappush(self._stop_loss_triggers, trigger)
+            orders.append(self._orders[trigger[2]])
+        return orders
+
+    def clear(self):
+        self._buy_limit_triggers = []
+        self._sell_limit_triggers = []
+        self._stop_loss_triggers = []
+        self._stop_losses_count = 0
+        self._order_triggers = {}
+        self._orders = {}
+        self._not_indexed_orders = {}
+
+    def _is_indexed_stop_loss_trigger(self, trigger):
+        order_trigger = self._order_triggers.get(trigger[2], None)
+        return order_trigger is not None and order_trigger[1] == trigger
+
+    def _compact_stop_loss_triggers(self):
+        # in place to keep the triggers list referenced by indexed orders
+        self._stop_loss_triggers[:] = [trigger
+                                       for trigger in self._stop_loss_triggers
+                                       if self._is_indexed_stop_loss_trigger(trigger)]
+        heapify(self._stop_loss_triggers)
+
+    @staticmethod
+    def _remove_trigger(triggers, trigger):
+        trigger_index = bisect_left(triggers, trigger)
+        if trigger_index < len(triggers) and triggers[trigger_index] == trigger:
+            del triggers[trigger_index]
@@ -23,9 +23,22 @@ cdef class PricesManager(Initializable):
     cdef public object prices_initialized_event
 
     cdef public double mark_price
+    cdef public object mark_price_formula
+
+    cdef object _window_prices
+    cdef object _window_volumes
+    cdef double _window_prices_sum
+    cdef double _window_costs_sum
+    cdef double _window_volumes_sum
+    cdef int _window_evictions_count
+    cdef double _ema_price
+    cdef double _ema_alpha
 
     cdef void __reset_prices(self)
+    cdef void _add_recent_trade(self, double price, double volume)
+    cdef void _recompute_window_sums(self)
 
     cpdef list set_mark_price(self, double mark_price)
-
-cpdef double calculate_mark_price_from_recent_trade_prices(list recent_trade_prices)
+    cpdef void set_mark_price_formula(self, object mark_price_formula)
+    cpdef object update_mark_price_from_recent_trades(self, object recent_trades)
+    cpdef object update_mark_price_from_order_book_ticker(self, object ask_price, object bid_price)
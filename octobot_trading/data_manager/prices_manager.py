@@ -14,18 +14,37 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 from asyncio import Event, wait_for
+from collections import deque
+from math import fsum, isnan, nan
+from operator import mul
 
 from octobot_commons.logging.logging_util import get_logger
+
+from octobot_trading.enums import MarkPriceFormulas, ExchangeConstantsOrderColumns as ECOC
 from octobot_trading.util.initializable import Initializable
 
 
 class PricesManager(Initializable):
     MARK_PRICE_TIMEOUT = 60
+    MARK_PRICE_WINDOW_SIZE = 100
+    MARK_PRICE_EMA_PERIOD = 20
 
-    def __init__(self):
+    def __init__(self, mark_price_formula=MarkPriceFormulas.MEAN):
         super().__init__()
         self.logger = get_logger(self.__class__.__name__)
         self.mark_price = 0
+        self.mark_price_formula = mark_price_formula
+
+        # mark price engine state: every recent trade updates it in O(1)
+        self._window_prices = deque()
+        self._window_volumes = deque()
+        self._window_prices_sum = 0
+        self._window_costs_sum = 0
+        self._window_volumes_sum = 0
+        # running sums are recomputed every MARK_PRICE_WINDOW_SIZE evictions to discard float cancellation errors
+        self._window_evictions_count = 0
+        self._ema_price = nan
+        self._ema_alpha = 2 / (self.MARK_PRICE_EMA_PERIOD + 1)
 
         # warning: should only be created in the async loop thread
         self.prices_initialized_event = Event()
@@ -42,9 +61,67 @@ class PricesManager(Initializable):
             await wait_for(self.prices_initialized_event.wait(), timeout)
         return self.mark_price
 
-    def __reset_prices(self):
-        self.mark_price = 0
+    def set_mark_price_formula(self, mark_price_formula):
+        self.mark_price_formula = mark_price_formula
+
+    def update_mark_price_from_recent_trades(self, recent_trades):
+        """
+        Feed the mark price engine with new recent trades
+        :param recent_trades: the new recent trades
+        :return: the mark price computed by the selected formula or None when it does not use recent trades
+        """
+        for recent_trade in recent_trades:
+            self._add_recent_trade(float(recent_trade[ECOC.PRICE.value]),
+                                   float(recent_trade.get(ECOC.AMOUNT.value) or 0))
+        if self.mark_price_formula is MarkPriceFormulas.MID_PRICE or not self._window_prices:
+            return None
+        if self.mark_price_formula is MarkPriceFormulas.EMA:
+            return self._ema_price
+        if self.mark_price_formula is MarkPriceFormulas.VWAP and self._window_volumes_sum > 0:
+            return self._window_costs_sum / self._window_volumes_sum
+        return self._window_prices_sum / len(self._window_prices)
 
+    def update_mark_price_from_order_book_ticker(self, ask_price, bid_price):
+        """
+        Compute the mark price from the order book ticker
+        :return: the order book mid price or None when the selected formula does not use the order book ticker
+        """
+        if self.mark_price_formula is not MarkPriceFormulas.MID_PRICE or not ask_price or not bid_price:
+            return None
+        return (float(ask_price) + float(bid_price)) / 2
 
-def calculate_mark_price_from_recent_trade_prices(recent_trade_prices):
-    return sum(recent_trade_prices) / len(recent_trade_prices)
+    def _add_recent_trade(self, price, volume):
+        if isnan(price):
+            return
+        if len(self._window_prices) >= self.MARK_PRICE_WINDOW_SIZE:
+            oldest_price = self._window_prices.popleft()
+            oldest_volume = self._window_volumes.popleft()
+            self._window_prices_sum -= oldest_price
+            self._window_costs_sum -= oldest_price * oldest_volume
+            self._window_volumes_sum -= oldest_volume
+            self._window_evictions_count += 1
+        self._window_prices.append(price)
+        self._window_volumes.append(volume)
+        self._window_prices_sum += price
+        self._window_costs_sum += price * volume
+        self._window_volumes_sum += volume
+        if self._window_evictions_count >= self.MARK_PRICE_WINDOW_SIZE:
+            self._recompute_window_sums()
+        self._ema_price = price if isnan(self._ema_price) \
+            else self._ema_price + self._ema_alpha * (price - self._ema_price)
+
+    def _recompute_window_sums(self):
+        self._window_prices_sum = fsum(self._window_prices)
+        self._window_costs_sum = fsum(map(mul, self._window_prices, self._window_volumes))
+        self._window_volumes_sum = fsum(self._window_volumes)
+        self._window_evictions_count = 0
+
+    def __reset_prices(self):
+        self.mark_price = 0
+        self._window_prices.clear()
+        self._window_volumes.clear()
+        self._window_prices_sum = 0
+        self._window_costs_sum = 0
+        self._window_volumes_sum = 0
+        self._window_evictions_count = 0
+        self._ema_price = nan
@@ -22,7 +22,13 @@ cdef class RecentTradesManager(Initializable):
     cdef public object recent_trades
     cdef public object liquidations
 
+    cdef set _recent_trades_keys
+
     cdef void _reset_recent_trades(self)
+    cdef list _add_new_trades(self, list recent_trades)
+
+    @staticmethod
+    cdef object _get_recent_trade_key(dict recent_trade)
 
     cpdef list set_all_recent_trades(self, list recent_trades)
     cpdef list add_new_trades(self, list recent_trades)
@@ -16,10 +16,16 @@
 from collections import deque
 
 from octobot_commons.logging.logging_util import get_logger
+from octobot_trading.enums import ExchangeConstantsOrderColumns as ECOC
 from octobot_trading.util.initializable import Initializable
 
 
 class RecentTradesManager(Initializable):
+    """
+    Stores the last MAX_RECENT_TRADES_COUNT recent trades.
+    Recent trades are deduplicated using a companion set of their exchange id, or (timestamp, price, amount) when
+    they don't have any id. This set is bounded like recent_trades: keys of dropped recent trades are removed.
+    """
     MAX_RECENT_TRADES_COUNT = 100
     MAX_LIQUIDATIONS_COUNT = 20
 
@@ -28,30 +34,35 @@ class RecentTradesManager(Initializable):
         self.logger = get_logger(self.__class__.__name__)
         self.recent_trades = deque(maxlen=self.MAX_RECENT_TRADES_COUNT)
         self.liquidations = deque(maxlen=self.MAX_LIQUIDATIONS_COUNT)
+        self._recent_trades_keys = set()
         self._reset_recent_trades()
 
     async def initialize_impl(self):
         self._reset_recent_trades()
 
     def set_all_recent_trades(self, recent_trades):
+        """
+        Replaces the stored recent trades by the given ones
+        :return: the stored recent trades that were not stored before this call
+        """
         if recent_trades:
-            self.recent_trades = list(set(recent_trades))
-            return self.recent_trades
+            previous_recent_trades_keys = self._recent_trades_keys
+            self.recent_trades = deque(maxlen=self.MAX_RECENT_TRADES_COUNT)
+            self._recent_trades_keys = set()
+            self._add_new_trades(recent_trades)
+            return [
+                recent_trade
+                for recent_trade in self.recent_trades
+                if RecentTradesManager._get_recent_trade_key(recent_trade) not in previous_recent_trades_keys
+            ]
 
     def add_new_trades(self, recent_trades):
         if recent_trades:
-            new_recent_trades: list = [
-                trade
-                for trade in recent_trades
-                if trade not in self.recent_trades]
-            self.recent_trades.extend(new_recent_trades)
-            return new_recent_trades
+            return self._add_new_trades(recent_trades)
 
     def add_recent_trade(self, recent_trade):
         try:
-            if recent_trade not in self.recent_trades:
-                self.recent_trades.append(recent_trade)
-                return [recent_trade]
+            return self._add_new_trades([recent_trade])
         except ValueError as e:
             self.logger.error(f"Impossible to add new recent trade ({recent_trade} : {e})")
         return []
@@ -65,6 +76,30 @@ class RecentTradesManager(Initializable):
             self.liquidations.extend(new_liquidations)
             return new_liquidations
 
+    def _add_new_trades(self, recent_trades):
+        new_recent_trades = []
+        for recent_trade in recent_trades:
+            recent_trade_key = RecentTradesManager._get_recent_trade_key(recent_trade)
+            if recent_trade_key not in self._recent_trades_keys:
+                if len(self.recent_trades) == self.recent_trades.maxlen:
+                    # the oldest recent trade will be dropped by append
+                    self._recent_trades_keys.discard(
+                        RecentTradesManager._get_recent_trade_key(self.recent_trades[0]))
+                self.recent_trades.append(recent_trade)
+                self._recent_trades_keys.add(recent_trade_key)
+                new_recent_trades.append(recent_trade)
+        return new_recent_trades
+
+    @staticmethod
+    def _get_recent_trade_key(recent_trade):
+        recent_trade_id = recent_trade.get(ECOC.ID.value, None)
+        if recent_trade_id is not None:
+            return recent_trade_id
+        return (recent_trade.get(ECOC.TIMESTAMP.value, None),
+                recent_trade.get(ECOC.PRICE.value, None),
+                recent_trade.get(ECOC.AMOUNT.value, None))
+
     def _reset_recent_trades(self):
         self.recent_trades = deque(maxlen=self.MAX_RECENT_TRADES_COUNT)
         self.liquidations = deque(maxlen=self.MAX_LIQUIDATIONS_COUNT)
+        self._recent_trades_keys = set()
@@ -0,0 +1,39 @@
+# cython: language_level=3
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+from octobot_trading.data.trade cimport Trade
+
+cimport numpy as np
+np.import_array()
+
+cdef class TradesHistory:
+    cdef public int trades_count
+
+    cdef dict _columns
+    cdef set _trade_ids
+    cdef dict _total_paid_fees
+    cdef list _labels
+    cdef dict _ids_by_label
+
+    cpdef bint add_trade(self, Trade trade)
+    cpdef dict get_total_paid_fees(self)
+    cpdef dict get_paid_fees(self, str symbol=*, double since=*, double until=*)
+    cpdef np.ndarray get_trades_indexes(self, str symbol=*, double since=*, double until=*)
+    cpdef dict get_trades(self, str symbol=*, double since=*, double until=*)
+    cpdef void clear(self)
+
+    cdef void _reset_columns(self)
+    cdef int _get_label_id(self, object label)
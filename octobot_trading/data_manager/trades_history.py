@@ -0,0 +1,160 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+
+from octobot_trading.enums import FeePropertyColumns, OrderStatus
+
+
+class TradesHistory:
+    """
+    Append only columnar storage of every recorded trade:
+    - each trade field is stored in its own numpy array which capacity is doubled when full
+    - symbols, sides and fee currencies are stored as int32 ids of a shared labels list
+    Paid fees totals are updated for each recorded trade. Trades can be selected by symbol and time range in a
+    vectorized way.
+    """
+    INITIAL_CAPACITY = 1024
+    NO_LABEL = -1
+
+    TIMESTAMP = "timestamp"
+    SYMBOL = "symbol"
+    SIDE = "side"
+    PRICE = "price"
+    QUANTITY = "quantity"
+    FEE_COST = "fee_cost"
+    FEE_CURRENCY = "fee_currency"
+
+    COLUMNS_TYPES = {
+        TIMESTAMP: np.float64,
+        SYMBOL: np.int32,
+        SIDE: np.int32,
+        PRICE: np.float64,
+        QUANTITY: np.float64,
+        FEE_COST: np.float64,
+        FEE_CURRENCY: np.int32,
+    }
+    LABEL_COLUMNS = (SYMBOL, SIDE, FEE_CURRENCY)
+
+    def __init__(self):
+        self.trades_count = 0
+        self._columns = {}
+        self._trade_ids = set()
+        self._total_paid_fees = {}
+        self._labels = []
+        self._ids_by_label = {}
+        self._reset_columns()
+
+    def add_trade(self, trade) -> bool:
+        """
+        Records the given trade
+        :return: False when this trade has already been recorded, trades without id are always recorded
+        """
+        if trade.trade_id is not None and trade.trade_id in self._trade_ids:
+            return False
+        if self.trades_count == self._columns[self.TIMESTAMP].size:
+            for name, column in self._columns.items():
+                self._columns[name] = np.concatenate((column, np.empty_like(column)))
+        fee_cost, fee_currency = np.nan, None
+        if trade.fee is not None:
+            fee_cost = trade.fee[FeePropertyColumns.COST.value]
+            fee_currency = trade.fee[FeePropertyColumns.CURRENCY.value]
+            self._total_paid_fees[fee_currency] = self._total_paid_fees.get(fee_currency, 0) + fee_cost
+        index = self.trades_count
+        self._columns[self.TIMESTAMP][index] = trade.executed_time \
+            if trade.status is not OrderStatus.CANCELED else trade.canceled_time
+        self._columns[self.SYMBOL][index] = self._get_label_id(trade.symbol)
+        self._columns[self.SIDE][index] = self._get_label_id(trade.side.value if trade.side is not None else None)
+        self._columns[self.PRICE][index] = trade.executed_price
+        self._columns[self.QUANTITY][index] = trade.executed_quantity
+        self._columns[self.FEE_COST][index] = fee_cost
+        self._columns[self.FEE_CURRENCY][index] = self._get_label_id(fee_currency)
+        if trade.trade_id is not None:
+            self._trade_ids.add(trade.trade_id)
+        self.trades_count += 1
+        return True
+
+    def get_total_paid_fees(self) -> dict:
+        """
+        :return: the paid fees of every recorded trade by currency
+        """
+        return dict(self._total_paid_fees)
+
+    def get_paid_fees(self, symbol=None, since=-1, until=-1) -> dict:
+        """
+        :return: the paid fees by currency of the trades selected by get_trades_indexes
+        """
+        if symbol is None and since == -1 and until == -1:
+            return self.get_total_paid_fees()
+        selected_indexes = self.get_trades_indexes(symbol=symbol, since=since, until=until)
+        fee_currencies = self._columns[self.FEE_CURRENCY][selected_indexes]
+        with_fee = fee_currencies != self.NO_LABEL
+        fee_totals = np.bincount(fee_currencies[with_fee],
+                                 weights=self._columns[self.FEE_COST][selected_indexes][with_fee])
+        return {
+            self._labels[label_id]: float(fee_totals[label_id])
+            for label_id in np.unique(fee_currencies[with_fee])
+        }
+
+    def get_trades_indexes(self, symbol=None, since=-1, until=-1) -> np.ndarray:
+        """
+        :return: the indexes of the recorded trades of symbol (when given) which timestamp is in [since, until[
+        (each bound being ignored when -1)
+        """
+        selected = np.ones(self.trades_count, dtype=bool)
+        if symbol is not None:
+            if symbol not in self._ids_by_label:
+                return np.empty(0, dtype=np.intp)
+            selected &= self._columns[self.SYMBOL][:self.trades_count] == self._ids_by_label[symbol]
+        timestamps = self._columns[self.TIMESTAMP][:self.trades_count]
+        if since != -1:
+            selected &= timestamps >= since
+        if until != -1:
+            selected &= timestamps < until
+        return np.flatnonzero(selected)
+
+    def get_trades(self, symbol=None, since=-1, until=-1) -> dict:
+        """
+        :return: the columns of the trades selected by get_trades_indexes: label columns are given as labels
+        """
+        selected_indexes = self.get_trades_indexes(symbol=symbol, since=since, until=until)
+        labels = np.array(self._labels + [None], dtype=object)
+        return {
+            # NO_LABEL (-1) ids are giving the last labels element: None
+            name: labels[column[selected_indexes]] if name in self.LABEL_COLUMNS else column[selected_indexes]
+            for name, column in self._columns.items()
+        }
+
+    def clear(self):
+        self.trades_count = 0
+        self._trade_ids = set()
+        self._total_paid_fees = {}
+        self._labels = []
+        self._ids_by_label = {}
+        self._reset_columns()
+
+    def _reset_columns(self):
+        self._columns = {
+            name: np.empty(self.INITIAL_CAPACITY, dtype=column_type)
+            for name, column_type in self.COLUMNS_TYPES.items()
+        }
+
+    def _get_label_id(self, label):
+        if label is None:
+            return self.NO_LABEL
+        if label not in self._ids_by_label:
+            self._ids_by_label[label] = len(self._labels)
+            self._labels.append(label)
+        return self._ids_by_label[label]
@@ -15,6 +15,7 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 from octobot_trading.data.trade cimport Trade
+from octobot_trading.data_manager.trades_history cimport TradesHistory
 from octobot_trading.util.initializable cimport Initializable
 
 
@@ -24,11 +25,13 @@ cdef class TradesManager(Initializable):
     cdef object trader
 
     cdef public object trades
+    cdef public TradesHistory trades_history
 
     cdef dict config
 
     cdef public bint trades_initialized
 
+    cdef void _add_trade(self, str trade_id, Trade trade)
     cdef void _check_trades_size(self)
     cdef void _reset_trades(self)
     cdef void _remove_oldest_trades(self, int nb_to_remove)
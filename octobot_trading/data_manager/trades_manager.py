@@ -17,12 +17,16 @@ from collections import OrderedDict
 
 from octobot_commons.logging.logging_util import get_logger
 
-from octobot_trading.enums import FeePropertyColumns
+from octobot_trading.data_manager.trades_history import TradesHistory
 from octobot_trading.trades.trade_factory import create_trade_instance_from_raw
 from octobot_trading.util.initializable import Initializable
 
 
 class TradesManager(Initializable):
+    """
+    Stores the last MAX_TRADES_COUNT trades by id and records every trade in a TradesHistory columnar store
+    which keeps the whole trades history and its paid fees totals
+    """
     MAX_TRADES_COUNT = 500
 
     def __init__(self, config, trader, exchange_manager):
@@ -31,6 +35,7 @@ class TradesManager(Initializable):
         self.config, self.trader, self.exchange_manager = config, trader, exchange_manager
         self.trades_initialized = False
         self.trades = OrderedDict()
+        self.trades_history = TradesHistory()
 
     async def initialize_impl(self):
         self._reset_trades()
@@ -40,34 +45,27 @@ class TradesManager(Initializable):
         if trade_id not in self.trades:
             created_trade = create_trade_instance_from_raw(self.trader, raw_trade)
             if created_trade:
-                self.trades[trade_id] = created_trade
-                self._check_trades_size()
+                self._add_trade(trade_id, created_trade)
                 return True
         return False
 
     def upsert_trade_instance(self, trade):
         if trade.trade_id not in self.trades:
-            self.trades[trade.trade_id] = trade
-            self._check_trades_size()
+            self._add_trade(trade.trade_id, trade)
 
     def get_total_paid_fees(self):
-        total_fees = {}
-        for trade in self.trades.values():
-            if trade.fee is not None:
-                fee_cost = trade.fee[FeePropertyColumns.COST.value]
-                fee_currency = trade.fee[FeePropertyColumns.CURRENCY.value]
-                if fee_currency in total_fees:
-                    total_fees[fee_currency] += fee_cost
-                else:
-                    total_fees[fee_currency] = fee_cost
-            else:
-                self.logger.warning(f"Trade without any registered fee: {trade}")
-        return total_fees
+        return self.trades_history.get_total_paid_fees()
 
     def get_trade(self, trade_id):
         return self.trades[trade_id]
 
     # private
+    def _add_trade(self, trade_id, trade):
+        self.trades[trade_id] = trade
+        if self.trades_history.add_trade(trade) and trade.fee is None:
+            self.logger.warning(f"Trade without any registered fee: {trade}")
+        self._check_trades_size()
+
     def _check_trades_size(self):
         if len(self.trades) > self.MAX_TRADES_COUNT:
             self._remove_oldest_trades(int(self.MAX_TRADES_COUNT / 2))
@@ -75,6 +73,7 @@ class TradesManager(Initializable):
     def _reset_trades(self):
         self.trades_initialized = False
         self.trades = OrderedDict()
+        self.trades_history = TradesHistory()
 
     def _remove_oldest_trades(self, nb_to_remove):
         for _ in range(nb_to_remove):
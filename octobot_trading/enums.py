@@ -295,3 +295,17 @@ class WebsocketFeeds(Enum):
     POSITION = 'position'
     TRADE = 'trade'
     UNSUPPORTED = 'unsupported'
+
+
+class MarkPriceFormulas(Enum):
+    MEAN = "mean"
+    VWAP = "vwap"
+    EMA = "ema"
+    MID_PRICE = "mid_price"
+
+
+class ConsumerQueuePolicies(Enum):
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    CONFLATE = "conflate"
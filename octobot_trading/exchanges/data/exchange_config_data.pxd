@@ -21,6 +21,7 @@ cdef class ExchangeConfig(Initializable):
     cdef object _logger
 
     cdef public dict traded_cryptocurrencies
+    cdef public dict candles_history_sizes
     cdef public dict config
 
     cdef public list traded_symbol_pairs
@@ -31,6 +32,8 @@ cdef class ExchangeConfig(Initializable):
 
     cpdef void set_config_time_frame(self)
     cpdef void set_config_traded_pairs(self)
+    cpdef void set_config_candles_history_size(self)
+    cpdef int get_candles_history_size(self, object time_frame)
     cpdef list get_traded_pairs(self, str cryptocurrency=*)
 
     @staticmethod
@@ -38,6 +41,7 @@ cdef class ExchangeConfig(Initializable):
 
     cdef void _set_config_time_frame(self)
     cdef void _set_config_traded_pairs(self)
+    cdef void _set_config_candles_history_size(self)
     cdef list _add_tradable_symbols_from_config(self, str cryptocurrency)
     cdef object _add_tradable_symbols(self, str cryptocurrency, list symbols)
     cdef list _add_tradable_time_frames(self, list time_frames)
@@ -13,11 +13,15 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+from octobot_commons.enums import TimeFrames
 from octobot_commons.symbol_util import split_symbol
 from octobot_commons.time_frame_manager import get_config_time_frame, find_min_time_frame, sort_time_frames
 from octobot_commons.constants import CONFIG_WILDCARD, MIN_EVAL_TIME_FRAME, CONFIG_TIME_FRAME, \
     CONFIG_CRYPTO_CURRENCIES, CONFIG_CRYPTO_PAIRS, CONFIG_CRYPTO_ADD, CONFIG_CRYPTO_QUOTE
 from octobot_commons.logging.logging_util import get_logger
+from octobot_trading.constants import CONFIG_EXCHANGES, CONFIG_CANDLES_HISTORY_SIZE, CONFIG_CANDLES_MEMORY_BUDGET, \
+    BYTES_PER_MEGABYTE
+from octobot_trading.data_manager.candles_manager import CandlesManager
 from octobot_trading.util.initializable import Initializable
 
 
@@ -34,6 +38,9 @@ class ExchangeConfig(Initializable):
         self.traded_time_frames = []
         self.real_time_time_frames = []
 
+        # max candles count by time frame
+        self.candles_history_sizes = {}
+
     async def initialize_impl(self):
         pass
 
@@ -43,6 +50,12 @@ class ExchangeConfig(Initializable):
     def set_config_time_frame(self):  # TODO
         self._set_config_time_frame()
 
+    def set_config_candles_history_size(self):
+        self._set_config_candles_history_size()
+
+    def get_candles_history_size(self, time_frame):
+        return self.candles_history_sizes.get(time_frame, CandlesManager.MAX_CANDLES_COUNT)
+
     def get_traded_pairs(self, cryptocurrency=None):
         if cryptocurrency:
             if cryptocurrency in self.traded_cryptocurrencies:
@@ -110,6 +123,35 @@ class ExchangeConfig(Initializable):
         self.traded_time_frames = list(set().union(self.traded_time_frames, self.real_time_time_frames))
         self.traded_time_frames = sort_time_frames(self.traded_time_frames, reverse=True)
 
+    def _set_config_candles_history_size(self):
+        """
+        Sets candles history size of each time frame from the exchange configuration:
+        - "candles-history-size": {time_frame: max candles count} (default is CandlesManager.MAX_CANDLES_COUNT)
+        - "candles-memory-budget": max memory in megabytes for the candles of every traded pair and time frame,
+        history sizes are reduced proportionally when this budget would be exceeded
+        """
+        exchange_config = self.config.get(CONFIG_EXCHANGES, {}).get(self.exchange_manager.exchange_name, {})
+        self.candles_history_sizes = {
+            TimeFrames(time_frame): history_size
+            for time_frame, history_size in exchange_config.get(CONFIG_CANDLES_HISTORY_SIZE, {}).items()
+        }
+        for time_frame in self.traded_time_frames:
+            self.candles_history_sizes.setdefault(time_frame, CandlesManager.MAX_CANDLES_COUNT)
+
+        memory_budget = exchange_config.get(CONFIG_CANDLES_MEMORY_BUDGET, 0) * BYTES_PER_MEGABYTE
+        required_memory = 0
+        for time_frame in self.traded_time_frames:
+            required_memory += CandlesManager.get_buffers_memory_size(self.candles_history_sizes[time_frame])
+        required_memory *= len(self.traded_symbol_pairs)
+        if 0 < memory_budget < required_memory:
+            ratio = memory_budget / required_memory
+            self.candles_history_sizes = {
+                time_frame: max(1, int(history_size * ratio))
+                for time_frame, history_size in self.candles_history_sizes.items()
+            }
+            self._logger.warning(f"Candles history sizes reduced to {self.candles_history_sizes} to fit in the "
+                                 f"{exchange_config[CONFIG_CANDLES_MEMORY_BUDGET]}MB candles memory budget.")
+
     @staticmethod
     def _is_tradable_with_cryptocurrency(symbol, cryptocurrency):
         return symbol if split_symbol(symbol)[1] == cryptocurrency else None
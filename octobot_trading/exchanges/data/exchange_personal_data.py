@@ -72,7 +72,7 @@ class ExchangePersonalData(Initializable):
             changed: bool = await self.portfolio_manager.handle_balance_update_from_order(order)
             if should_notify:
                 await get_chan(BALANCE_CHANNEL, self.exchange_manager.id). \
-                    get_internal_producer().send(self.portfolio_manager.portfolio.portfolio)
+                    get_internal_producer().send(self.portfolio_manager.portfolio.portfolio.to_dict())
             return changed
         except AttributeError as e:
             self.logger.exception(e, True, f"Failed to update balance : {e}")
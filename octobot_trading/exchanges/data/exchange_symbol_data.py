@@ -49,7 +49,8 @@ class ExchangeSymbolData:
         try:
             symbol_candles = self.symbol_candles[time_frame]
         except KeyError:
-            symbol_candles = CandlesManager()
+            symbol_candles = CandlesManager(
+                max_candles_count=self.exchange_manager.exchange_config.get_candles_history_size(time_frame))
             await symbol_candles.initialize()
 
             if replace_all:
@@ -87,6 +88,13 @@ class ExchangeSymbolData:
     def handle_order_book_update(self, asks, bids):
         self.order_book_manager.order_book_update(asks, bids)
 
+    def handle_order_book_delta_update(self, asks, bids):
+        """
+        :return: the updated asks and bids
+        """
+        self.order_book_manager.order_book_delta_update(asks, bids)
+        return self.order_book_manager.get_asks(), self.order_book_manager.get_bids()
+
     def handle_order_book_ticker_update(self, ask_quantity, ask_price, bid_quantity, bid_price):
         self.order_book_manager.order_book_ticker_update(ask_quantity, ask_price, bid_quantity, bid_price)
 
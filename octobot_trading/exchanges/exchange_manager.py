@@ -129,6 +129,7 @@ class ExchangeManager(Initializable):
         self._load_config_symbols_and_time_frames()
         self.exchange_config.set_config_time_frame()
         self.exchange_config.set_config_traded_pairs()
+        self.exchange_config.set_config_candles_history_size()
 
     def need_user_stream(self):
         return self.config[CONFIG_TRADER][CONFIG_ENABLED_OPTION]
@@ -204,6 +205,7 @@ class ExchangeManager(Initializable):
         await self._initialize_simulator_time_frames()
         self.exchange_config.set_config_time_frame()
         self.exchange_config.set_config_traded_pairs()
+        self.exchange_config.set_config_candles_history_size()
         await self._create_exchange_channels()
 
     async def _init_simulated_exchange(self):
@@ -18,6 +18,8 @@ from octobot_trading.data.order import Order
 
 
 class BuyMarketOrder(Order):
+    __slots__ = ()
+
     def __init__(self, trader):
         super().__init__(trader)
         self.side = TradeOrderSide.BUY
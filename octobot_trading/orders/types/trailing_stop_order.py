@@ -19,6 +19,8 @@ from octobot_trading.data.order import Order
 
 # TODO
 class TrailingStopOrder(Order):
+    __slots__ = ()
+
     def __init__(self, trader):
         super().__init__(trader)
         self.side = TradeOrderSide.SELL
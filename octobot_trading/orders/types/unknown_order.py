@@ -18,6 +18,8 @@ from octobot_trading.data.order import Order
 
 class UnknownOrder(Order):
     """UnknownOrder is used when an exchange is giving an order without a type (ex: binance 2yo+ orders)"""
+    __slots__ = ()
+
     def __init__(self, trader):
         super().__init__(trader)
 
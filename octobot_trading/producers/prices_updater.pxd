@@ -20,3 +20,4 @@ from octobot_trading.channels.price cimport MarkPriceProducer
 cdef class MarkPriceUpdater(MarkPriceProducer):
     cdef object recent_trades_consumer
     cdef object ticker_consumer
+    cdef object order_book_ticker_consumer
@@ -19,10 +19,10 @@ from ccxt import NotSupported
 
 from octobot_trading.channels.exchange_channel import get_chan
 from octobot_trading.channels.price import MarkPriceProducer
-from octobot_trading.constants import MARK_PRICE_CHANNEL, RECENT_TRADES_CHANNEL, TICKER_CHANNEL, FUNDING_CHANNEL
-from octobot_trading.data_manager.prices_manager import calculate_mark_price_from_recent_trade_prices
-from octobot_trading.enums import ExchangeConstantsTickersColumns, ExchangeConstantsOrderColumns, \
-    ExchangeConstantsFundingColumns, ExchangeConstantsMarkPriceColumns
+from octobot_trading.constants import MARK_PRICE_CHANNEL, RECENT_TRADES_CHANNEL, TICKER_CHANNEL, FUNDING_CHANNEL, \
+    ORDER_BOOK_TICKER_CHANNEL
+from octobot_trading.enums import ExchangeConstantsTickersColumns, ExchangeConstantsFundingColumns, \
+    ExchangeConstantsMarkPriceColumns
 
 
 class MarkPriceUpdater(MarkPriceProducer):
@@ -34,6 +34,7 @@ class MarkPriceUpdater(MarkPriceProducer):
         super().__init__(channel)
         self.recent_trades_consumer = None
         self.ticker_consumer = None
+        self.order_book_ticker_consumer = None
 
     async def start(self):
         if not self.channel.exchange_manager.is_future:
@@ -46,6 +47,8 @@ class MarkPriceUpdater(MarkPriceProducer):
             .new_consumer(self.handle_recent_trades_update)
         self.ticker_consumer = await get_chan(TICKER_CHANNEL, self.channel.exchange_manager.id) \
             .new_consumer(self.handle_ticker_update)
+        self.order_book_ticker_consumer = await get_chan(ORDER_BOOK_TICKER_CHANNEL, self.channel.exchange_manager.id) \
+            .new_consumer(self.handle_order_book_ticker_update)
 
     async def unsubscribe(self):
         if self.recent_trades_consumer:
@@ -54,6 +57,9 @@ class MarkPriceUpdater(MarkPriceProducer):
         if self.ticker_consumer:
             await get_chan(TICKER_CHANNEL, self.channel.exchange_manager.id) \
                 .remove_consumer(self.ticker_consumer)
+        if self.order_book_ticker_consumer:
+            await get_chan(ORDER_BOOK_TICKER_CHANNEL, self.channel.exchange_manager.id) \
+                .remove_consumer(self.order_book_ticker_consumer)
 
     async def resume(self) -> None:
         await super().resume()
@@ -71,14 +77,27 @@ class MarkPriceUpdater(MarkPriceProducer):
         Recent trades channel consumer callback
         """
         try:
-            mark_price = calculate_mark_price_from_recent_trade_prices(
-                [float(last_price[ExchangeConstantsOrderColumns.PRICE.value])
-                 for last_price in recent_trades])
-
-            await self.push(symbol, mark_price)
+            mark_price = self.channel.exchange_manager.get_symbol_data(symbol).prices_manager \
+                .update_mark_price_from_recent_trades(recent_trades)
+            if mark_price is not None:
+                await self.push(symbol, mark_price)
         except Exception as e:
             self.logger.exception(e, True, f"Fail to handle recent trades update : {e}")
 
+    async def handle_order_book_ticker_update(self, exchange: str, exchange_id: str,
+                                              cryptocurrency: str, symbol: str,
+                                              ask_quantity, ask_price, bid_quantity, bid_price):
+        """
+        Order book ticker channel consumer callback
+        """
+        try:
+            mark_price = self.channel.exchange_manager.get_symbol_data(symbol).prices_manager \
+                .update_mark_price_from_order_book_ticker(ask_price, bid_price)
+            if mark_price is not None:
+                await self.push(symbol, mark_price)
+        except Exception as e:
+            self.logger.exception(e, True, f"Fail to handle order book ticker update : {e}")
+
     async def handle_ticker_update(self, exchange: str, exchange_id: str,
                                    cryptocurrency: str, symbol: str, ticker: dict):
         """
@@ -21,6 +21,7 @@ from ccxt.base.errors import InsufficientFunds
 from octobot_commons.logging.logging_util import get_logger
 from octobot_trading.constants import RECENT_TRADES_CHANNEL, ORDERS_CHANNEL
 from octobot_trading.channels.exchange_channel import get_chan
+from octobot_trading.data.last_prices import LastPrices
 from octobot_trading.data.order import Order
 from octobot_trading.enums import OrderStatus
 from octobot_trading.producers import MissingOrderException
@@ -43,11 +44,12 @@ class OpenOrdersUpdaterSimulator(OpenOrdersUpdater):
                                   cryptocurrency: str, symbol: str, recent_trades: list):
         """
         Recent trade channel consumer callback
+        recent_trades are converted once into LastPrices to be checked by every order
         """
         try:
             failed_order_updates = await self._update_orders_status(cryptocurrency=cryptocurrency,
                                                                     symbol=symbol,
-                                                                    last_prices=recent_trades)
+                                                                    last_prices=LastPrices(recent_trades))
 
             if failed_order_updates:
                 self.logger.info(f"Forcing real trader refresh.")
@@ -58,14 +60,15 @@ class OpenOrdersUpdaterSimulator(OpenOrdersUpdater):
     async def _update_orders_status(self,
                                     cryptocurrency: str,
                                     symbol: str,
-                                    last_prices: list) -> list:
+                                    last_prices: LastPrices) -> list:
         """
         Ask orders to check their status
         Ask cancellation and filling process if it is required
+        Only the orders that might be filled by last_prices are checked
         """
         failed_order_updates = []
-        for order in copy.copy(
-                self.exchange_manager.exchange_personal_data.orders_manager.get_open_orders(symbol=symbol)):
+        for order in copy.copy(self.exchange_manager.exchange_personal_data.orders_manager.get_orders_to_update(
+                symbol, last_prices.get_min_price(), last_prices.get_max_price())):
             order_filled = False
             try:
                 # ask orders to update their status
@@ -90,7 +93,7 @@ class OpenOrdersUpdaterSimulator(OpenOrdersUpdater):
     async def _update_order_status(self,
                                    order: Order,
                                    failed_order_updates: list,
-                                   last_prices: list):
+                                   last_prices: LastPrices):
         """
         Call order status update
         """
@@ -66,20 +66,26 @@ packages_list = ["octobot_trading.util.initializable",
                  "octobot_trading.producers.simulator.recent_trade_updater_simulator",
                  "octobot_trading.producers.simulator.ticker_updater_simulator",
                  "octobot_trading.data.book",
+                 "octobot_trading.data.currency_conversion_graph",
+                 "octobot_trading.data.last_prices",
                  "octobot_trading.data.margin_portfolio",
                  "octobot_trading.data.order",
                  "octobot_trading.data.position",
                  "octobot_trading.data.trade",
                  "octobot_trading.data.portfolio",
+                 "octobot_trading.data.portfolio_holdings",
                  "octobot_trading.data.portfolio_profitability",
                  "octobot_trading.data.sub_portfolio",
                  "octobot_trading.data_adapters.candles_adapter",
                  "octobot_trading.data_manager.candles_manager",
                  "octobot_trading.data_manager.funding_manager",
                  "octobot_trading.data_manager.orders_manager",
+                 "octobot_trading.data_manager.orders_archive",
+                 "octobot_trading.data_manager.orders_trigger_index",
                  "octobot_trading.data_manager.positions_manager",
                  "octobot_trading.data_manager.kline_manager",
                  "octobot_trading.data_manager.trades_manager",
+                 "octobot_trading.data_manager.trades_history",
                  "octobot_trading.data_manager.portfolio_manager",
                  "octobot_trading.data_manager.prices_manager",
                  "octobot_trading.data_manager.order_book_manager",
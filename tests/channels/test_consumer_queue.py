@@ -0,0 +1,132 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+
+import pytest
+
+from octobot_trading.channels.consumer_queue import ConsumerQueue
+from octobot_trading.enums import ConsumerQueuePolicies
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+async def test_conflated_queue():
+    queue = ConsumerQueue(policy=ConsumerQueuePolicies.CONFLATE)
+    await queue.put({"symbol": "BTC/USDT", "ticker": 1})
+    await queue.put({"symbol": "ETH/USDT", "ticker": 2})
+    await queue.put({"symbol": "BTC/USDT", "ticker": 3})
+    await queue.put({"symbol": "BTC/USDT", "time_frame": "1h", "ticker": 4})
+    assert queue.qsize() == 3
+
+    # BTC/USDT keeps its position with its latest value
+    assert await queue.get() == {"symbol": "BTC/USDT", "ticker": 3}
+    assert await queue.get() == {"symbol": "ETH/USDT", "ticker": 2}
+    assert await queue.get() == {"symbol": "BTC/USDT", "time_frame": "1h", "ticker": 4}
+    assert queue.empty()
+
+    await queue.put({"symbol": "BTC/USDT", "ticker": 5})
+    assert queue.get_nowait() == {"symbol": "BTC/USDT", "ticker": 5}
+
+
+async def test_conflated_queue_tasks():
+    queue = ConsumerQueue(policy=ConsumerQueuePolicies.CONFLATE)
+    for ticker in range(10):
+        queue.put_nowait({"symbol": "BTC/USDT", "ticker": ticker})
+    assert await queue.get() == {"symbol": "BTC/USDT", "ticker": 9}
+    queue.task_done()
+    # every pending message has been consumed
+    await queue.join()
+    assert queue.dropped_messages_count == 9
+    assert queue.high_water_mark == 1
+
+
+async def test_bounded_conflated_queue():
+    queue = ConsumerQueue(2, ConsumerQueuePolicies.CONFLATE)
+    await queue.put({"symbol": "BTC/USDT", "ticker": 1})
+    await queue.put({"symbol": "ETH/USDT", "ticker": 2})
+    await queue.put({"symbol": "ETH/USDT", "ticker": 3})
+    assert queue.dropped_messages_count == 1
+    # full: the oldest pending message is dropped
+    await queue.put({"symbol": "LTC/USDT", "ticker": 4})
+    assert queue.dropped_messages_count == 2
+    assert queue.get_nowait() == {"symbol": "ETH/USDT", "ticker": 3}
+    assert queue.get_nowait() == {"symbol": "LTC/USDT", "ticker": 4}
+    assert queue.high_water_mark == 2
+
+
+async def test_block_queue():
+    queue = ConsumerQueue(2)
+    await queue.put({"ticker": 1})
+    await queue.put({"ticker": 2})
+    assert queue.full()
+    with pytest.raises(asyncio.QueueFull):
+        queue.put_nowait({"ticker": 3})
+    assert queue.get_nowait() == {"ticker": 1}
+    assert queue.dropped_messages_count == 0
+    assert queue.high_water_mark == 2
+
+
+async def test_drop_oldest_queue():
+    queue = ConsumerQueue(2, ConsumerQueuePolicies.DROP_OLDEST)
+    for ticker in range(5):
+        await queue.put({"ticker": ticker})
+    assert not queue.full()
+    assert queue.qsize() == 2
+    assert queue.get_nowait() == {"ticker": 3}
+    assert queue.get_nowait() == {"ticker": 4}
+    assert queue.get_metrics() == {
+        "policy": ConsumerQueuePolicies.DROP_OLDEST.value,
+        "size": 0,
+        "max_size": 2,
+        "dropped_messages_count": 3,
+        "high_water_mark": 2
+    }
+
+
+async def test_drop_newest_queue():
+    queue = ConsumerQueue(2, ConsumerQueuePolicies.DROP_NEWEST)
+    for ticker in range(5):
+        queue.put_nowait({"ticker": ticker})
+    assert queue.get_nowait() == {"ticker": 0}
+    queue.task_done()
+    assert queue.get_nowait() == {"ticker": 1}
+    queue.task_done()
+    assert queue.dropped_messages_count == 3
+    # dropped messages are not waited for
+    await queue.join()
+
+
+async def test_unbounded_queue():
+    queue = ConsumerQueue(policy=ConsumerQueuePolicies.DROP_OLDEST)
+    for ticker in range(100):
+        await queue.put({"ticker": ticker})
+    assert queue.qsize() == queue.high_water_mark == 100
+    assert queue.dropped_messages_count == 0
+
+
+@pytest.mark.parametrize("policy", list(ConsumerQueuePolicies))
+async def test_join_after_drops(policy):
+    queue = ConsumerQueue(2, policy)
+    for ticker in range(2 if policy is ConsumerQueuePolicies.BLOCK else 10):
+        await queue.put({"symbol": "BTC/USDT", "ticker": ticker})
+    while not queue.empty():
+        queue.get_nowait()
+        queue.task_done()
+    # every pending message has been consumed, dropped ones are not waited for
+    await asyncio.wait_for(queue.join(), 1)
+    with pytest.raises(ValueError):
+        queue.task_done()
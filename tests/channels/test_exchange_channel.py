@@ -0,0 +1,121 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import pytest
+from octobot_channels.constants import CHANNEL_WILDCARD
+from octobot_commons.enums import TimeFrames
+from octobot_commons.tests.test_config import load_test_config
+
+from octobot_trading.channels.consumer_queue import ConsumerQueue
+from octobot_trading.channels.ohlcv import OHLCVChannel
+from octobot_trading.channels.orders import OrdersChannel, OrdersProducer
+from octobot_trading.channels.ticker import TickerChannel
+from octobot_trading.enums import ConsumerQueuePolicies
+from octobot_trading.exchanges.exchange_manager import ExchangeManager
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+async def _callback(**kwargs):
+    pass
+
+
+@pytest.fixture()
+async def exchange_manager():
+    return ExchangeManager(load_test_config(), "binance")
+
+
+async def test_get_filtered_consumers_routing(exchange_manager):
+    channel = TickerChannel(exchange_manager)
+    all_symbols_consumer = await channel.new_consumer(_callback)
+    btc_consumer = await channel.new_consumer(_callback, symbol="BTC/USDT", cryptocurrency="Bitcoin")
+
+    assert channel.get_filtered_consumers() == [all_symbols_consumer, btc_consumer]
+    assert channel.get_filtered_consumers(symbol="BTC/USDT") == [all_symbols_consumer, btc_consumer]
+    assert channel.get_filtered_consumers(symbol="ETH/USDT") == [all_symbols_consumer]
+    assert channel.get_filtered_consumers(cryptocurrency="Bitcoin", symbol="ETH/USDT") == [all_symbols_consumer]
+    # routes are reused
+    assert channel.get_filtered_consumers(symbol="ETH/USDT") is channel.get_filtered_consumers(symbol="ETH/USDT")
+
+    eth_consumer = await channel.new_consumer(_callback, symbol="ETH/USDT")
+    assert channel.get_filtered_consumers(symbol="ETH/USDT") == [all_symbols_consumer, eth_consumer]
+    assert channel.get_filtered_consumers(symbol=CHANNEL_WILDCARD) == [all_symbols_consumer, btc_consumer,
+                                                                       eth_consumer]
+
+    await channel.remove_consumer(all_symbols_consumer)
+    assert channel.get_filtered_consumers(symbol="ETH/USDT") == [eth_consumer]
+    assert channel.get_filtered_consumers(symbol="XRP/USDT") == []
+
+    await channel.remove_consumer(btc_consumer)
+    await channel.remove_consumer(eth_consumer)
+    assert channel.get_filtered_consumers() == []
+    assert channel.is_paused
+
+
+async def test_get_filtered_consumers_routing_with_time_frame(exchange_manager):
+    channel = OHLCVChannel(exchange_manager)
+    all_consumer = await channel.new_consumer(_callback)
+    btc_1h_consumer = await channel.new_consumer(_callback, symbol="BTC/USDT", time_frame=TimeFrames.ONE_HOUR.value)
+
+    assert channel.get_filtered_consumers(symbol="BTC/USDT", time_frame=TimeFrames.ONE_HOUR.value) == \
+        [all_consumer, btc_1h_consumer]
+    assert channel.get_filtered_consumers(symbol="BTC/USDT", time_frame=TimeFrames.ONE_MINUTE.value) == \
+        [all_consumer]
+    assert channel.get_filtered_consumers(symbol="BTC/USDT") == [all_consumer, btc_1h_consumer]
+
+    await channel.remove_consumer(all_consumer)
+    assert channel.get_filtered_consumers(symbol="BTC/USDT", time_frame=TimeFrames.ONE_MINUTE.value) == []
+    assert channel.get_filtered_consumers(symbol="BTC/USDT", time_frame=TimeFrames.ONE_HOUR.value) == \
+        [btc_1h_consumer]
+    await channel.remove_consumer(btc_1h_consumer)
+
+
+async def test_new_consumer_queue_policy(exchange_manager):
+    channel = TickerChannel(exchange_manager)
+    assert channel.CONSUMERS_QUEUE_POLICY is ConsumerQueuePolicies.CONFLATE
+    conflated_consumer = await channel.new_consumer(_callback)
+    bounded_consumer = await channel.new_consumer(_callback, size=10, queue_policy=ConsumerQueuePolicies.DROP_OLDEST)
+    assert conflated_consumer.queue.policy is ConsumerQueuePolicies.CONFLATE
+    assert conflated_consumer.queue.maxsize == 0
+    assert bounded_consumer.queue.policy is ConsumerQueuePolicies.DROP_OLDEST
+    assert bounded_consumer.queue.maxsize == 10
+    await channel.remove_consumer(conflated_consumer)
+    await channel.remove_consumer(bounded_consumer)
+
+    channel = OHLCVChannel(exchange_manager)
+    assert channel.CONSUMERS_QUEUE_POLICY is ConsumerQueuePolicies.BLOCK
+    blocking_consumer = await channel.new_consumer(_callback)
+    conflated_consumer = await channel.new_consumer(_callback, queue_policy=ConsumerQueuePolicies.CONFLATE)
+    assert isinstance(blocking_consumer.queue, ConsumerQueue)
+    assert blocking_consumer.queue.policy is ConsumerQueuePolicies.BLOCK
+    assert conflated_consumer.queue.policy is ConsumerQueuePolicies.CONFLATE
+    await channel.remove_consumer(conflated_consumer)
+    await channel.remove_consumer(blocking_consumer)
+
+
+async def test_orders_send_shared_snapshot(exchange_manager):
+    channel = OrdersChannel(exchange_manager)
+    consumers = [await channel.new_consumer(_callback), await channel.new_consumer(_callback)]
+    order = {"id": "1", "symbol": "BTC/USDT"}
+    await OrdersProducer(channel).send(cryptocurrency="Bitcoin", symbol="BTC/USDT", order=order)
+    first_update, second_update = (consumer.queue.get_nowait() for consumer in consumers)
+    # the same read-only snapshot is given to every consumer
+    assert first_update is second_update
+    assert first_update["order"] == order
+    with pytest.raises(TypeError):
+        first_update["order"]["id"] = "2"
+    for consumer in consumers:
+        await channel.remove_consumer(consumer)
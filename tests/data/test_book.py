@@ -0,0 +1,65 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+from octobot_trading.data.book import Book
+
+
+def test_handle_book_update():
+    book = Book()
+    book.handle_book_update(_get_orders())
+    assert book.timestamp > 0
+    assert [order["id"] for order in book.get_asks()] == [3, 4]
+    assert [order["id"] for order in book.get_bids()] == [2, 1]
+
+    book.reset()
+    assert book.orders == {}
+    assert book.get_asks() == book.get_bids() == []
+
+
+def test_handle_book_delta_delete():
+    book = Book()
+    book.handle_book_update(_get_orders())
+    book.handle_book_delta_delete([{"id": 1}, {"id": 3}, {"id": 10}])
+    assert [order["id"] for order in book.get_asks()] == [4]
+    assert [order["id"] for order in book.get_bids()] == [2]
+    assert list(book.orders) == [2, 4]
+
+
+def test_handle_book_delta_update():
+    book = Book()
+    book.handle_book_update(_get_orders())
+    book.handle_book_delta_update([{"id": 4, "price": 100.5}, {"id": 1, "size": 50}, {"id": 10, "size": 1}])
+    assert [order["id"] for order in book.get_asks()] == [4, 3]
+    assert [order["id"] for order in book.get_bids()] == [2, 1]
+    assert book.orders[1] == {"id": 1, "side": "Buy", "price": 99, "size": 50}
+    assert 10 not in book.orders
+
+
+def test_handle_book_delta_insert():
+    book = Book()
+    book.handle_book_update(_get_orders())
+    book.handle_book_delta_insert([{"id": 5, "side": "Buy", "price": 100, "size": 3},
+                                   {"id": 6, "side": "Sell", "price": 100.5, "size": 1}])
+    assert [order["id"] for order in book.get_asks()] == [6, 3, 4]
+    assert [order["id"] for order in book.get_bids()] == [5, 2, 1]
+
+
+def _get_orders():
+    return [
+        {"id": 1, "side": "Buy", "price": 99, "size": 10},
+        {"id": 2, "side": "Buy", "price": 100, "size": 20},
+        {"id": 3, "side": "Sell", "price": 101, "size": 30},
+        {"id": 4, "side": "Sell", "price": 102, "size": 40},
+    ]
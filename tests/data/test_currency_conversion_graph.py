@@ -0,0 +1,76 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import pytest
+
+from octobot_trading.data.currency_conversion_graph import CurrencyConversionGraph
+
+SYMBOLS = ["BTC/USDT", "ETH/BTC", "ETH/USDT", "USDT/EUR", "LTC/BTC", "XRP/ETH", "ADA/USDT", "USDT/ADA"]
+
+
+def test_get_conversion_path():
+    graph = CurrencyConversionGraph("USDT", SYMBOLS, {})
+    assert graph.get_conversion_path("USDT") == ()
+    assert graph.get_conversion_path("BTC") == (("BTC/USDT", False),)
+    # direct pair is preferred over a two-hop path
+    assert graph.get_conversion_path("ETH") == (("ETH/USDT", False),)
+    assert graph.get_conversion_path("EUR") == (("USDT/EUR", True),)
+    # direct symbol is preferred over the inverted one
+    assert graph.get_conversion_path("ADA") == (("ADA/USDT", False),)
+    assert graph.get_conversion_path("LTC") == (("LTC/BTC", False), ("BTC/USDT", False))
+    # XRP is only quoted in ETH which is not an intermediate currency
+    assert graph.get_conversion_path("XRP") is None
+    assert graph.get_conversion_path("XYZ") is None
+
+
+def test_get_rate():
+    prices = {"BTC/USDT": 10000, "USDT/EUR": 0.5}
+    graph = CurrencyConversionGraph("USDT", SYMBOLS, prices)
+    assert graph.get_rate("USDT") == 1
+    assert graph.get_rate("BTC") == 10000
+    assert graph.get_rate("EUR") == 2
+    with pytest.raises(KeyError):
+        graph.get_rate("LTC")
+    assert graph.get_missing_symbols("LTC") == ["LTC/BTC"]
+    with pytest.raises(KeyError):
+        graph.get_rate("XYZ")
+
+    prices["LTC/BTC"] = 0.01
+    assert graph.get_rate("LTC") == 100
+    assert graph.get_missing_symbols("LTC") == []
+
+    prices["USDT/EUR"] = 0
+    assert graph.update_rates("USDT/EUR") == ["EUR"]
+    assert graph.get_rate("EUR") == 0
+
+
+def test_update_rates():
+    prices = {"BTC/USDT": 10000, "LTC/BTC": 0.01}
+    graph = CurrencyConversionGraph("USDT", SYMBOLS, prices)
+    # rates are only tracked once requested
+    assert graph.update_rates("BTC/USDT") == []
+    assert graph.get_rate("LTC") == 100
+    assert graph.get_rate("BTC") == 10000
+
+    prices["BTC/USDT"] = 20000
+    assert sorted(graph.update_rates("BTC/USDT")) == ["BTC", "LTC"]
+    assert graph.get_rate("BTC") == 20000
+    assert graph.get_rate("LTC") == 200
+    assert graph.update_rates("ETH/USDT") == []
+
+    prices.pop("LTC/BTC")
+    assert graph.update_rates("LTC/BTC") == []
+    with pytest.raises(KeyError):
+        graph.get_rate("LTC")
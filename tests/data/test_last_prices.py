@@ -0,0 +1,46 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+from math import isnan, nan
+
+from octobot_trading.data.last_prices import LastPrices
+from octobot_trading.enums import ExchangeConstantsOrderColumns as ECOC
+
+
+def _recent_trade(price, timestamp):
+    return {ECOC.PRICE.value: price, ECOC.TIMESTAMP.value: timestamp}
+
+
+def test_get_min_and_max_prices():
+    last_prices = LastPrices([_recent_trade(10, 5), _recent_trade(12, 1), _recent_trade(nan, 6),
+                              _recent_trade(8, 3), _recent_trade(11, 7), {ECOC.PRICE.value: 1}])
+    assert list(last_prices.timestamps) == [1, 3, 5, 7]
+    assert list(last_prices.prices) == [12, 8, 10, 11]
+
+    assert last_prices.get_min_price() == 8
+    assert last_prices.get_max_price() == 12
+    assert last_prices.get_min_price(since=3) == 8
+    assert last_prices.get_min_price(since=4) == 10
+    assert last_prices.get_max_price(since=2) == 11
+    assert last_prices.get_max_price(since=7) == 11
+    assert isnan(last_prices.get_min_price(since=8))
+    assert isnan(last_prices.get_max_price(since=8))
+
+
+def test_empty_last_prices():
+    last_prices = LastPrices([])
+    assert isnan(last_prices.get_min_price())
+    assert isnan(last_prices.get_max_price())
+    assert not last_prices.get_min_price() < 10
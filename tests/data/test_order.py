@@ -0,0 +1,74 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import pytest
+from octobot_commons.tests.test_config import load_test_config
+
+from octobot_trading.enums import TraderOrderType, OrderStatus, ExchangeConstantsOrderColumns
+from octobot_trading.exchanges.exchange_manager import ExchangeManager
+from octobot_trading.orders.order_factory import create_order_instance
+from octobot_trading.traders.trader_simulator import TraderSimulator
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestOrder:
+    DEFAULT_SYMBOL = "BTC/USDT"
+    EXCHANGE_MANAGER_CLASS_STRING = "binance"
+
+    @staticmethod
+    async def init_default():
+        config = load_test_config()
+        exchange_manager = ExchangeManager(config, TestOrder.EXCHANGE_MANAGER_CLASS_STRING)
+        await exchange_manager.initialize()
+
+        trader = TraderSimulator(config, exchange_manager)
+        await trader.initialize()
+
+        return config, exchange_manager, trader
+
+    @staticmethod
+    async def stop(exchange_manager):
+        await exchange_manager.stop()
+
+    async def test_to_dict_cache(self):
+        _, exchange_manager, trader_inst = await self.init_default()
+
+        order = create_order_instance(trader=trader_inst,
+                                      order_type=TraderOrderType.BUY_LIMIT,
+                                      symbol=self.DEFAULT_SYMBOL,
+                                      current_price=70,
+                                      quantity=10,
+                                      price=70)
+        order_dict = order.to_dict()
+        assert order_dict[ExchangeConstantsOrderColumns.STATUS.value] == OrderStatus.OPEN.value
+        assert order.to_dict() is order_dict
+
+        # direct change of an order value
+        order.status = OrderStatus.FILLED
+        filled_order_dict = order.to_dict()
+        assert filled_order_dict is not order_dict
+        assert filled_order_dict[ExchangeConstantsOrderColumns.STATUS.value] == OrderStatus.FILLED.value
+        # previously returned dicts are not modified
+        assert order_dict[ExchangeConstantsOrderColumns.STATUS.value] == OrderStatus.OPEN.value
+        order.filled_quantity = 3
+        assert order.to_dict()[ExchangeConstantsOrderColumns.FILLED.value] == 3
+
+        # change from update
+        order.update(symbol=self.DEFAULT_SYMBOL, quantity=5)
+        assert order.to_dict()[ExchangeConstantsOrderColumns.AMOUNT.value] == 5
+        assert order.to_dict() is order.to_dict()
+
+        await self.stop(exchange_manager)
@@ -0,0 +1,100 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import copy
+
+import pytest
+from octobot_commons.constants import PORTFOLIO_AVAILABLE, PORTFOLIO_TOTAL, MARGIN_PORTFOLIO
+
+from octobot_trading.data.portfolio_holdings import PortfolioHoldings
+
+
+def _holdings():
+    return PortfolioHoldings(holdings={
+        "BTC": {PORTFOLIO_AVAILABLE: 10, PORTFOLIO_TOTAL: 10},
+        "USDT": {PORTFOLIO_AVAILABLE: 500, PORTFOLIO_TOTAL: 1000}
+    })
+
+
+def test_mapping():
+    holdings = _holdings()
+    assert holdings == {
+        "BTC": {PORTFOLIO_AVAILABLE: 10, PORTFOLIO_TOTAL: 10},
+        "USDT": {PORTFOLIO_AVAILABLE: 500, PORTFOLIO_TOTAL: 1000}
+    }
+    assert list(holdings) == ["BTC", "USDT"]
+    assert len(holdings) == 2
+    assert "BTC" in holdings and "ETH" not in holdings
+    assert holdings["USDT"][PORTFOLIO_TOTAL] == 1000
+    assert holdings["USDT"] == {PORTFOLIO_AVAILABLE: 500, PORTFOLIO_TOTAL: 1000}
+    with pytest.raises(KeyError):
+        holdings["ETH"]
+
+    holdings["BTC"][PORTFOLIO_AVAILABLE] -= 2.5
+    assert holdings.get_quantity("BTC", PORTFOLIO_AVAILABLE) == 7.5
+    holdings["ETH"] = {PORTFOLIO_AVAILABLE: 1, PORTFOLIO_TOTAL: 2}
+    assert holdings.pop("USDT") == {PORTFOLIO_AVAILABLE: 500, PORTFOLIO_TOTAL: 1000}
+    assert holdings.pop("USDT", None) is None
+    assert holdings.to_dict() == {
+        "BTC": {PORTFOLIO_AVAILABLE: 7.5, PORTFOLIO_TOTAL: 10},
+        "ETH": {PORTFOLIO_AVAILABLE: 1, PORTFOLIO_TOTAL: 2}
+    }
+    with pytest.raises(KeyError):
+        holdings["BTC"][MARGIN_PORTFOLIO] = 1
+
+
+def test_many_currencies():
+    holdings = PortfolioHoldings()
+    for index in range(PortfolioHoldings.DEFAULT_CAPACITY * 3):
+        holdings[f"C{index}"] = {PORTFOLIO_AVAILABLE: index, PORTFOLIO_TOTAL: index}
+    assert len(holdings) == PortfolioHoldings.DEFAULT_CAPACITY * 3
+    assert all(holdings[f"C{index}"][PORTFOLIO_TOTAL] == index for index in range(len(holdings)))
+
+
+def test_snapshot():
+    holdings = _holdings()
+    snapshot = holdings.snapshot()
+    deep_copy = copy.deepcopy(holdings)
+    assert snapshot == holdings == deep_copy
+
+    holdings["BTC"][PORTFOLIO_TOTAL] = 5
+    holdings["ETH"] = {PORTFOLIO_AVAILABLE: 1, PORTFOLIO_TOTAL: 1}
+    assert snapshot["BTC"][PORTFOLIO_TOTAL] == 10
+    assert "ETH" not in snapshot
+    assert deep_copy == _holdings()
+
+    snapshot.pop("USDT")
+    assert "USDT" in holdings
+    assert holdings["BTC"][PORTFOLIO_TOTAL] == 5
+
+
+def test_get_read_only_quantities():
+    holdings = PortfolioHoldings((PORTFOLIO_AVAILABLE, MARGIN_PORTFOLIO, PORTFOLIO_TOTAL), holdings={
+        "BTC": {PORTFOLIO_AVAILABLE: 10, PORTFOLIO_TOTAL: 10},
+        "USDT": {PORTFOLIO_AVAILABLE: 500, MARGIN_PORTFOLIO: 100, PORTFOLIO_TOTAL: 1000}
+    })
+    currencies, quantities = holdings.get_read_only_quantities()
+    assert currencies == ("BTC", "USDT")
+    assert quantities.tolist() == [[10, 0, 10], [500, 100, 1000]]
+    with pytest.raises(ValueError):
+        quantities[0, 0] = 1
+
+    holdings["BTC"][PORTFOLIO_TOTAL] = 1
+    assert quantities[0, 2] == 10
+
+    holdings.pop("BTC")
+    currencies, quantities = holdings.get_read_only_quantities()
+    assert currencies == ("USDT",)
+    assert quantities.tolist() == [[500, 100, 1000]]
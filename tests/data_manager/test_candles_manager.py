@@ -14,6 +14,7 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import numpy as np
+import pytest
 
 from octobot_commons.enums import PriceIndexes
 from octobot_trading.data_manager.candles_manager import CandlesManager
@@ -22,18 +23,18 @@ from octobot_trading.data_manager.candles_manager import CandlesManager
 def test_constructor():
     candles_manager = CandlesManager()
     assert candles_manager.candles_initialized is False
-    assert candles_manager.close_candles_index == 0
-    assert len(candles_manager.close_candles) == CandlesManager.MAX_CANDLES_COUNT
-    assert all(np.isnan(value) for value in candles_manager.close_candles)
+    assert candles_manager.candles_index == 0
+    assert len(candles_manager.candles) == 2 * CandlesManager.MAX_CANDLES_COUNT
+    assert np.isnan(candles_manager.candles).all()
 
 
 def test_add_new_candle():
     candles_manager = CandlesManager()
     candle = _gen_candles(1)[0]
     candles_manager.add_new_candle(candle)
-    assert candles_manager.close_candles_index == 1
-    assert len(candles_manager.close_candles) == CandlesManager.MAX_CANDLES_COUNT
-    assert candles_manager.close_candles[0] == candle[PriceIndexes.IND_PRICE_CLOSE.value]
+    assert candles_manager.candles_index == 1
+    assert len(candles_manager.candles) == 2 * CandlesManager.MAX_CANDLES_COUNT
+    assert _stored_close(candles_manager, 0) == candle[PriceIndexes.IND_PRICE_CLOSE.value]
 
 
 def test_add_old_and_new_candles():
@@ -43,30 +44,96 @@ def test_add_old_and_new_candles():
     single_candle = _gen_candles(1)
     candles_manager.add_old_and_new_candles(single_candle)
     assert candles_manager.reached_max is False
-    assert candles_manager.close_candles_index == 1
-    assert len(candles_manager.close_candles) == CandlesManager.MAX_CANDLES_COUNT
-    assert candles_manager.close_candles[0] == single_candle[0][PriceIndexes.IND_PRICE_CLOSE.value]
+    assert candles_manager.candles_index == 1
+    assert len(candles_manager.candles) == 2 * CandlesManager.MAX_CANDLES_COUNT
+    assert _stored_close(candles_manager, 0) == single_candle[0][PriceIndexes.IND_PRICE_CLOSE.value]
 
     # with many candles including first one
     many_candles = _gen_candles(10)
     candles_manager.add_old_and_new_candles(many_candles)
     assert candles_manager.reached_max is False
-    assert candles_manager.close_candles_index == 10
-    assert len(candles_manager.close_candles) == CandlesManager.MAX_CANDLES_COUNT
-    assert candles_manager.close_candles[0] == many_candles[0][PriceIndexes.IND_PRICE_CLOSE.value]
-    assert candles_manager.close_candles[9] == many_candles[9][PriceIndexes.IND_PRICE_CLOSE.value]
+    assert candles_manager.candles_index == 10
+    assert len(candles_manager.candles) == 2 * CandlesManager.MAX_CANDLES_COUNT
+    assert _stored_close(candles_manager, 0) == many_candles[0][PriceIndexes.IND_PRICE_CLOSE.value]
+    assert _stored_close(candles_manager, 9) == many_candles[9][PriceIndexes.IND_PRICE_CLOSE.value]
+
+
+def test_add_old_and_new_candles_with_missing_old_candles():
+    candles_manager = CandlesManager()
+    many_candles = _gen_candles(10)
+    candles_manager.add_old_and_new_candles(many_candles[::2])
+    assert candles_manager.candles_index == 5
+
+    # missing old candles are inserted at their position
+    candles_manager.add_old_and_new_candles(many_candles)
+    assert candles_manager.candles_index == 10
+    assert np.array_equal(candles_manager.get_symbol_time_candles(),
+                          np.array([candle[PriceIndexes.IND_PRICE_TIME.value] for candle in many_candles]))
+    assert np.array_equal(candles_manager.get_symbol_close_candles(),
+                          np.array([candle[PriceIndexes.IND_PRICE_CLOSE.value] for candle in many_candles]))
+
+
+def test_add_old_candle_when_reached_max():
+    candles_manager = CandlesManager()
+    all_candles = _gen_candles(candles_manager.MAX_CANDLES_COUNT + 10)
+    missing_candle = all_candles.pop(candles_manager.MAX_CANDLES_COUNT)
+    candles_manager.add_old_and_new_candles(all_candles)
+    assert candles_manager.reached_max is True
+
+    # older than the oldest stored candle: ignored
+    candles_manager.add_new_candle(_get_candle(1))
+    assert candles_manager.get_symbol_time_candles()[0] == all_candles[9][PriceIndexes.IND_PRICE_TIME.value]
+
+    # inserted at its position, oldest candle is dropped
+    candles_manager.add_new_candle(missing_candle)
+    expected_candles = sorted(all_candles + [missing_candle])[-candles_manager.MAX_CANDLES_COUNT:]
+    assert np.array_equal(candles_manager.get_symbol_time_candles(),
+                          np.array([candle[PriceIndexes.IND_PRICE_TIME.value] for candle in expected_candles]))
+    assert np.array_equal(candles_manager.get_symbol_volume_candles(3),
+                          np.array([candle[PriceIndexes.IND_PRICE_VOL.value] for candle in expected_candles[-3:]]))
+
+    # still works as a ring buffer afterwards
+    new_candle = _get_candle(candles_manager.MAX_CANDLES_COUNT + 11)
+    candles_manager.add_new_candle(new_candle)
+    assert np.array_equal(candles_manager.get_symbol_time_candles(),
+                          np.array([candle[PriceIndexes.IND_PRICE_TIME.value]
+                                    for candle in expected_candles[1:] + [new_candle]]))
 
 
 def test_replace_all_candles():
     candles_manager = CandlesManager()
     many_candles = _gen_candles(20)[10:]
     candles_manager.add_old_and_new_candles(many_candles)
-    assert candles_manager.close_candles[0] == many_candles[0][PriceIndexes.IND_PRICE_CLOSE.value]
-    assert candles_manager.close_candles[9] == many_candles[9][PriceIndexes.IND_PRICE_CLOSE.value]
+    assert _stored_close(candles_manager, 0) == many_candles[0][PriceIndexes.IND_PRICE_CLOSE.value]
+    assert _stored_close(candles_manager, 9) == many_candles[9][PriceIndexes.IND_PRICE_CLOSE.value]
     new_candles = _gen_candles(10)
     candles_manager.replace_all_candles(new_candles)
-    assert candles_manager.close_candles[0] == new_candles[0][PriceIndexes.IND_PRICE_CLOSE.value]
-    assert candles_manager.close_candles[9] == new_candles[9][PriceIndexes.IND_PRICE_CLOSE.value]
+    assert _stored_close(candles_manager, 0) == new_candles[0][PriceIndexes.IND_PRICE_CLOSE.value]
+    assert _stored_close(candles_manager, 9) == new_candles[9][PriceIndexes.IND_PRICE_CLOSE.value]
+
+
+def test_replace_all_candles_with_unordered_duplicated_candles():
+    candles_manager = CandlesManager(max_candles_count=5)
+    all_candles = _gen_candles(8)
+    candles_manager.replace_all_candles(all_candles[::-1] + all_candles[5:])
+    assert candles_manager.candles_index == 5
+    assert candles_manager.reached_max is True
+    assert np.array_equal(candles_manager.get_symbol_time_candles(),
+                          np.array([candle[PriceIndexes.IND_PRICE_TIME.value] for candle in all_candles[3:]]))
+    assert np.array_equal(candles_manager.get_symbol_close_candles(),
+                          np.array([candle[PriceIndexes.IND_PRICE_CLOSE.value] for candle in all_candles[3:]]))
+
+    # loaded candles are known candles
+    candles_manager.add_new_candle(all_candles[-1])
+    assert np.array_equal(candles_manager.get_symbol_time_candles(),
+                          np.array([candle[PriceIndexes.IND_PRICE_TIME.value] for candle in all_candles[3:]]))
+
+    # ring buffer is usable after loading
+    new_candle = _get_candle(9)
+    candles_manager.add_new_candle(new_candle)
+    assert np.array_equal(candles_manager.get_symbol_time_candles(),
+                          np.array([candle[PriceIndexes.IND_PRICE_TIME.value]
+                                    for candle in all_candles[4:] + [new_candle]]))
 
 
 def test_get_symbol_prices():
@@ -111,6 +178,52 @@ def test_get_symbol_candles_data():
     _test_data(candles_manager.get_symbol_time_candles(), 2, new_candles[-1][PriceIndexes.IND_PRICE_TIME.value])
 
 
+def test_get_symbol_candles_view_and_copy():
+    candles_manager = CandlesManager()
+    candles_manager.add_old_and_new_candles(_gen_candles(5))
+
+    close_candles_view = candles_manager.get_symbol_close_candles(3)
+    assert close_candles_view.flags.writeable is False
+    with pytest.raises(ValueError):
+        close_candles_view[0] = 0
+
+    close_candles_copy = candles_manager.get_symbol_close_candles(3, copy=True)
+    assert close_candles_copy.flags.writeable is True
+    assert np.array_equal(close_candles_view, close_candles_copy)
+    close_candles_copy[0] = 0
+    assert candles_manager.get_symbol_close_candles(3)[0] == _get_candle(3)[PriceIndexes.IND_PRICE_CLOSE.value]
+
+    assert all(not candles.flags.writeable for candles in candles_manager.get_symbol_prices().values())
+    assert all(candles.flags.writeable for candles in candles_manager.get_symbol_prices(copy=True).values())
+
+
+def test_get_symbol_candles_with_in_construction():
+    candles_manager = CandlesManager(max_candles_count=5)
+    close_index = PriceIndexes.IND_PRICE_CLOSE.value
+    assert len(candles_manager.get_symbol_candles_with_in_construction(close_index, _get_candle(1))) == 0
+
+    all_candles = _gen_candles(8)
+    candles_manager.add_old_and_new_candles(all_candles[:3])
+    in_construction_candle = all_candles[3]
+    assert np.array_equal(candles_manager.get_symbol_candles_with_in_construction(close_index, in_construction_candle),
+                          np.array([candle[close_index] for candle in all_candles[1:4]]))
+    assert np.array_equal(candles_manager.get_symbol_candles_with_in_construction(close_index,
+                                                                                  in_construction_candle, 2),
+                          np.array([candle[close_index] for candle in all_candles[2:4]]))
+    # stored candles are not changed
+    assert np.array_equal(candles_manager.get_symbol_close_candles(),
+                          np.array([candle[close_index] for candle in all_candles[:3]]))
+
+    # when max candles count is reached
+    candles_manager.add_old_and_new_candles(all_candles[:7])
+    in_construction_candle = all_candles[7]
+    candles_view = candles_manager.get_symbol_candles_with_in_construction(close_index, in_construction_candle)
+    assert candles_view.flags.writeable is False
+    assert np.array_equal(candles_view, np.array([candle[close_index] for candle in all_candles[3:]]))
+    assert np.array_equal(candles_manager.get_symbol_close_candles(),
+                          np.array([candle[close_index] for candle in all_candles[2:7]]))
+
+
 def test_reach_max_candles_count():
     candles_manager = CandlesManager()
     all_candles = _gen_candles(candles_manager.MAX_CANDLES_COUNT + 3)
@@ -122,12 +235,31 @@ def test_reach_max_candles_count():
     assert candles_manager.reached_max is True
     _test_data(candles_manager.get_symbol_close_candles(), candles_manager.MAX_CANDLES_COUNT,
                max_candles[-1][PriceIndexes.IND_PRICE_CLOSE.value])
-    assert candles_manager.close_candles_index == candles_manager.MAX_CANDLES_COUNT - 1
+    assert candles_manager.candles_index == candles_manager.MAX_CANDLES_COUNT
 
     # should remove oldest (first) candles and insert new ones instead
     candles_manager.add_old_and_new_candles(other_candles)
     _test_data(candles_manager.get_symbol_close_candles(), candles_manager.MAX_CANDLES_COUNT,
                other_candles[-1][PriceIndexes.IND_PRICE_CLOSE.value])
+    assert candles_manager.candles_index == candles_manager.MAX_CANDLES_COUNT
+    assert np.array_equal(candles_manager.get_symbol_time_candles(),
+                          np.array([candle[PriceIndexes.IND_PRICE_TIME.value] for candle in all_candles[3:]]))
+    assert np.array_equal(candles_manager.get_symbol_close_candles(5),
+                          np.array([candle[PriceIndexes.IND_PRICE_CLOSE.value] for candle in all_candles[-5:]]))
+
+
+def test_max_candles_count():
+    candles_manager = CandlesManager(max_candles_count=5)
+    assert len(candles_manager.candles) == 2 * 5
+    all_candles = _gen_candles(8)
+    candles_manager.add_old_and_new_candles(all_candles)
+    assert candles_manager.reached_max is True
+    assert np.array_equal(candles_manager.get_symbol_time_candles(),
+                          np.array([candle[PriceIndexes.IND_PRICE_TIME.value] for candle in all_candles[3:]]))
+
+
+def _stored_close(candles_manager, index):
+    return candles_manager.candles[index, PriceIndexes.IND_PRICE_CLOSE.value]
 
 
 def _test_data(candles_data, expected_len, expected_last_val):
@@ -0,0 +1,69 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+import pytest
+
+from octobot_commons.enums import PriceIndexes
+from octobot_trading.data_manager.kline_manager import KlineManager
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+async def test_kline_update():
+    kline_manager = KlineManager()
+    await kline_manager.initialize()
+    assert np.isnan(kline_manager.kline).all()
+    kline_buffer = kline_manager.kline
+
+    kline_manager.kline_update(_get_kline(1, close=10, high=11, low=9))
+    assert np.array_equal(kline_manager.kline, np.array(_get_kline(1, close=10, high=11, low=9)))
+
+    # same candle: open, time and volume are kept, close is updated and high and low are extended
+    kline_manager.kline_update(_get_kline(1, close=12, high=13, low=10, open_price=2, volume=200))
+    assert np.array_equal(kline_manager.kline, np.array(_get_kline(1, close=12, high=13, low=9)))
+    kline_manager.kline_update(_get_kline(1, close=8, high=12, low=7))
+    assert np.array_equal(kline_manager.kline, np.array(_get_kline(1, close=8, high=13, low=7)))
+
+    # new candle
+    kline_manager.kline_update(_get_kline(2, close=20, high=21, low=19))
+    assert np.array_equal(kline_manager.kline, np.array(_get_kline(2, close=20, high=21, low=19)))
+
+    # kline is updated in place
+    assert kline_manager.kline is kline_buffer
+
+
+async def test_kline_update_with_nan_values():
+    kline_manager = KlineManager()
+    await kline_manager.initialize()
+    kline_manager.kline_update(_get_kline(1, close=10, high=float("nan"), low=float("nan"), open_price=float("nan")))
+    kline_manager.kline_update(_get_kline(1, close=12, high=13, low=9, open_price=11))
+    assert np.array_equal(kline_manager.kline, np.array(_get_kline(1, close=12, high=13, low=9, open_price=11)))
+
+    # nan values are ignored for high and low
+    kline_manager.kline_update(_get_kline(1, close=12, high=float("nan"), low=float("nan")))
+    assert np.array_equal(kline_manager.kline, np.array(_get_kline(1, close=12, high=13, low=9, open_price=11)))
+
+
+def _get_kline(time, close, high, low, open_price=1, volume=100):
+    kline = [0] * len(PriceIndexes)
+    kline[PriceIndexes.IND_PRICE_TIME.value] = time
+    kline[PriceIndexes.IND_PRICE_OPEN.value] = open_price
+    kline[PriceIndexes.IND_PRICE_HIGH.value] = high
+    kline[PriceIndexes.IND_PRICE_LOW.value] = low
+    kline[PriceIndexes.IND_PRICE_CLOSE.value] = close
+    kline[PriceIndexes.IND_PRICE_VOL.value] = volume
+    return kline
@@ -0,0 +1,83 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import pytest
+
+from octobot_trading.data_manager.order_book_manager import OrderBookManager
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+async def order_book_manager():
+    manager = OrderBookManager()
+    await manager.initialize()
+    manager.order_book_update(asks=[[102, 2], [101, 1], [103, 3]], bids=[[99, 1], [100, 2], [98, 3]])
+    return manager
+
+
+async def test_order_book_update(order_book_manager):
+    assert order_book_manager.order_book_initialized is True
+    assert order_book_manager.get_asks() == [[101, 1], [102, 2], [103, 3]]
+    assert order_book_manager.get_bids() == [[100, 2], [99, 1], [98, 3]]
+    assert order_book_manager.get_asks(2) == [[101, 1], [102, 2]]
+    assert order_book_manager.get_bids(2) == [[100, 2], [99, 1]]
+    assert order_book_manager.get_best_ask() == [101, 1]
+    assert order_book_manager.get_best_bid() == [100, 2]
+    assert order_book_manager.asks == order_book_manager.get_asks()
+    assert order_book_manager.bids == order_book_manager.get_bids()
+
+    # only replaces given sides
+    order_book_manager.order_book_update(asks=[[105, 1]], bids=[])
+    assert order_book_manager.get_asks() == [[105, 1]]
+    assert order_book_manager.get_bids() == [[100, 2], [99, 1], [98, 3]]
+
+    order_book_manager.reset_order_book()
+    assert order_book_manager.order_book_initialized is False
+    assert order_book_manager.get_asks() == order_book_manager.get_bids() == []
+    assert order_book_manager.get_best_ask() is order_book_manager.get_best_bid() is None
+
+
+async def test_order_book_delta_update(order_book_manager):
+    order_book_manager.order_book_delta_update(asks=[[101, 0], [102, 5], [101.5, 1]], bids=[[100.5, 4], [98, 0]])
+    assert order_book_manager.get_asks() == [[101.5, 1], [102, 5], [103, 3]]
+    assert order_book_manager.get_bids() == [[100.5, 4], [100, 2], [99, 1]]
+    assert order_book_manager.get_best_ask() == [101.5, 1]
+    assert order_book_manager.get_best_bid() == [100.5, 4]
+
+    # removing unknown price level
+    order_book_manager.order_book_delta_update(asks=[[200, 0]], bids=[])
+    assert order_book_manager.get_asks() == [[101.5, 1], [102, 5], [103, 3]]
+
+
+async def test_get_quantities(order_book_manager):
+    assert order_book_manager.get_ask_quantity(102) == 2
+    assert order_book_manager.get_ask_quantity(100) == 0
+    assert order_book_manager.get_bid_quantity(98) == 3
+
+    assert order_book_manager.get_asks_cumulative_quantity(100) == 0
+    assert order_book_manager.get_asks_cumulative_quantity(101) == 1
+    assert order_book_manager.get_asks_cumulative_quantity(102.5) == 3
+    assert order_book_manager.get_asks_cumulative_quantity(1000) == 6
+    assert order_book_manager.get_bids_cumulative_quantity(101) == 0
+    assert order_book_manager.get_bids_cumulative_quantity(100) == 2
+    assert order_book_manager.get_bids_cumulative_quantity(98.5) == 3
+    assert order_book_manager.get_bids_cumulative_quantity(0) == 6
+
+    # cumulative quantities are updated with deltas
+    order_book_manager.order_book_delta_update(asks=[[101, 4]], bids=[[99, 0]])
+    assert order_book_manager.get_asks_cumulative_quantity(102.5) == 6
+    assert order_book_manager.get_bids_cumulative_quantity(98.5) == 2
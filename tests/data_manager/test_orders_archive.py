@@ -0,0 +1,53 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+from octobot_trading.data_manager.orders_archive import OrdersArchive
+from octobot_trading.enums import ExchangeConstantsOrderColumns as ECOC, FeePropertyColumns, OrderStatus, \
+    TradeOrderSide, TradeOrderType
+
+
+def _order_dict(order_id, symbol, timestamp, fee=None):
+    return {
+        ECOC.ID.value: order_id,
+        ECOC.SYMBOL.value: symbol,
+        ECOC.PRICE.value: 10.5,
+        ECOC.STATUS.value: OrderStatus.FILLED.value,
+        ECOC.TIMESTAMP.value: timestamp,
+        ECOC.TYPE.value: TradeOrderType.LIMIT.value,
+        ECOC.SIDE.value: TradeOrderSide.BUY.value,
+        ECOC.AMOUNT.value: 2,
+        ECOC.COST.value: 21,
+        ECOC.FILLED.value: 2,
+        ECOC.FEE.value: fee
+    }
+
+
+def test_add_and_get_orders():
+    archive = OrdersArchive()
+    fee = {FeePropertyColumns.COST.value: 0.1, FeePropertyColumns.CURRENCY.value: "BTC"}
+    archived_orders = [_order_dict(str(i), "BTC/USDT" if i % 2 else "ETH/USDT", i, fee=fee if i % 3 else None)
+                       for i in range(OrdersArchive.INITIAL_CAPACITY + 10)]
+    for order_dict in archived_orders:
+        archive.add_order(order_dict)
+
+    assert archive.orders_count == len(archived_orders)
+    assert archive.get_orders() == archived_orders
+    assert archive.get_orders(symbol="BTC/USDT") == archived_orders[1::2]
+    assert archive.get_orders(symbol="XRP/USDT") == []
+    assert archive.get_orders(since=3) == archived_orders[:3]
+    assert archive.get_orders(symbol="ETH/USDT", since=10, limit=2) == archived_orders[0:4:2]
+
+    archive.clear()
+    assert archive.get_orders() == []
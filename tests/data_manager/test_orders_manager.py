@@ -0,0 +1,181 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import pytest
+
+from octobot_trading.data_manager.orders_manager import OrdersManager
+from octobot_trading.enums import OrderStatus, TraderOrderType, ExchangeConstantsOrderColumns as ECOC
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+class _IndexedOrder:
+    def __init__(self, order_id, symbol, status=OrderStatus.OPEN, timestamp=0,
+                 order_type=TraderOrderType.BUY_MARKET, origin_price=0, simulated=True):
+        self.order_id = order_id
+        self.symbol = symbol
+        self.status = status
+        self.timestamp = timestamp
+        self.order_type = order_type
+        self.origin_price = origin_price
+        self.simulated = simulated
+
+    def to_dict(self):
+        return {
+            ECOC.ID.value: self.order_id,
+            ECOC.SYMBOL.value: self.symbol,
+            ECOC.STATUS.value: self.status.value,
+            ECOC.TIMESTAMP.value: self.timestamp
+        }
+
+    def clear(self):
+        pass
+
+
+def _get_ids(order_dicts):
+    return [order_dict[ECOC.ID.value] for order_dict in order_dicts]
+
+
+@pytest.fixture()
+async def orders_manager():
+    manager = OrdersManager({}, None, None)
+    await manager.initialize()
+    return manager
+
+
+async def test_select_orders_by_symbol_and_status(orders_manager):
+    btc_order_1 = _IndexedOrder("1", "BTC/USDT")
+    eth_order = _IndexedOrder("2", "ETH/USDT")
+    btc_order_2 = _IndexedOrder("3", "BTC/USDT", status=OrderStatus.CLOSED)
+    for order in (btc_order_1, eth_order, btc_order_2):
+        assert orders_manager.upsert_order_instance(order)
+
+    assert orders_manager.get_all_orders() == [btc_order_1, eth_order, btc_order_2]
+    assert orders_manager.get_all_orders(symbol="BTC/USDT") == [btc_order_1, btc_order_2]
+    assert orders_manager.get_open_orders() == [btc_order_1, eth_order]
+    assert orders_manager.get_open_orders(symbol="BTC/USDT") == [btc_order_1]
+    assert orders_manager.get_open_orders(symbol="XRP/USDT") == []
+    assert orders_manager.get_closed_orders(symbol="BTC/USDT") == [btc_order_2]
+    assert orders_manager.get_open_orders(limit=1) == [btc_order_1]
+
+
+async def test_select_orders_after_status_transition(orders_manager):
+    order = _IndexedOrder("1", "BTC/USDT")
+    other_order = _IndexedOrder("2", "BTC/USDT")
+    orders_manager.upsert_order_instance(order)
+    orders_manager.upsert_order_instance(other_order)
+
+    # status directly changed on the order instance
+    order.status = OrderStatus.CANCELED
+    assert orders_manager.get_open_orders(symbol="BTC/USDT") == [other_order]
+    assert orders_manager.get_all_orders(symbol="BTC/USDT") == [order, other_order]
+    assert orders_manager.get_closed_orders(symbol="BTC/USDT") == []
+
+    order.status = OrderStatus.CLOSED
+    assert orders_manager.get_closed_orders(symbol="BTC/USDT") == [order]
+
+    order.status = OrderStatus.OPEN
+    orders_manager.update_order_index(order)
+    assert orders_manager.get_open_orders() == [other_order, order]
+    assert orders_manager.get_closed_orders() == []
+
+
+async def test_indexes_after_removals(orders_manager):
+    orders = [_IndexedOrder(str(i), "BTC/USDT" if i % 2 else "ETH/USDT") for i in range(6)]
+    for order in orders:
+        orders_manager.upsert_order_instance(order)
+
+    orders_manager.remove_order_instance(orders[1])
+    assert orders_manager.get_open_orders(symbol="BTC/USDT") == [orders[3], orders[5]]
+    # removed orders are archived
+    assert _get_ids(orders_manager.get_archived_orders()) == ["1"]
+
+    orders_manager.clear()
+    assert orders_manager.get_open_orders() == []
+    assert orders_manager.get_all_orders(symbol="BTC/USDT") == []
+
+
+async def test_archive_closed_orders(orders_manager):
+    orders_manager.MAX_ORDERS_COUNT = 4
+    orders = [_IndexedOrder(str(i), "BTC/USDT" if i % 2 else "ETH/USDT", timestamp=i) for i in range(5)]
+    orders[1].status = OrderStatus.FILLED
+    orders[2].status = OrderStatus.CANCELED
+    for order in orders:
+        orders_manager.upsert_order_instance(order)
+
+    # the oldest closed orders are archived
+    assert orders_manager.get_all_orders() == [orders[0], orders[3], orders[4]]
+    assert orders_manager.get_all_orders(symbol="ETH/USDT") == [orders[0], orders[4]]
+    archived_orders = orders_manager.get_archived_orders()
+    assert _get_ids(archived_orders) == ["1", "2"]
+    assert archived_orders[0][ECOC.STATUS.value] == OrderStatus.FILLED.value
+    assert archived_orders[1][ECOC.STATUS.value] == OrderStatus.CANCELED.value
+    assert _get_ids(orders_manager.get_archived_orders(symbol="BTC/USDT")) == ["1"]
+    assert _get_ids(orders_manager.get_archived_orders(since=2)) == ["1"]
+    assert _get_ids(orders_manager.get_archived_orders(limit=1)) == ["1"]
+    assert orders_manager.get_closed_orders() == []
+
+    # open orders are never removed
+    new_orders = [_IndexedOrder(str(i), "BTC/USDT", timestamp=i) for i in range(5, 8)]
+    for order in new_orders:
+        orders_manager.upsert_order_instance(order)
+    assert orders_manager.get_open_orders() == [orders[0], orders[3], orders[4]] + new_orders
+
+    # stored closed orders are not archived until they are removed
+    orders[3].status = OrderStatus.CLOSED
+    assert orders_manager.get_closed_orders() == [orders[3]]
+    orders_manager.remove_order_instance(orders[3])
+    assert _get_ids(orders_manager.get_archived_orders()) == ["1", "2", "3"]
+    assert orders_manager.get_closed_orders() == []
+
+    orders_manager.clear()
+    assert orders_manager.get_archived_orders() == []
+
+
+async def test_get_orders_to_update(orders_manager):
+    buy_limits = [_IndexedOrder(f"b{price}", "BTC/USDT", order_type=TraderOrderType.BUY_LIMIT, origin_price=price)
+                  for price in (90, 95, 99)]
+    sell_limits = [_IndexedOrder(f"s{price}", "BTC/USDT", order_type=TraderOrderType.SELL_LIMIT, origin_price=price)
+                   for price in (101, 105, 110)]
+    stop_losses = [_IndexedOrder(f"sl{price}", "BTC/USDT", order_type=TraderOrderType.STOP_LOSS, origin_price=price)
+                   for price in (80, 85, 96)]
+    market_order = _IndexedOrder("m", "BTC/USDT")
+    real_buy_limit = _IndexedOrder("rb", "BTC/USDT", order_type=TraderOrderType.BUY_LIMIT, origin_price=50,
+                                   simulated=False)
+    for order in buy_limits + sell_limits + stop_losses + [market_order, real_buy_limit]:
+        orders_manager.upsert_order_instance(order)
+
+    # not indexed orders are always selected
+    assert orders_manager.get_orders_to_update("BTC/USDT", 100, 100) == [market_order, real_buy_limit]
+    assert orders_manager.get_orders_to_update("ETH/USDT", 100, 100) == []
+
+    # crossed orders are selected: best price first
+    assert orders_manager.get_orders_to_update("BTC/USDT", 94, 106) == \
+        [market_order, real_buy_limit, buy_limits[2], buy_limits[1], sell_limits[0], sell_limits[1], stop_losses[2]]
+    # triggered orders stay indexed until they are removed
+    assert orders_manager.get_orders_to_update("BTC/USDT", 84, 100) == \
+        [market_order, real_buy_limit, buy_limits[2], buy_limits[1], buy_limits[0], stop_losses[2], stop_losses[1]]
+
+    market_order.status = OrderStatus.FILLED
+    orders_manager.remove_order_instance(real_buy_limit)
+    orders_manager.remove_order_instance(buy_limits[2])
+    orders_manager.remove_order_instance(stop_losses[2])
+    assert orders_manager.get_orders_to_update("BTC/USDT", 94, 100) == [buy_limits[1]]
+
+    # updated price
+    sell_limits[2].origin_price = 102
+    orders_manager.update_order_index(sell_limits[2])
+    assert orders_manager.get_orders_to_update("BTC/USDT", 100, 103) == [sell_limits[0], sell_limits[2]]
@@ -0,0 +1,85 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import pytest
+
+from octobot_trading.data_manager.prices_manager import PricesManager
+from octobot_trading.enums import MarkPriceFormulas, ExchangeConstantsOrderColumns as ECOC
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+def _recent_trades(*prices_and_amounts):
+    return [{ECOC.PRICE.value: price, ECOC.AMOUNT.value: amount} for price, amount in prices_and_amounts]
+
+
+async def test_update_mark_price_from_recent_trades_mean():
+    prices_manager = PricesManager()
+    await prices_manager.initialize()
+    assert prices_manager.update_mark_price_from_recent_trades([]) is None
+    assert prices_manager.update_mark_price_from_recent_trades(_recent_trades((10, 1), (20, 3))) == 15
+    assert prices_manager.update_mark_price_from_recent_trades(_recent_trades((30, 1))) == 20
+    assert prices_manager.update_mark_price_from_order_book_ticker(11, 9) is None
+
+
+async def test_update_mark_price_from_recent_trades_mean_window():
+    prices_manager = PricesManager()
+    await prices_manager.initialize()
+    window_size = PricesManager.MARK_PRICE_WINDOW_SIZE
+    prices_manager.update_mark_price_from_recent_trades(_recent_trades(*((1, 1),) * window_size))
+    assert prices_manager.update_mark_price_from_recent_trades(
+        _recent_trades(*((3, 1),) * (window_size // 2))) == 2
+
+
+async def test_update_mark_price_from_recent_trades_window_sums_drift():
+    prices_manager = PricesManager(MarkPriceFormulas.VWAP)
+    await prices_manager.initialize()
+    window_size = PricesManager.MARK_PRICE_WINDOW_SIZE
+    prices_manager.update_mark_price_from_recent_trades(_recent_trades(*((1e16, 1e16),) * window_size))
+    # running sums are recomputed once the whole window has been replaced: large evicted values leave no error
+    assert prices_manager.update_mark_price_from_recent_trades(_recent_trades(*((0.1, 0.1),) * window_size)) == \
+        pytest.approx(0.1)
+    prices_manager.set_mark_price_formula(MarkPriceFormulas.MEAN)
+    assert prices_manager.update_mark_price_from_recent_trades([]) == pytest.approx(0.1)
+
+
+async def test_update_mark_price_from_recent_trades_vwap():
+    prices_manager = PricesManager(MarkPriceFormulas.VWAP)
+    await prices_manager.initialize()
+    assert prices_manager.update_mark_price_from_recent_trades(_recent_trades((10, 1), (20, 3))) == 17.5
+    # without volume, fallback to mean
+    prices_manager = PricesManager(MarkPriceFormulas.VWAP)
+    await prices_manager.initialize()
+    assert prices_manager.update_mark_price_from_recent_trades(_recent_trades((10, 0), (20, 0))) == 15
+
+
+async def test_update_mark_price_from_recent_trades_ema():
+    prices_manager = PricesManager(MarkPriceFormulas.EMA)
+    await prices_manager.initialize()
+    assert prices_manager.update_mark_price_from_recent_trades(_recent_trades((10, 1))) == 10
+    alpha = 2 / (PricesManager.MARK_PRICE_EMA_PERIOD + 1)
+    assert prices_manager.update_mark_price_from_recent_trades(_recent_trades((20, 1))) == \
+        pytest.approx(10 + alpha * 10)
+
+
+async def test_update_mark_price_from_order_book_ticker():
+    prices_manager = PricesManager(MarkPriceFormulas.MID_PRICE)
+    await prices_manager.initialize()
+    assert prices_manager.update_mark_price_from_recent_trades(_recent_trades((10, 1))) is None
+    assert prices_manager.update_mark_price_from_order_book_ticker(11, 9) == 10
+    assert prices_manager.update_mark_price_from_order_book_ticker(None, 9) is None
+    prices_manager.set_mark_price_formula(MarkPriceFormulas.MEAN)
+    assert prices_manager.update_mark_price_from_recent_trades(_recent_trades((20, 1))) == 15
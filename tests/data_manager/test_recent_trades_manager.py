@@ -0,0 +1,89 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+from collections import deque
+
+import pytest
+
+from octobot_trading.data_manager.prices_manager import PricesManager
+from octobot_trading.data_manager.recent_trades_manager import RecentTradesManager
+from octobot_trading.enums import ExchangeConstantsOrderColumns as ECOC
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+def _recent_trade(timestamp, price=10, amount=1, trade_id=None):
+    recent_trade = {ECOC.TIMESTAMP.value: timestamp, ECOC.PRICE.value: price, ECOC.AMOUNT.value: amount}
+    if trade_id is not None:
+        recent_trade[ECOC.ID.value] = trade_id
+    return recent_trade
+
+
+@pytest.fixture()
+async def recent_trades_manager():
+    manager = RecentTradesManager()
+    await manager.initialize()
+    return manager
+
+
+async def test_add_new_trades_deduplication(recent_trades_manager):
+    first_trades = [_recent_trade(1, trade_id="a"), _recent_trade(2), _recent_trade(2, price=11)]
+    assert recent_trades_manager.add_new_trades(first_trades) == first_trades
+
+    # same id with different values, same (timestamp, price, amount) and duplicate in the same batch
+    new_trade = _recent_trade(3, trade_id="b")
+    assert recent_trades_manager.add_new_trades([_recent_trade(5, trade_id="a"), _recent_trade(2),
+                                                 new_trade, dict(new_trade)]) == [new_trade]
+    assert recent_trades_manager.add_recent_trade(new_trade) == []
+    assert list(recent_trades_manager.recent_trades) == first_trades + [new_trade]
+
+
+async def test_deduplication_keys_are_bounded(recent_trades_manager):
+    max_count = RecentTradesManager.MAX_RECENT_TRADES_COUNT
+    recent_trades_manager.add_new_trades([_recent_trade(i, trade_id=str(i)) for i in range(max_count + 10)])
+    assert len(recent_trades_manager.recent_trades) == max_count
+    assert len(recent_trades_manager._recent_trades_keys) == max_count
+
+    # dropped recent trades can be added again
+    assert recent_trades_manager.add_recent_trade(_recent_trade(0, trade_id="0")) == [_recent_trade(0, trade_id="0")]
+    assert recent_trades_manager.add_recent_trade(_recent_trade(50, trade_id="50")) == []
+
+
+async def test_set_all_recent_trades(recent_trades_manager):
+    recent_trades_manager.add_new_trades([_recent_trade(0, trade_id="0")])
+    recent_trades = [_recent_trade(1, trade_id="1"), _recent_trade(2), _recent_trade(1, trade_id="1")]
+    assert recent_trades_manager.set_all_recent_trades(recent_trades) == recent_trades[:2]
+    assert list(recent_trades_manager.recent_trades) == recent_trades[:2]
+    assert isinstance(recent_trades_manager.recent_trades, deque)
+    assert recent_trades_manager.recent_trades.maxlen == RecentTradesManager.MAX_RECENT_TRADES_COUNT
+    assert recent_trades_manager.add_recent_trade(_recent_trade(0, trade_id="0")) == [_recent_trade(0, trade_id="0")]
+
+
+async def test_set_same_recent_trades_snapshot_twice(recent_trades_manager):
+    prices_manager = PricesManager()
+    recent_trades = [_recent_trade(1, price=10, trade_id="1"), _recent_trade(2, price=20, trade_id="2")]
+    new_recent_trades = recent_trades_manager.set_all_recent_trades(recent_trades)
+    assert new_recent_trades == recent_trades
+    assert prices_manager.update_mark_price_from_recent_trades(new_recent_trades) == 15
+
+    # already counted recent trades are not given again
+    assert recent_trades_manager.set_all_recent_trades(list(recent_trades)) == []
+    assert list(recent_trades_manager.recent_trades) == recent_trades
+
+    recent_trades.append(_recent_trade(3, price=60, trade_id="3"))
+    new_recent_trades = recent_trades_manager.set_all_recent_trades(recent_trades)
+    assert new_recent_trades == recent_trades[2:]
+    assert prices_manager.update_mark_price_from_recent_trades(new_recent_trades) == 30
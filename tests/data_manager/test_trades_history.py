@@ -0,0 +1,85 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+
+from octobot_trading.data_manager.trades_history import TradesHistory
+from octobot_trading.enums import FeePropertyColumns, OrderStatus, TradeOrderSide
+
+
+class _RecordedTrade:
+    def __init__(self, trade_id, symbol, executed_time, fee_cost=None, fee_currency=None,
+                 status=OrderStatus.FILLED, side=TradeOrderSide.BUY):
+        self.trade_id = trade_id
+        self.symbol = symbol
+        self.executed_time = executed_time
+        self.canceled_time = 0
+        self.status = status
+        self.side = side
+        self.executed_price = 10
+        self.executed_quantity = 2
+        self.fee = None if fee_currency is None else {FeePropertyColumns.COST.value: fee_cost,
+                                                      FeePropertyColumns.CURRENCY.value: fee_currency}
+
+
+def test_add_trade_and_paid_fees():
+    trades_history = TradesHistory()
+    assert trades_history.get_total_paid_fees() == {}
+
+    trades = [_RecordedTrade(str(i), "BTC/USDT" if i % 2 else "ETH/USDT", i,
+                             fee_cost=0.5, fee_currency="BNB" if i % 3 else "USDT")
+              for i in range(TradesHistory.INITIAL_CAPACITY + 2)]
+    trades.append(_RecordedTrade("no_fee", "BTC/USDT", 5000, side=TradeOrderSide.SELL))
+    for trade in trades:
+        assert trades_history.add_trade(trade)
+    # already recorded
+    assert not trades_history.add_trade(trades[0])
+    assert trades_history.trades_count == len(trades)
+
+    bnb_trades_count = len([trade for trade in trades if trade.fee and trade.fee["currency"] == "BNB"])
+    assert trades_history.get_total_paid_fees() == {"BNB": 0.5 * bnb_trades_count,
+                                                    "USDT": 0.5 * (len(trades) - 1 - bnb_trades_count)}
+    assert trades_history.get_paid_fees(symbol="ETH/USDT", since=0, until=6) == {"BNB": 1, "USDT": 0.5}
+    assert trades_history.get_paid_fees(symbol="XRP/USDT") == {}
+
+
+def test_add_trades_without_id():
+    trades_history = TradesHistory()
+    assert trades_history.add_trade(_RecordedTrade(None, "BTC/USDT", 10, fee_cost=1, fee_currency="BNB"))
+    assert trades_history.add_trade(_RecordedTrade(None, "BTC/USDT", 20, fee_cost=2, fee_currency="BNB"))
+    assert trades_history.trades_count == 2
+    assert trades_history.get_total_paid_fees() == {"BNB": 3}
+
+
+def test_get_trades():
+    trades_history = TradesHistory()
+    trades_history.add_trade(_RecordedTrade("1", "BTC/USDT", 10, fee_cost=1, fee_currency="BTC"))
+    trades_history.add_trade(_RecordedTrade("2", "ETH/USDT", 20, side=TradeOrderSide.SELL))
+    trades_history.add_trade(_RecordedTrade("3", "BTC/USDT", 30, fee_cost=2, fee_currency="USDT"))
+
+    assert list(trades_history.get_trades_indexes(symbol="BTC/USDT")) == [0, 2]
+    assert list(trades_history.get_trades_indexes(since=20)) == [1, 2]
+    assert list(trades_history.get_trades_indexes(since=10, until=30)) == [0, 1]
+
+    trades = trades_history.get_trades(since=15)
+    assert list(trades[TradesHistory.TIMESTAMP]) == [20, 30]
+    assert list(trades[TradesHistory.SYMBOL]) == ["ETH/USDT", "BTC/USDT"]
+    assert list(trades[TradesHistory.SIDE]) == [TradeOrderSide.SELL.value, TradeOrderSide.BUY.value]
+    assert list(trades[TradesHistory.FEE_CURRENCY]) == [None, "USDT"]
+    assert np.isnan(trades[TradesHistory.FEE_COST][0])
+
+    trades_history.clear()
+    assert trades_history.trades_count == 0
+    assert trades_history.get_trades()[TradesHistory.PRICE].size == 0
@@ -17,6 +17,9 @@ import pytest
 
 from octobot_commons.tests.test_config import load_test_config
 from octobot_commons.constants import CONFIG_CRYPTO_CURRENCIES
+from octobot_commons.enums import TimeFrames
+from octobot_trading.constants import CONFIG_EXCHANGES, CONFIG_CANDLES_HISTORY_SIZE, CONFIG_CANDLES_MEMORY_BUDGET
+from octobot_trading.data_manager.candles_manager import CandlesManager
 from octobot_trading.exchanges.exchange_manager import ExchangeManager
 
 pytestmark = pytest.mark.asyncio
@@ -99,3 +102,29 @@ class TestExchangeConfig:
         assert "ETH/USDT" not in exchange_manager.exchange_config.traded_cryptocurrencies["Bitcoin"]
         assert "NEO/BNB" not in exchange_manager.exchange_config.traded_cryptocurrencies["Bitcoin"]
         await exchange_manager.stop()
+
+    async def test_candles_history_size(self):
+        config = load_test_config()
+        config[CONFIG_EXCHANGES][self.EXCHANGE_NAME][CONFIG_CANDLES_HISTORY_SIZE] = {
+            TimeFrames.ONE_MINUTE.value: 10000,
+            TimeFrames.ONE_DAY.value: 500
+        }
+        _, exchange_manager = await self.init_default(config=config)
+        exchange_config = exchange_manager.exchange_config
+        exchange_config.traded_time_frames = [TimeFrames.ONE_DAY, TimeFrames.ONE_HOUR, TimeFrames.ONE_MINUTE]
+        exchange_config.traded_symbol_pairs = ["BTC/USDT", "ETH/USDT"]
+        exchange_config.set_config_candles_history_size()
+
+        assert exchange_config.get_candles_history_size(TimeFrames.ONE_MINUTE) == 10000
+        assert exchange_config.get_candles_history_size(TimeFrames.ONE_DAY) == 500
+        assert exchange_config.get_candles_history_size(TimeFrames.ONE_HOUR) == CandlesManager.MAX_CANDLES_COUNT
+        assert exchange_config.get_candles_history_size(TimeFrames.ONE_WEEK) == CandlesManager.MAX_CANDLES_COUNT
+
+        # 2 pairs * (10000 + 500 + 1000) candles require more than 1MB: history sizes are reduced
+        config[CONFIG_EXCHANGES][self.EXCHANGE_NAME][CONFIG_CANDLES_MEMORY_BUDGET] = 1
+        exchange_config.set_config_candles_history_size()
+        assert exchange_config.get_candles_history_size(TimeFrames.ONE_MINUTE) < 10000
+        assert exchange_config.get_candles_history_size(TimeFrames.ONE_DAY) < 500
+        assert 2 * sum(CandlesManager.get_buffers_memory_size(exchange_config.get_candles_history_size(time_frame))
+                       for time_frame in exchange_config.traded_time_frames) <= 1024 * 1024
+        await exchange_manager.stop()